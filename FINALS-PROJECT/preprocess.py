@@ -1,72 +1,398 @@
 import pandas as pd
+import numpy as np
+import argparse
 import json
-import re
+import math
+import random
+import time
+from contextlib import contextmanager
 
-# Helper function to strip ₹ symbols and commas, converting to pure numbers
-def clean_number(x):
-    if pd.isna(x): 
-        return None
-    # Remove anything that isn't a digit or a decimal point
-    val = re.sub(r'[^\d.]', '', str(x))
-    return float(val) if val else None
+RAW_DATA_PATH = 'raw data/Amazon-Products.csv'
+OUTPUT_PATH = 'amazon_sample_3000.js'
+SAMPLE_SIZE = 3000
+SAMPLE_SEED = 42
+RESERVOIR_CHUNKSIZE = 100_000  # Rows per chunk when --reservoir is used without --chunksize
+
+# Stratum columns for --stratify; sub-categories are nested in their main category
+STRATA_COLUMNS = {
+    'main_category': ['main_category'],
+    'sub_category': ['main_category', 'sub_category'],
+}
+ALLOCATIONS = ['proportional', 'equal', 'minimum']
+MIN_PER_STRATUM = 10
+
+# The columns we keep (Including main_category and sub_category), in output order
+COLUMNS_TO_KEEP = [
+    'name', 'main_category', 'sub_category',
+    'ratings', 'no_of_ratings', 'discount_price', 'actual_price'
+]
+NUMERIC_COLUMNS = ['ratings', 'no_of_ratings', 'discount_price', 'actual_price']
+
+# Handle variations in column names from the raw data
+COLUMN_ALIASES = {'no of ratings': 'no_of_ratings'}
+
+# Categories repeat across 300k+ rows, so store each distinct name once.
+# The numeric columns contain ₹ and commas and are cleaned after reading.
+COLUMN_DTYPES = {
+    'name': str,
+    'main_category': 'category',
+    'sub_category': 'category',
+    'ratings': str,
+    'no_of_ratings': str,
+    'discount_price': str,
+    'actual_price': str,
+}
+CATEGORY_COLUMNS = [c for c, dtype in COLUMN_DTYPES.items() if dtype == 'category']
+
+# Seconds spent in each stage, printed as a summary at the end
+stage_timings = {}
+
+@contextmanager
+def timed_stage(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_timings[name] = stage_timings.get(name, 0.0) + time.perf_counter() - start
+
+# Strip ₹ symbols, commas and anything else that isn't a digit or a decimal
+# point, converting to pure numbers. Instead of a Python re.sub call per cell,
+# each column is factorized and only its distinct values are cleaned, with
+# vectorized string operations; prices, ratings and counts repeat a lot.
+# Blank cells become NaN, as do leftovers that aren't a valid number
+# (e.g. '1.2.3', which used to raise).
+def clean_numbers(df, columns):
+    cleaned = {}
+    for column in columns:
+        codes, uniques = pd.factorize(df[column])
+        digits = pd.Series(uniques).astype(str).str.replace(r'[^\d.]', '', regex=True)
+        # Always float64, so whole numbers are still exported as e.g. 3.0
+        values = pd.to_numeric(digits, errors='coerce').to_numpy(dtype='float64')
+        # Missing cells have code -1, which picks the NaN appended at the end
+        cleaned[column] = pd.Series(np.append(values, np.nan)[codes], index=df.index)
+    return cleaned
+
+def print_stage_timings():
+    print("\nStage timings:")
+    for name, seconds in stage_timings.items():
+        print(f"  {name:<10} {seconds:8.3f}s")
+    print(f"  {'Total':<10} {sum(stage_timings.values()):8.3f}s")
+
+# Read only the header and map the raw column names we need onto ours,
+# so the CSV reader can skip every other column
+def resolve_columns(path):
+    header = pd.read_csv(path, nrows=0).columns
+    rename = {}
+    for raw_name in header:
+        name = COLUMN_ALIASES.get(raw_name, raw_name)
+        if name in COLUMNS_TO_KEEP and name not in rename.values():
+            rename[raw_name] = name
+    return rename
+
+# Yield the raw data with only the needed columns, typed and renamed,
+# either as one DataFrame or in chunks of chunksize rows
+def read_raw_data(path, chunksize=None):
+    rename = resolve_columns(path)
+    dtypes = {raw_name: COLUMN_DTYPES[name] for raw_name, name in rename.items()}
+    reader = pd.read_csv(path, usecols=list(rename), dtype=dtypes, chunksize=chunksize)
+    for chunk in ([reader] if chunksize is None else reader):
+        chunk = chunk.rename(columns=rename)
+        yield chunk[[c for c in COLUMNS_TO_KEEP if c in chunk.columns]]
+
+# Clean the numerical columns and remove all rows with any blank cells
+def clean_chunk(chunk):
+    with timed_stage("Clean"):
+        numeric_columns = [c for c in NUMERIC_COLUMNS if c in chunk.columns]
+        if numeric_columns:
+            chunk = chunk.assign(**clean_numbers(chunk, numeric_columns))
+    with timed_stage("Filter"):
+        return chunk.dropna()
+
+# Concatenate cleaned chunks. Chunks have their own category sets, which
+# pandas would turn into plain strings, so re-categorize afterwards.
+def combine_chunks(chunks):
+    if len(chunks) == 1:
+        return chunks[0]
+    df = pd.concat(chunks)
+    return df.astype({c: 'category' for c in CATEGORY_COLUMNS if c in df.columns})
+
+# A uniform random sample of a fixed size, taken in one pass over a stream
+# of chunks without knowing the total row count (Algorithm L). Instead of
+# drawing a random number per row, it draws how many rows to skip before the
+# next replacement, so only the rows that enter the reservoir are touched and
+# each chunk costs O(1) Python work plus one iloc for the picked rows.
+# Memory is O(size). With the same seed the sample only depends on the row
+# order, not on how the stream was chunked.
+class ReservoirSampler:
+    def __init__(self, size, seed=None):
+        self.size = size
+        self.rng = random.Random(seed)
+        self.rows = []
+        self.columns = None
+        self.seen = 0
+        self.weight = math.exp(math.log(self._uniform()) / size) if size > 0 else 0.0
+        # Stream index of the next row that replaces a random reservoir slot
+        self.next_index = size + self._skip() if size > 0 else math.inf
+
+    def _uniform(self):
+        # Uniform on the open interval (0, 1), so logarithms stay finite
+        u = self.rng.random()
+        while u == 0.0:
+            u = self.rng.random()
+        return u
+
+    def _skip(self):
+        return math.floor(math.log(self._uniform()) / math.log(1.0 - self.weight))
+
+    def add(self, chunk):
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        start, end = self.seen, self.seen + len(chunk)
+
+        # Reservoir slot -> chunk position; a later pick for the same slot wins
+        # The first rows fill the reservoir
+        picks = {}
+        free = self.size - len(self.rows)
+        for position in range(min(free, len(chunk))):
+            picks[len(self.rows) + position] = position
+        while self.next_index < end:
+            picks[self.rng.randrange(self.size)] = self.next_index - start
+            self.weight *= math.exp(math.log(self._uniform()) / self.size)
+            self.next_index += self._skip() + 1
+        self.seen = end
+
+        if picks:
+            values = chunk.iloc[list(picks.values())].itertuples(index=False, name=None)
+            for slot, row in zip(picks, values):
+                if slot < len(self.rows):
+                    self.rows[slot] = row
+                else:
+                    self.rows.append(row)
+
+    def to_frame(self):
+        return pd.DataFrame.from_records(self.rows, columns=self.columns)
+
+# Split total into integer quotas in proportion to shares, never giving an
+# entry more than its capacity. Whatever a capped entry cannot take is
+# handed on to the others; the last few units go to the largest remainders.
+def allocate(total, shares, capacity):
+    shares = np.asarray(shares, dtype='float64')
+    capacity = np.asarray(capacity, dtype='int64')
+    quota = np.zeros(len(capacity), dtype='int64')
+    total = min(total, int(capacity.sum()))
+    while quota.sum() < total:
+        remaining = total - quota.sum()
+        room = quota < capacity
+        weights = np.where(room, shares, 0.0)
+        if weights.sum() == 0:
+            weights = room.astype('float64')
+        ideal = remaining * weights / weights.sum()
+        extra = np.minimum(np.floor(ideal).astype('int64'), capacity - quota)
+        if extra.sum() == 0:
+            for i in np.argsort(-ideal, kind='stable')[:remaining]:
+                quota[i] += 1
+        quota += extra
+    return quota
+
+# Stratified sample in one pass over a stream of chunks. Each row gets a
+# random key and every stratum keeps the rows with the largest keys, up to
+# the full sample size, since the final quotas depend on stratum sizes that
+# are only known at the end. Each stratum then keeps its top `quota` rows,
+# which is exactly a uniform sample of that size from the stratum.
+# Weighted by no_of_ratings, the keys are log(u) / (no_of_ratings + 1)
+# (A-Res), so often-rated products are more likely to be picked.
+# Memory is bounded by strata x sample size rows, not by the file size.
+class StratifiedSampler:
+    def __init__(self, size, stratify=None, allocation='proportional',
+                 min_per_stratum=MIN_PER_STRATUM, weighted=False, seed=None):
+        self.size = size
+        self.strata_columns = STRATA_COLUMNS[stratify] if stratify else []
+        # Without strata the whole stream is a single stratum
+        self.group_columns = self.strata_columns or ['_stratum']
+        self.allocation = allocation
+        self.min_per_stratum = min_per_stratum
+        self.weighted = weighted
+        self.rng = np.random.default_rng(seed)
+        self.columns = None
+        self.candidates = None
+        self.strata = None
+
+    def add(self, chunk):
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        if self.strata_columns:
+            # Chunks have their own category sets, so compare plain strings
+            chunk = chunk.astype({c: str for c in self.strata_columns})
+        else:
+            chunk = chunk.assign(_stratum=0)
+        if self.weighted:
+            weights = chunk['no_of_ratings'].to_numpy(dtype='float64') + 1.0
+        else:
+            weights = np.ones(len(chunk))
+        # 1 - random() lies in (0, 1], so every key is finite
+        keys = np.log(1.0 - self.rng.random(len(chunk))) / weights
+        chunk = chunk.assign(_key=keys, _weight=weights)
+
+        stats = chunk.groupby(self.group_columns)['_weight'].agg(population='size', total_weight='sum')
+        if self.strata is not None:
+            stats = pd.concat([self.strata, stats]).groupby(level=self.group_columns).sum()
+        self.strata = stats
+
+        if self.candidates is not None:
+            chunk = pd.concat([self.candidates, chunk], ignore_index=True)
+        chunk = chunk.sort_values('_key', ascending=False, kind='stable')
+        self.candidates = chunk.groupby(self.group_columns, sort=False).head(self.size)
+
+    def quotas(self):
+        population = self.strata['population'].to_numpy()
+        if self.allocation == 'equal':
+            return allocate(self.size, np.ones(len(population)), population)
+        if self.allocation == 'minimum':
+            floor = np.minimum(self.min_per_stratum, population)
+            if floor.sum() > self.size:
+                print(f"Warning: {len(population)} strata x {self.min_per_stratum} exceeds the sample size, "
+                      "allocating equally instead")
+                return allocate(self.size, np.ones(len(population)), population)
+            return floor + allocate(self.size - floor.sum(), population, population - floor)
+        return allocate(self.size, population, population)
+
+    def to_frame(self):
+        if self.candidates is None:
+            return pd.DataFrame(columns=self.columns)
+        self.strata['sampled'] = self.quotas()
+        sample = self.candidates.assign(_rank=self.candidates.groupby(self.group_columns).cumcount())
+        sample = sample.join(self.strata, on=self.group_columns)
+        sample = sample[sample['_rank'] < sample['sampled']]
+        # Sampling weight: how many products each sampled one stands for,
+        # i.e. the inverse of its (approximate, when weighted) inclusion probability
+        inclusion = (sample['sampled'] * sample['_weight'] / sample['total_weight']).clip(upper=1.0)
+        return sample[self.columns].assign(sample_weight=(1.0 / inclusion).round(4))
+
+    # Per-stratum population, sample size and design weight, for the export
+    def strata_records(self):
+        strata = self.strata.reset_index()[self.strata_columns + ['population', 'sampled']]
+        weight = (strata['population'] / strata['sampled']).round(4)
+        strata['weight'] = weight.where(strata['sampled'] > 0, None)
+        return strata.to_dict(orient='records')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Clean and sample the Amazon products dataset for the dashboard.")
+    parser.add_argument('--input', default=RAW_DATA_PATH, help=f"Raw CSV file (default: '{RAW_DATA_PATH}')")
+    parser.add_argument('--output', default=OUTPUT_PATH, help=f"JavaScript file to write (default: '{OUTPUT_PATH}')")
+    parser.add_argument('--chunksize', type=int, default=None, metavar='ROWS',
+                        help="Read and clean the CSV in chunks of this many rows to bound memory")
+    parser.add_argument('--sample-size', type=int, default=SAMPLE_SIZE, metavar='N',
+                        help=f"Number of products to sample (default: {SAMPLE_SIZE})")
+    parser.add_argument('--seed', type=int, default=SAMPLE_SEED,
+                        help=f"Random seed, for a reproducible sample (default: {SAMPLE_SEED})")
+    parser.add_argument('--reservoir', action='store_true',
+                        help="Sample while streaming the CSV in chunks (Algorithm L), keeping only "
+                             f"the sample in memory (default chunk size: {RESERVOIR_CHUNKSIZE:,} rows)")
+    parser.add_argument('--stratify', choices=list(STRATA_COLUMNS),
+                        help="Sample each main category (or main/sub-category pair) separately, in one "
+                             "streaming pass, and export per-record and per-stratum sampling weights")
+    parser.add_argument('--allocation', choices=ALLOCATIONS, default='proportional',
+                        help="How --stratify splits the sample: in proportion to stratum size, equally, "
+                             "or proportionally on top of --min-per-stratum (default: proportional)")
+    parser.add_argument('--min-per-stratum', type=int, default=MIN_PER_STRATUM, metavar='K',
+                        help=f"Guaranteed rows per stratum with --allocation minimum (default: {MIN_PER_STRATUM})")
+    parser.add_argument('--weight-by-ratings', action='store_true',
+                        help="Favour products with more ratings (weighted reservoir sampling, A-Res)")
+    args = parser.parse_args()
+
+    if args.sample_size < 0:
+        parser.error("--sample-size must be 0 or more")
+    if args.min_per_stratum < 0:
+        parser.error("--min-per-stratum must be 0 or more")
+    if args.chunksize is not None and args.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
+    # The stratified sampler already streams, so --reservoir would be ignored
+    if args.reservoir and (args.stratify or args.weight_by_ratings):
+        parser.error("--reservoir cannot be combined with --stratify or --weight-by-ratings, "
+                     "which already sample in a single streaming pass")
+    return args
 
 def main():
-    # 1. Load the raw Kaggle dataset
+    args = parse_args()
+
+    # 1. Load the raw Kaggle dataset, keeping only the columns we need
     # Ensure 'Amazon-Products.csv' is inside the 'raw data' folder
-    print("Loading dataset...")
+    # 2./3. Each chunk is cleaned and filtered as soon as it has been read
+    print("Loading dataset, cleaning numbers and currency, and filtering out products with missing values...")
+    # 4. With --reservoir, --stratify or --weight-by-ratings, each cleaned chunk
+    # goes straight into the sampler and is then dropped, so only the
+    # sample (or its candidates) stays in memory
+    if args.stratify or args.weight_by_ratings:
+        sampler = StratifiedSampler(args.sample_size, args.stratify, args.allocation,
+                                    args.min_per_stratum, args.weight_by_ratings, args.seed)
+    elif args.reservoir:
+        sampler = ReservoirSampler(args.sample_size, args.seed)
+    else:
+        sampler = None
+    chunksize = args.chunksize or (RESERVOIR_CHUNKSIZE if sampler is not None else None)
+    chunks = []
+    rows_read = 0
+    rows_kept = 0
     try:
-        df = pd.read_csv('raw data/Amazon-Products.csv', low_memory=False)
+        reader = read_raw_data(args.input, chunksize)
+        while True:
+            with timed_stage("Load"):
+                chunk = next(reader, None)
+            if chunk is None:
+                break
+            rows_read += len(chunk)
+            chunk = clean_chunk(chunk)
+            rows_kept += len(chunk)
+            if sampler is None:
+                chunks.append(chunk)
+            else:
+                with timed_stage("Sample"):
+                    sampler.add(chunk)
     except FileNotFoundError:
-        print("Error: 'raw data/Amazon-Products.csv' not found. Please check your folder structure.")
+        print(f"Error: '{args.input}' not found. Please check your folder structure.")
+        return
+
+    if rows_read == 0:
+        print(f"Error: '{args.input}' contains no rows.")
         return
 
-    # Handle variations in column names from the raw data
-    if 'no of ratings' in df.columns:
-        df.rename(columns={'no of ratings': 'no_of_ratings'}, inplace=True)
-
-    # 2. Select the required columns (Including main_category and sub_category)
-    columns_to_keep = [
-        'name', 'main_category', 'sub_category', 
-        'ratings', 'no_of_ratings', 'discount_price', 'actual_price'
-    ]
-    
-    # Ensure only existing columns are selected
-    columns_to_keep = [c for c in columns_to_keep if c in df.columns]
-    df = df[columns_to_keep]
-
-    # 3. Clean the numerical columns
-    print("Cleaning numbers and currency...")
-    if 'ratings' in df.columns:
-        df['ratings'] = df['ratings'].apply(clean_number)
-    if 'no_of_ratings' in df.columns:
-        df['no_of_ratings'] = df['no_of_ratings'].apply(clean_number)
-    if 'discount_price' in df.columns:
-        df['discount_price'] = df['discount_price'].apply(clean_number)
-    if 'actual_price' in df.columns:
-        df['actual_price'] = df['actual_price'].apply(clean_number)
-
-    # 3.5 REMOVE ALL ROWS WITH ANY BLANK CELLS
-    print("Filtering out products with any missing values...")
-    df.dropna(inplace=True)
-
-    # 4. Extract a random sample of exactly 3,000 products
-    print("Sampling 3000 records...")
-    sample_size = min(3000, len(df))
-    df_sampled = df.sample(n=sample_size, random_state=42) # random_state ensures consistent sampling
-
-    # Replace Pandas NaN with Python None so JSON outputs it cleanly as 'null'
-    df_sampled = df_sampled.where(pd.notnull(df_sampled), None)
+    if sampler is None:
+        df = combine_chunks(chunks)
+        memory_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+        print(f"Kept {rows_kept:,} of {rows_read:,} rows ({memory_mb:.1f} MB in memory)")
+    else:
+        print(f"Kept {rows_kept:,} of {rows_read:,} rows, streamed through a sampler of {args.sample_size:,}")
+
+    # 4. Extract a random sample of exactly 3,000 products (by default)
+    print(f"Sampling {args.sample_size} records...")
+    with timed_stage("Sample"):
+        if sampler is None:
+            sample_size = min(args.sample_size, len(df))
+            df_sampled = df.sample(n=sample_size, random_state=args.seed) # random_state ensures consistent sampling
+        else:
+            df_sampled = sampler.to_frame()
+        strata = sampler.strata_records() if args.stratify else None
+
+        # Replace Pandas NaN with Python None so JSON outputs it cleanly as 'null'
+        df_sampled = df_sampled.where(pd.notnull(df_sampled), None)
 
     # 5. Export to JavaScript format
-    print("Exporting to amazon_sample_3000.js...")
-    records = df_sampled.to_dict(orient='records')
-    
-    with open('amazon_sample_3000.js', 'w', encoding='utf-8') as f:
-        f.write("const RAW_DATA = \n")
-        json.dump(records, f, indent=2)
-        f.write(";\n")
-        
-    print("✅ Success! 'amazon_sample_3000.js' has been updated with strictly complete data.")
+    print(f"Exporting to {args.output}...")
+    with timed_stage("Export"):
+        records = df_sampled.to_dict(orient='records')
+
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write("const RAW_DATA = \n")
+            json.dump(records, f, indent=2)
+            f.write(";\n")
+            if strata is not None:
+                # Population and sample size of each stratum; weight = population / sampled
+                f.write("\nconst STRATA = \n")
+                json.dump(strata, f, indent=2)
+                f.write(";\n")
+
+    print(f"✅ Success! '{args.output}' has been updated with strictly complete data.")
+    print_stage_timings()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -10,19 +10,36 @@ import sys
 import csv
 import time
 import math
+import json
+import bisect
+import zlib
+import signal
+import asyncio
+import multiprocessing
+import locale
+import operator
+import unicodedata
+from array import array
 from datetime import datetime
 from typing import List, Tuple, Dict, Any, Optional
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from contextlib import contextmanager
 import platform
 
+# The shared sortlib package lives at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from sortlib import SortAlgorithmInfo, SortObserver, SortStats, get_algorithm, is_ordered
+
 # ============================================================================
 # CONFIGURATION CONSTANTS - UPDATED FOR CURRENT FOLDER STRUCTURE
 # ============================================================================
 
 MAX_RECORDS = 100000
-PROGRESS_UPDATE_FREQUENCY = 50
+PROGRESS_UPDATE_INTERVAL = 0.1  # seconds between progress bar redraws
+PROGRESS_SCALE = 1_000_000  # progress units per sort; sorts report a completed fraction
 DISPLAY_RECORDS = 10
+CHECKPOINT_INTERVAL = 60  # seconds between checkpoints of a running sort
 
 # Get the current directory where the script is running
 if getattr(sys, 'frozen', False):
@@ -35,17 +52,23 @@ else:
 # Adjust paths based on current folder structure
 CSV_FILE_PATH = os.path.join(CURRENT_DIR, "..", "data", "generated_data.csv")
 LOG_FILE_PATH = os.path.join(CURRENT_DIR, "..", "logs", "benchmark.log")
+INDEX_DIR_PATH = os.path.join(CURRENT_DIR, "..", "index")
+CHECKPOINT_DIR_PATH = os.path.join(CURRENT_DIR, "..", "checkpoints")
 
 # Try alternative paths if the above doesn't work
 if not os.path.exists(CSV_FILE_PATH):
     # Try current directory structure
     CSV_FILE_PATH = os.path.join(CURRENT_DIR, "data", "generated_data.csv")
     LOG_FILE_PATH = os.path.join(CURRENT_DIR, "logs", "benchmark.log")
+    INDEX_DIR_PATH = os.path.join(CURRENT_DIR, "index")
+    CHECKPOINT_DIR_PATH = os.path.join(CURRENT_DIR, "checkpoints")
     
     if not os.path.exists(CSV_FILE_PATH):
         # Try absolute path from current working directory
         CSV_FILE_PATH = os.path.join(os.getcwd(), "data", "generated_data.csv")
         LOG_FILE_PATH = os.path.join(os.getcwd(), "logs", "benchmark.log")
+        INDEX_DIR_PATH = os.path.join(os.getcwd(), "index")
+        CHECKPOINT_DIR_PATH = os.path.join(os.getcwd(), "checkpoints")
 
 print(f"Looking for CSV at: {CSV_FILE_PATH}")
 print(f"Looking for logs at: {LOG_FILE_PATH}")
@@ -158,6 +181,33 @@ class SortAlgorithm(Enum):
     BUBBLE = 1
     INSERTION = 2
     MERGE = 3
+    
+    @property
+    def info(self) -> SortAlgorithmInfo:
+        """Shared sortlib registry entry (label, complexity, implementations)"""
+        return get_algorithm(self.name.lower())
+
+class Collation(Enum):
+    RAW = 1         # code point order (original behaviour)
+    CASEFOLD = 2    # case- and accent-insensitive, Unicode normalized
+    LOCALE = 3      # system locale collation (strxfrm)
+
+# Separates the folded name from the raw name in CASEFOLD keys, so names that
+# fold equal still get a deterministic order and one str comparison decides
+COLLATION_TIEBREAK = '\x00'
+
+def fold_name(text: str) -> str:
+    """Casefold, decompose and strip accents: 'Ángel' -> 'angel'"""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+def collation_key(text: str, collation: Collation) -> str:
+    """Precomputed sort key for a name under the given collation"""
+    if collation == Collation.CASEFOLD:
+        return fold_name(text) + COLLATION_TIEBREAK + text
+    elif collation == Collation.LOCALE:
+        return locale.strxfrm(unicodedata.normalize('NFC', text))
+    return text
 
 @dataclass
 class Record:
@@ -165,6 +215,9 @@ class Record:
     ID: int
     FirstName: str
     LastName: str
+    # Collation keys, computed once at load time so comparisons stay a plain str <
+    FirstNameKey: str = field(default="", repr=False, compare=False)
+    LastNameKey: str = field(default="", repr=False, compare=False)
     
     @staticmethod
     def sanitize(text: str) -> str:
@@ -185,7 +238,8 @@ class Record:
 class ProgressTracker:
     """Tracks progress during sorting operations"""
     
-    def __init__(self):
+    def __init__(self, silent: bool = False):
+        self.silent = silent    # worker processes track counts without drawing
         self.current = 0
         self.total = 0
         self.comparisons = 0
@@ -236,6 +290,9 @@ class ProgressTracker:
     
     def display_progress(self, label: str, bar_width: int = 50):
         """Display a progress bar with stats"""
+        if self.silent:
+            return
+        
         progress = self.get_progress()
         filled = int(bar_width * progress / 100.0)
         
@@ -272,8 +329,9 @@ class ProgressTracker:
     def finish_progress(self, label: str):
         """Complete progress bar"""
         self.current = self.total
-        self.display_progress(label)
-        print()
+        if not self.silent:
+            self.display_progress(label)
+            print()
 
 # ============================================================================
 # DATASET LOADER WITH VALIDATION
@@ -285,6 +343,10 @@ class DatasetLoader:
     def __init__(self, filepath: str):
         self.filepath = filepath
         self.dataset = []
+        self.record_offsets = array('q')   # byte offset just past each record's row
+        self.end_offset = 0                # byte offset just past the last row read
+        self.line_end = 0
+        self.collation = Collation.RAW
     
     def file_exists(self, path: str) -> bool:
         """Check if file exists"""
@@ -318,16 +380,19 @@ class DatasetLoader:
                 return False
         
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
+            # Read in binary so the byte offset of every row is known; this is
+            # what lets an incremental re-sort pick up appended rows later
+            with open(self.filepath, 'rb') as file:
                 self.dataset = []
+                self.record_offsets = array('q')
+                self.line_end = 0
+                reader = csv.reader(self._iter_lines(file))
                 
                 # Skip header
-                try:
-                    next(reader, None)
-                except StopIteration:
+                if next(reader, None) is None:
                     Console.red("  Error: CSV file is empty")
                     return False
+                self.end_offset = self.line_end
                 
                 line_number = 0
                 valid_records = 0
@@ -346,30 +411,14 @@ class DatasetLoader:
                         progress.set_current(valid_records)
                         progress.display_progress("Loading CSV")
                     
-                    # Validate row has enough columns
-                    if len(row) < 3:
-                        error_count += 1
-                        continue
-                    
-                    id_str, first_name, last_name = row[0], row[1], row[2] if len(row) > 2 else ""
+                    self.end_offset = self.line_end
+                    record = self._parse_row(row)
                     
-                    try:
-                        record_id = int(id_str)
-                        
-                        # Create and validate record
-                        record = Record(
-                            ID=record_id,
-                            FirstName=Record.sanitize(first_name),
-                            LastName=Record.sanitize(last_name)
-                        )
-                        
-                        if record.ID > 0 and record.FirstName:
-                            self.dataset.append(record)
-                            valid_records += 1
-                        else:
-                            error_count += 1
-                            
-                    except ValueError:
+                    if record is not None:
+                        self.dataset.append(record)
+                        self.record_offsets.append(self.end_offset)
+                        valid_records += 1
+                    else:
                         error_count += 1
                 
                 progress.set_current(valid_records)
@@ -385,6 +434,89 @@ class DatasetLoader:
             Console.red(f"  Error loading CSV: {e}")
             return False
     
+    def _iter_lines(self, file, complete_only: bool = False):
+        """Yield decoded lines, tracking the byte offset where each one ends"""
+        for raw_line in file:
+            # A trailing line without newline may still be being written
+            if complete_only and not raw_line.endswith(b'\n'):
+                return
+            self.line_end += len(raw_line)
+            yield raw_line.decode('utf-8')
+    
+    def _parse_row(self, row: List[str]) -> Optional[Record]:
+        """Validate a CSV row and convert it to a Record (None if invalid)"""
+        # Validate row has enough columns
+        if len(row) < 3:
+            return None
+        
+        id_str, first_name, last_name = row[0], row[1], row[2]
+        
+        try:
+            record_id = int(id_str)
+        except ValueError:
+            return None
+        
+        # Create and validate record
+        record = Record(
+            ID=record_id,
+            FirstName=Record.sanitize(first_name),
+            LastName=Record.sanitize(last_name)
+        )
+        
+        if record.ID > 0 and record.FirstName:
+            if self.collation != Collation.RAW:
+                self._add_collation_keys(record)
+            return record
+        return None
+    
+    def _add_collation_keys(self, record: Record):
+        """Store the collation keys of a record's name columns"""
+        record.FirstNameKey = collation_key(record.FirstName, self.collation)
+        record.LastNameKey = collation_key(record.LastName, self.collation)
+    
+    def set_collation(self, collation: Collation) -> float:
+        """Switch collation, precomputing keys for loaded records; returns build time"""
+        if collation == Collation.LOCALE:
+            # Use the user's locale; fall back if the system cannot provide it
+            try:
+                locale.setlocale(locale.LC_COLLATE, '')
+            except locale.Error as e:
+                Console.yellow(f"  Warning: Locale collation unavailable ({e}), using case-insensitive")
+                collation = Collation.CASEFOLD
+        
+        start = time.time()
+        if collation != self.collation:
+            self.collation = collation
+            if collation != Collation.RAW:
+                for record in self.dataset:
+                    self._add_collation_keys(record)
+        return time.time() - start
+    
+    def extend_to_eof(self) -> int:
+        """Load rows appended after end_offset (ignores MAX_RECORDS); returns count added"""
+        added = 0
+        
+        with open(self.filepath, 'rb') as file:
+            file.seek(self.end_offset)
+            self.line_end = self.end_offset
+            
+            for row in csv.reader(self._iter_lines(file, complete_only=True)):
+                self.end_offset = self.line_end
+                record = self._parse_row(row)
+                
+                if record is not None:
+                    self.dataset.append(record)
+                    self.record_offsets.append(self.end_offset)
+                    added += 1
+        
+        return added
+    
+    def offset_after(self, num_records: int) -> int:
+        """Byte offset just past the row of the num_records-th loaded record"""
+        if num_records <= 0:
+            return 0
+        return self.record_offsets[min(num_records, len(self.record_offsets)) - 1]
+    
     def get_data(self, num_records: int) -> List[Record]:
         """Get specified number of records from dataset"""
         count = min(num_records, len(self.dataset))
@@ -394,37 +526,254 @@ class DatasetLoader:
         """Get total number of loaded records"""
         return len(self.dataset)
 
+# ============================================================================
+# CHECKPOINT / RESUME
+# ============================================================================
+
+@dataclass
+class SortCheckpoint:
+    """Saved state of an interrupted sort"""
+    position: int           # bubble: next pass, insertion: next index, merge: next width
+    order: List[int]        # current arrangement as indices into the unsorted input
+    comparisons: int
+    swaps: int
+    progress_current: int
+    elapsed: float          # sort time accumulated over all previous sessions
+
+class CheckpointManager:
+    """Persists sort state at intervals so long sorts survive interruptions"""
+    
+    def __init__(self, checkpoint_dir: str, algorithm: SortAlgorithm, column: SortColumn,
+                 original: List[Record], source_path: str, source_offset: int,
+                 interval: float = CHECKPOINT_INTERVAL, collation: Collation = Collation.RAW):
+        self.algorithm = algorithm
+        self.column = column
+        # Copied and indexed now: the caller's list is sorted in place, and
+        # saved orders must refer to the unsorted rows that restore() reloads
+        self.original = list(original)
+        self.position_of: Dict[int, int] = {id(record): i for i, record in enumerate(self.original)}
+        self.source_path = source_path
+        self.source_offset = source_offset
+        self.interval = interval
+        self.last_save = time.time()
+        # A different collation produces a different order, so it gets its own file
+        suffix = "" if column == SortColumn.ID or collation == Collation.RAW else f"_{collation.name.lower()}"
+        self.path = os.path.join(
+            checkpoint_dir,
+            f"{algorithm.name.lower()}_{column.name.lower()}_{len(original)}{suffix}.json"
+        )
+    
+    def due(self) -> bool:
+        """Check whether the checkpoint interval has elapsed"""
+        return time.time() - self.last_save >= self.interval
+    
+    def save(self, data: List[Record], position: int, progress: ProgressTracker):
+        """Write the current sort state to disk"""
+        payload = {
+            "algorithm": self.algorithm.name,
+            "column": self.column.name,
+            "num_records": len(self.original),
+            "source_offset": self.source_offset,
+            "source_checksum": file_fingerprint(self.source_path, self.source_offset),
+            "position": position,
+            "order": [self.position_of[id(record)] for record in data],
+            "comparisons": progress.comparisons,
+            "swaps": progress.swaps,
+            "progress_current": progress.current,
+            "elapsed": progress.get_elapsed_time(),
+            "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        checkpoint_dir = os.path.dirname(self.path)
+        if checkpoint_dir and not os.path.exists(checkpoint_dir):
+            os.makedirs(checkpoint_dir)
+        
+        # Replace atomically so a crash mid-write keeps the previous checkpoint
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(payload, checkpoint_file)
+        os.replace(temp_path, self.path)
+        self.last_save = time.time()
+    
+    def load(self) -> Optional[SortCheckpoint]:
+        """Load a checkpoint matching this run, or None"""
+        if not os.path.exists(self.path):
+            return None
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as checkpoint_file:
+                payload = json.load(checkpoint_file)
+            
+            # The saved order is only meaningful for the same input rows
+            if (payload["source_offset"] != self.source_offset or
+                    payload["source_checksum"] != file_fingerprint(self.source_path, self.source_offset) or
+                    len(payload["order"]) != len(self.original)):
+                return None
+            
+            return SortCheckpoint(
+                position=payload["position"],
+                order=payload["order"],
+                comparisons=payload["comparisons"],
+                swaps=payload["swaps"],
+                progress_current=payload["progress_current"],
+                elapsed=payload["elapsed"]
+            )
+        except (OSError, ValueError, KeyError) as e:
+            Console.yellow(f"  Warning: Could not read checkpoint {self.path}: {e}")
+            return None
+    
+    def restore(self, checkpoint: SortCheckpoint) -> List[Record]:
+        """Rebuild the partially sorted data from a checkpoint"""
+        return [self.original[i] for i in checkpoint.order]
+    
+    def matches_fresh_sort(self, data: List[Record], key) -> bool:
+        """Check a resumed sort ended exactly where an uninterrupted stable sort would"""
+        expected = sorted(self.original, key=key)
+        return len(data) == len(expected) and all(map(operator.is_, data, expected))
+    
+    def clear(self):
+        """Delete the checkpoint once the sort has completed"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
 # ============================================================================
 # SORTING ALGORITHMS (IMPLEMENTED FROM SCRATCH)
 # ============================================================================
 
-class Sorter:
-    """Implements sorting algorithms with progress tracking"""
+class Sorter(SortObserver):
+    """Runs the shared sortlib algorithms with progress, cancellation and checkpoints"""
     
-    def __init__(self, column: SortColumn, progress: ProgressTracker):
+    def __init__(self, column: SortColumn, progress: ProgressTracker,
+                 checkpointer: Optional[CheckpointManager] = None,
+                 resume: Optional[SortCheckpoint] = None,
+                 collation: Collation = Collation.RAW):
         self.column = column
         self.progress = progress
         self.cancelled = False
+        self.checkpointer = checkpointer
+        self.resume = resume
+        self.collated = collation != Collation.RAW
+        self.stats = SortStats()
+        self.label = ""
+        self.last_display = 0.0
+        self.algorithm: Optional[SortAlgorithm] = None
+        self.position: Optional[int] = None    # Last safe point the sort passed
     
-    def compare(self, a: Record, b: Record) -> bool:
-        """Compare two records based on selected column"""
-        self.progress.increment_comparisons()
-        
+    def sort_key(self):
+        """Key function for the selected column (collation keys are precomputed)"""
         if self.column == SortColumn.ID:
-            return a.ID < b.ID
+            return operator.attrgetter('ID')
         elif self.column == SortColumn.FIRST_NAME:
-            return a.FirstName < b.FirstName
-        elif self.column == SortColumn.LAST_NAME:
-            return a.LastName < b.LastName
+            return operator.attrgetter('FirstNameKey' if self.collated else 'FirstName')
+        return operator.attrgetter('LastNameKey' if self.collated else 'LastName')
+    
+    @contextmanager
+    def handle_interrupts(self):
+        """Turn Ctrl+C into a cancel request checked at safe points in the loops"""
+        def request_cancel(signum, frame):
+            if self.cancelled:
+                # Second Ctrl+C: stop immediately
+                raise KeyboardInterrupt
+            self.cancelled = True
+            Console.red("\n  Cancel requested - stopping at the next safe point...")
+        
+        previous = signal.signal(signal.SIGINT, request_cancel)
+        try:
+            yield self
+        finally:
+            signal.signal(signal.SIGINT, previous)
+    
+    def start_position(self, default: int) -> int:
+        """Restore counters from a resumed checkpoint and get the starting position"""
+        if self.resume is None:
+            return default
+        
+        self.stats.comparisons = self.resume.comparisons
+        self.stats.swaps = self.resume.swaps
+        self.progress.comparisons = self.resume.comparisons
+        self.progress.swaps = self.resume.swaps
+        self.progress.current = self.resume.progress_current
+        # Shift the start so elapsed time and ETA include earlier sessions
+        self.progress.start_time -= self.resume.elapsed
+        return self.resume.position
+    
+    def step(self, data: List[Record], position: int, fraction: float) -> bool:
+        """Called by the sort before each pass; False stops it at this position"""
+        self.position = position
+        self.progress.comparisons = self.stats.comparisons
+        self.progress.swaps = self.stats.swaps
+        if self.cancelled:
+            return False
+        
+        self.progress.set_current(int(fraction * self.progress.total))
+        now = time.time()
+        if now - self.last_display >= PROGRESS_UPDATE_INTERVAL:
+            self.last_display = now
+            self.progress.display_progress(self.label)
+        
+        self.checkpoint(data, position)
+        return True
+    
+    def checkpoint(self, data: List[Record], position: int, force: bool = False):
+        """Save sort state if a checkpointer is attached and the interval elapsed"""
+        if self.checkpointer is None or not (force or self.checkpointer.due()):
+            return
         
-        return False
+        try:
+            self.checkpointer.save(data, position, self.progress)
+        except OSError as e:
+            Console.yellow(f"\n  Warning: Could not save checkpoint: {e}")
     
-    def record_swap(self):
-        """Record a swap operation"""
-        self.progress.increment_swaps()
+    def interrupted(self, data: List[Record]):
+        """Record a hard stop (second Ctrl+C) raised from inside the sort"""
+        Console.red("\n  Operation cancelled by user!")
+        self.cancelled = True
+        self.progress.comparisons = self.stats.comparisons
+        self.progress.swaps = self.stats.swaps
+        
+        if self.checkpointer is not None and self.position is not None:
+            self.repair(data)
+            self.checkpoint(data, self.resume_position(data), force=True)
+    
+    def repair(self, data: List[Record]):
+        """Put back records lost by a swap, shift or merge that was cut short"""
+        present = set(map(id, data))
+        if len(present) == len(data):
+            return
+        # Each lost record left a duplicate of another behind; replace the copies
+        missing = [record for record in self.checkpointer.original if id(record) not in present]
+        seen = set()
+        for i, record in enumerate(data):
+            if id(record) in seen:
+                data[i] = missing.pop()
+            else:
+                seen.add(id(record))
+    
+    def resume_position(self, data: List[Record]) -> int:
+        """Latest position at or before the last safe point that data can resume from"""
+        keys = list(map(self.sort_key(), data))
+        if self.algorithm == SortAlgorithm.BUBBLE:
+            # Pass i needs the last i records sorted and none smaller in front of them
+            split = len(keys) - self.position
+            if self.position and not (is_ordered(keys[split:]) and
+                                      (split == 0 or max(keys[:split]) <= keys[split])):
+                return 0
+            return self.position
+        if self.algorithm == SortAlgorithm.INSERTION:
+            # Item i needs records [0, i) sorted
+            unsorted = next((i + 1 for i, (a, b) in enumerate(zip(keys, keys[1:])) if b < a), len(keys))
+            return max(1, min(self.position, unsorted))
+        # Width w needs every run of width w sorted
+        width = self.position
+        while width > 1 and not all(is_ordered(keys[left:left + width]) for left in range(0, len(keys), width)):
+            width //= 2
+        return width
     
     def show_controls(self):
         """Display sorting controls"""
+        if self.progress.silent:
+            return
+        
         Console.cyan("  ╔════════════════════════════════════════╗")
         Console.cyan("  ║        CONTROLS DURING SORTING         ║")
         Console.cyan("  ╠════════════════════════════════════════╣")
@@ -432,159 +781,32 @@ class Sorter:
         Console.cyan("  ╚════════════════════════════════════════╝")
         print()
     
-    def bubble_sort(self, data: List[Record]):
-        """Bubble Sort implementation - O(n²)"""
-        n = len(data)
-        if n <= 1:
-            return
-        
-        # Calculate total operations
-        total_ops = (n * (n - 1)) // 2
-        self.progress.set_total(total_ops)
-        self.progress.reset()
-        
-        # Show controls
-        self.show_controls()
-        
-        current_op = 0
-        
-        for i in range(n - 1):
-            if self.cancelled:
-                break
-            
-            swapped = False
-            
-            for j in range(n - i - 1):
-                if self.cancelled:
-                    break
-                
-                current_op += 1
-                
-                if self.compare(data[j + 1], data[j]):
-                    data[j], data[j + 1] = data[j + 1], data[j]
-                    self.record_swap()
-                    swapped = True
-                
-                # Update progress
-                if current_op % PROGRESS_UPDATE_FREQUENCY == 0:
-                    self.progress.set_current(current_op)
-                    self.progress.display_progress("Bubble Sort")
-            
-            # Early termination if no swaps
-            if not swapped:
-                self.progress.set_current(total_ops)
-                break
-        
-        self.progress.finish_progress("Bubble Sort")
-    
-    def insertion_sort(self, data: List[Record]):
-        """Insertion Sort implementation - O(n²)"""
-        n = len(data)
-        if n <= 1:
+    def sort(self, algorithm: SortAlgorithm, data: List[Record]):
+        """Sort data in place with the registry's instrumented variant"""
+        if len(data) <= 1:
             return
         
-        # Estimate operations (average case)
-        total_ops = (n * (n - 1)) // 4
-        self.progress.set_total(total_ops)
+        info = algorithm.info
+        self.label = info.label
+        self.stats = SortStats()
+        self.algorithm = algorithm
+        self.position = None
+        self.progress.set_total(PROGRESS_SCALE)
         self.progress.reset()
         
         # Show controls
         self.show_controls()
         
-        current_op = 0
+        info.instrumented(data, key=self.sort_key(), stats=self.stats, observer=self)
+        self.progress.comparisons = self.stats.comparisons
+        self.progress.swaps = self.stats.swaps
         
-        for i in range(1, n):
-            if self.cancelled:
-                break
-            
-            key = data[i]
-            j = i - 1
-            
-            while j >= 0 and self.compare(key, data[j]):
-                data[j + 1] = data[j]
-                self.record_swap()
-                j -= 1
-                current_op += 1
-                
-                if current_op % PROGRESS_UPDATE_FREQUENCY == 0:
-                    self.progress.set_current(min(current_op, total_ops))
-                    self.progress.display_progress("Insertion Sort")
-            
-            data[j + 1] = key
-            
-            # Update progress per outer iteration
-            if i % 100 == 0:
-                self.progress.set_current(min(current_op, total_ops))
-                self.progress.display_progress("Insertion Sort")
-        
-        self.progress.finish_progress("Insertion Sort")
-    
-    def merge_sort(self, data: List[Record]):
-        """Merge Sort implementation - O(n log n)"""
-        n = len(data)
-        if n <= 1:
+        if not self.stats.completed:
+            self.checkpoint(data, self.stats.stopped_at, force=True)
             return
         
-        # Calculate total operations: n * log2(n)
-        total_ops = int(n * math.log2(n))
-        self.progress.set_total(total_ops)
-        self.progress.reset()
-        
-        # Show controls
-        self.show_controls()
-        
-        self._merge_sort_recursive(data, 0, n - 1)
-        self.progress.finish_progress("Merge Sort")
-    
-    def _merge_sort_recursive(self, data: List[Record], left: int, right: int):
-        """Recursive helper for merge sort"""
-        if left >= right or self.cancelled:
-            return
-        
-        mid = left + (right - left) // 2
-        
-        self._merge_sort_recursive(data, left, mid)
-        self._merge_sort_recursive(data, mid + 1, right)
-        
-        self._merge(data, left, mid, right)
-        
-        # Update progress
-        self.progress.increment()
-        if self.progress.current % 10 == 0:
-            self.progress.display_progress("Merge Sort")
-    
-    def _merge(self, data: List[Record], left: int, mid: int, right: int):
-        """Merge two sorted subarrays"""
-        n1 = mid - left + 1
-        n2 = right - mid
-        
-        L = data[left:mid + 1]
-        R = data[mid + 1:right + 1]
-        
-        i = j = 0
-        k = left
-        
-        while i < n1 and j < n2:
-            if self.compare(L[i], R[j]):
-                data[k] = L[i]
-                i += 1
-            else:
-                data[k] = R[j]
-                j += 1
-            self.record_swap()
-            k += 1
-        
-        while i < n1:
-            data[k] = L[i]
-            i += 1
-            self.record_swap()
-            k += 1
-        
-        while j < n2:
-            data[k] = R[j]
-            j += 1
-            self.record_swap()
-            k += 1
+        self.cancelled = False
+        self.progress.finish_progress(info.label)
 
 # ============================================================================
 # BENCHMARK RESULT STORAGE
@@ -603,6 +825,466 @@ class BenchmarkResult:
     swaps: int
     completed: bool
 
+# ============================================================================
+# SORTED INDEX & QUERY API
+# ============================================================================
+
+FINGERPRINT_BYTES = 4096
+
+def file_fingerprint(path: str, offset: int) -> int:
+    """CRC32 of the bytes just before `offset` - detects rewrites vs appends"""
+    with open(path, 'rb') as file:
+        start = max(0, offset - FINGERPRINT_BYTES)
+        file.seek(start)
+        return zlib.crc32(file.read(offset - start))
+
+class SortedIndex:
+    """Reusable sorted index for one column (permutation array + key array)"""
+
+    def __init__(self, column: SortColumn, permutation: array, keys: List[Any],
+                 algorithm_name: str = "", sort_time: float = 0.0,
+                 source_offset: int = 0, source_checksum: int = 0,
+                 collation: Collation = Collation.RAW, source_size: Optional[int] = None):
+        self.column = column
+        self.collation = collation
+        self.permutation = permutation      # permutation[i] = dataset position of i-th smallest
+        self.keys = keys                    # keys[i] = sort key of i-th smallest record
+        self.algorithm_name = algorithm_name
+        self.sort_time = sort_time
+        self.source_offset = source_offset      # CSV bytes covered by the index
+        self.source_checksum = source_checksum
+        # CSV size when the index was saved; rows past it were appended later
+        self.source_size = source_offset if source_size is None else source_size
+        self.dataset: List[Record] = []
+
+    @staticmethod
+    def key_for(column: SortColumn, record: Record, collation: Collation = Collation.RAW) -> Any:
+        """Get the sort key of a record for the given column"""
+        if column == SortColumn.ID:
+            return record.ID
+        elif column == SortColumn.FIRST_NAME:
+            return record.FirstNameKey if collation != Collation.RAW else record.FirstName
+        return record.LastNameKey if collation != Collation.RAW else record.LastName
+
+    def query_bounds(self, low: Any, high: Any) -> Tuple[int, int]:
+        """Index positions [lo, hi) of keys between low and high inclusive"""
+        if self.column == SortColumn.ID or self.collation == Collation.RAW:
+            lo = bisect.bisect_left(self.keys, low)
+            return lo, bisect.bisect_right(self.keys, high, lo)
+
+        if self.collation == Collation.CASEFOLD:
+            # Keys are folded + TIEBREAK + raw; everything folding to `high`
+            # sorts below folded(high) + the character after TIEBREAK
+            lo = bisect.bisect_left(self.keys, fold_name(low))
+            upper = fold_name(high) + chr(ord(COLLATION_TIEBREAK) + 1)
+            return lo, bisect.bisect_left(self.keys, upper, lo)
+
+        low_key = collation_key(low, self.collation)
+        high_key = collation_key(high, self.collation)
+        lo = bisect.bisect_left(self.keys, low_key)
+        return lo, bisect.bisect_right(self.keys, high_key, lo)
+
+    @classmethod
+    def build(cls, column: SortColumn, dataset: List[Record], sorted_data: List[Record],
+              algorithm_name: str = "", sort_time: float = 0.0,
+              source_path: Optional[str] = None, source_offset: int = 0,
+              collation: Collation = Collation.RAW) -> 'SortedIndex':
+        """Build an index from a sorted copy of the first len(sorted_data) records"""
+        # Sorted records are the same objects as in the dataset, so identity
+        # gives us each record's original position without another search
+        if column == SortColumn.ID:
+            collation = Collation.RAW
+        position = {id(record): i for i, record in enumerate(dataset[:len(sorted_data)])}
+        permutation = array('i', (position[id(record)] for record in sorted_data))
+        keys = [cls.key_for(column, record, collation) for record in sorted_data]
+
+        source_checksum = 0
+        source_size = source_offset
+        if source_path and os.path.exists(source_path):
+            source_checksum = file_fingerprint(source_path, source_offset)
+            source_size = os.path.getsize(source_path)
+
+        index = cls(column, permutation, keys, algorithm_name, sort_time,
+                    source_offset, source_checksum, collation, source_size)
+        index.bind(dataset)
+        return index
+
+    def bind(self, dataset: List[Record]):
+        """Attach the dataset the permutation refers to"""
+        self.dataset = dataset
+
+    def size(self) -> int:
+        """Number of indexed records"""
+        return len(self.keys)
+
+    def is_stale(self, source_path: str) -> bool:
+        """Check whether the indexed part of the source CSV was rewritten"""
+        if not os.path.exists(source_path):
+            return True
+        if os.path.getsize(source_path) < self.source_offset:
+            return True
+        return file_fingerprint(source_path, self.source_offset) != self.source_checksum
+
+    def merge(self, sorted_delta: List[Record], first_position: int):
+        """Merge sorted appended records into the index - O(n + m)
+
+        The delta is the bound dataset's records from first_position on,
+        sorted; each keeps its dataset position in the permutation.
+        Existing entries win ties, so the merged index stays stable.
+        """
+        position = {id(record): first_position + i
+                    for i, record in enumerate(self.dataset[first_position:])}
+        delta_keys = [self.key_for(self.column, record, self.collation) for record in sorted_delta]
+        delta_positions = [position[id(record)] for record in sorted_delta]
+
+        old_keys, old_permutation = self.keys, self.permutation
+        n1, n2 = len(old_keys), len(delta_keys)
+        keys: List[Any] = []
+        permutation = array('i')
+        i = j = 0
+
+        while i < n1 and j < n2:
+            if delta_keys[j] < old_keys[i]:
+                keys.append(delta_keys[j])
+                permutation.append(delta_positions[j])
+                j += 1
+            else:
+                keys.append(old_keys[i])
+                permutation.append(old_permutation[i])
+                i += 1
+
+        keys.extend(old_keys[i:])
+        permutation.extend(old_permutation[i:])
+        keys.extend(delta_keys[j:])
+        permutation.extend(delta_positions[j:])
+
+        self.keys = keys
+        self.permutation = permutation
+
+    def update_source(self, source_path: str, source_offset: int):
+        """Record how much of the source CSV the index now covers"""
+        self.source_offset = source_offset
+        self.source_checksum = file_fingerprint(source_path, source_offset)
+        self.source_size = os.path.getsize(source_path)
+
+    def save(self, path: str):
+        """Persist the index as JSON"""
+        index_dir = os.path.dirname(path)
+        if index_dir and not os.path.exists(index_dir):
+            os.makedirs(index_dir)
+
+        payload = {
+            "column": self.column.name,
+            "collation": self.collation.name,
+            "algorithm": self.algorithm_name,
+            "sort_time": self.sort_time,
+            "source_offset": self.source_offset,
+            "source_checksum": self.source_checksum,
+            "source_size": self.source_size,
+            "permutation": self.permutation.tolist(),
+            "keys": self.keys
+        }
+
+        # Write to a temporary file first so an interrupted save never
+        # leaves a half-written index behind
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as index_file:
+            json.dump(payload, index_file)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['SortedIndex']:
+        """Load a persisted index, or None if missing or unreadable"""
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as index_file:
+                payload = json.load(index_file)
+
+            return cls(
+                column=SortColumn[payload["column"]],
+                permutation=array('i', payload["permutation"]),
+                keys=payload["keys"],
+                algorithm_name=payload.get("algorithm", ""),
+                sort_time=payload.get("sort_time", 0.0),
+                source_offset=payload.get("source_offset", 0),
+                source_checksum=payload.get("source_checksum", 0),
+                collation=Collation[payload.get("collation", "RAW")],
+                source_size=payload.get("source_size")
+            )
+        except (OSError, ValueError, KeyError) as e:
+            Console.yellow(f"  Warning: Could not read index {path}: {e}")
+            return None
+
+    def _records(self, lo: int, hi: int) -> List[Record]:
+        """Resolve index positions [lo, hi) to records"""
+        return [self.dataset[self.permutation[i]] for i in range(lo, hi)]
+
+    def find(self, key: Any) -> List[Record]:
+        """Point lookup - all records whose key equals `key` - O(log n)"""
+        return self._records(*self.query_bounds(key, key))
+
+    def range(self, low: Any, high: Any) -> List[Record]:
+        """Range query - all records with low <= key <= high - O(log n + k)"""
+        return self._records(*self.query_bounds(low, high))
+
+    def prefix(self, prefix: str) -> List[Record]:
+        """Prefix query on a name column - O(log n + k)"""
+        if self.column == SortColumn.ID:
+            raise ValueError("Prefix queries require a FirstName/LastName index")
+        if self.collation == Collation.LOCALE:
+            raise ValueError("Prefix queries are not supported on locale-collated indexes")
+        if self.collation == Collation.CASEFOLD:
+            prefix = fold_name(prefix)
+
+        lo = bisect.bisect_left(self.keys, prefix)
+        # A trailing U+10FFFF has no successor, so bump the character before it
+        stem = prefix.rstrip(chr(sys.maxunicode))
+        if not stem:
+            return self._records(lo, len(self.keys))
+
+        # Smallest string greater than every string starting with `prefix`
+        upper = stem[:-1] + chr(ord(stem[-1]) + 1)
+        hi = bisect.bisect_left(self.keys, upper, lo)
+        return self._records(lo, hi)
+
+    def top_k(self, k: int, largest: bool = False) -> List[Record]:
+        """First k records in sorted order (or last k if largest)"""
+        k = max(0, min(k, len(self.keys)))
+        if largest:
+            return self._records(len(self.keys) - k, len(self.keys))[::-1]
+        return self._records(0, k)
+
+class IndexStore:
+    """Locates persisted sorted indexes, one file per SortColumn"""
+
+    def __init__(self, index_dir: str, source_path: str):
+        self.index_dir = index_dir
+        self.source_path = source_path
+
+    def path_for(self, column: SortColumn, collation: Collation = Collation.RAW) -> str:
+        """Get index file path for a column (name indexes are per collation)"""
+        base = os.path.splitext(os.path.basename(self.source_path))[0]
+        name = column.name.lower()
+        if column != SortColumn.ID and collation != Collation.RAW:
+            name += f".{collation.name.lower()}"
+        return os.path.join(self.index_dir, f"{base}.{name}.idx.json")
+
+    def save(self, index: SortedIndex):
+        """Persist an index"""
+        index.save(self.path_for(index.column, index.collation))
+
+    def load(self, column: SortColumn, loader: 'DatasetLoader',
+             allow_missing_rows: bool = False) -> Optional[SortedIndex]:
+        """Load a fresh index for a column and bind it to the loader's dataset
+
+        Queries need every loaded record indexed, so an index missing some
+        is refused unless allow_missing_rows (incremental re-sort) is set.
+        """
+        index = SortedIndex.load(self.path_for(column, loader.collation))
+        if index is None or index.is_stale(self.source_path):
+            return None
+
+        # Incremental updates may have indexed rows beyond MAX_RECORDS
+        if index.source_offset > loader.end_offset:
+            loader.extend_to_eof()
+
+        if index.size() > loader.get_size():
+            return None
+        if index.size() < loader.get_size() and not allow_missing_rows:
+            Console.yellow(f"  Saved index covers only {index.size()} of {loader.get_size()} loaded records.")
+            return None
+
+        index.bind(loader.dataset)
+        return index
+
+# ============================================================================
+# CONCURRENT BENCHMARK SCHEDULER
+# ============================================================================
+
+QUADRATIC_ALGORITHMS = tuple(algo for algo in SortAlgorithm if algo.info.quadratic)
+SCHEDULER_POLL_INTERVAL = 0.05
+SCHEDULER_REFRESH_INTERVAL = 0.5
+
+@dataclass
+class BenchmarkJob:
+    """One queued (algorithm, column, size) benchmark"""
+    algorithm: SortAlgorithm
+    column: SortColumn
+    num_records: int
+    status: str = "Queued"
+    started_at: float = 0.0
+    result: Optional[BenchmarkResult] = None
+
+def _benchmark_job_worker(algorithm_value: int, column_value: int, collation_value: int,
+                          data: List[Record], conn) -> None:
+    """Worker process entry point: sort silently and send back the metrics"""
+    # Ctrl+C is handled by the scheduler, which terminates workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    algo = SortAlgorithm(algorithm_value)
+    sort_progress = ProgressTracker(silent=True)
+    sorter = Sorter(SortColumn(column_value), sort_progress,
+                    collation=Collation(collation_value))
+    
+    start_sort = time.time()
+    sorter.sort(algo, data)
+    sort_time = time.time() - start_sort
+    
+    conn.send((sort_time, sort_progress.comparisons, sort_progress.swaps))
+    conn.close()
+
+class BenchmarkScheduler:
+    """Runs queued benchmark jobs concurrently in worker processes via asyncio"""
+    
+    def __init__(self, loader: DatasetLoader, max_workers: int, max_quadratic: int,
+                 algorithm_names: Dict[SortAlgorithm, str]):
+        self.loader = loader
+        self.max_workers = max_workers
+        self.max_quadratic = max_quadratic
+        self.algorithm_names = algorithm_names
+        self.jobs: List[BenchmarkJob] = []
+        self.rendered_lines = 0
+    
+    def add_job(self, algorithm: SortAlgorithm, column: SortColumn, num_records: int):
+        """Queue a benchmark job"""
+        self.jobs.append(BenchmarkJob(algorithm, column, num_records))
+    
+    def run(self) -> List[BenchmarkResult]:
+        """Run all jobs; Ctrl+C cancels queued jobs and terminates running workers"""
+        try:
+            asyncio.run(self._run_all())
+        except KeyboardInterrupt:
+            # asyncio.run cancels the job tasks, whose cleanup stops the workers
+            for job in self.jobs:
+                if job.status in ("Queued", "Running"):
+                    job.status = "Cancelled"
+            self.render()
+            Console.red("\n  Scheduler cancelled by user!")
+        
+        return [job.result for job in self.jobs if job.result is not None]
+    
+    async def _run_all(self):
+        """Schedule every job and keep the summary table refreshed"""
+        worker_slots = asyncio.Semaphore(self.max_workers)
+        quadratic_slots = asyncio.Semaphore(self.max_quadratic)
+        
+        # Cheapest jobs first so results start streaming in immediately
+        ordered = sorted(self.jobs, key=lambda job: (job.algorithm in QUADRATIC_ALGORITHMS,
+                                                      job.num_records))
+        tasks = [asyncio.ensure_future(self._run_job(job, worker_slots, quadratic_slots))
+                 for job in ordered]
+        refresher = asyncio.ensure_future(self._refresh_table())
+        
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            refresher.cancel()
+            self.render()
+    
+    async def _run_job(self, job: BenchmarkJob, worker_slots: asyncio.Semaphore,
+                       quadratic_slots: asyncio.Semaphore):
+        """Run one job in its own worker process once slots are free"""
+        if job.algorithm in QUADRATIC_ALGORITHMS:
+            async with quadratic_slots:
+                async with worker_slots:
+                    await self._execute(job)
+        else:
+            async with worker_slots:
+                await self._execute(job)
+    
+    async def _execute(self, job: BenchmarkJob):
+        """Start the worker process and wait for its result without blocking the loop"""
+        start_load = time.time()
+        data = self.loader.get_data(job.num_records)
+        load_time = time.time() - start_load
+        
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_benchmark_job_worker,
+            args=(job.algorithm.value, job.column.value, self.loader.collation.value,
+                  data, child_conn),
+            daemon=True
+        )
+        
+        job.status = "Running"
+        job.started_at = time.time()
+        process.start()
+        child_conn.close()
+        self.render()
+        
+        try:
+            while not parent_conn.poll():
+                if not process.is_alive():
+                    break
+                await asyncio.sleep(SCHEDULER_POLL_INTERVAL)
+            
+            if parent_conn.poll():
+                sort_time, comparisons, swaps = parent_conn.recv()
+                job.status = "Done"
+                job.result = BenchmarkResult(
+                    algorithm_name=self.algorithm_names[job.algorithm],
+                    algorithm=job.algorithm,
+                    column=job.column,
+                    num_records=len(data),
+                    load_time=load_time,
+                    sort_time=sort_time,
+                    comparisons=comparisons,
+                    swaps=swaps,
+                    completed=True
+                )
+            else:
+                job.status = "Failed"
+        finally:
+            if job.result is None and process.is_alive():
+                process.terminate()
+                job.status = "Cancelled"
+            process.join()
+            parent_conn.close()
+            self.render()
+    
+    async def _refresh_table(self):
+        """Periodically redraw so running jobs show a live elapsed time"""
+        while True:
+            await asyncio.sleep(SCHEDULER_REFRESH_INTERVAL)
+            self.render()
+    
+    def render(self):
+        """Draw the summary table in place"""
+        lines = [
+            f"  {'Algorithm':<15} {'Column':<12} {'Records':<10} {'Status':<10} "
+            f"{'Sort Time':<12} {'Comparisons':<15} {'Swaps':<12}",
+            f"  {'-' * 90}"
+        ]
+        
+        for job in self.jobs:
+            name = self.algorithm_names[job.algorithm]
+            column = job.column.name.replace('_', ' ').title()
+            
+            if job.result is not None:
+                r = job.result
+                line = (f"  {name:<15} {column:<12} {job.num_records:<10} "
+                        f"{Colors.BRIGHT_GREEN}{'Done':<10}{Colors.RESET} {r.sort_time:<11.3f}s "
+                        f"{r.comparisons:<15} {r.swaps:<12}")
+            elif job.status == "Running":
+                elapsed = time.time() - job.started_at
+                line = (f"  {name:<15} {column:<12} {job.num_records:<10} "
+                        f"{Colors.BRIGHT_YELLOW}{'Running':<10}{Colors.RESET} {elapsed:<11.1f}s")
+            else:
+                color = Colors.BRIGHT_RED if job.status in ("Failed", "Cancelled") else Colors.DIM
+                line = (f"  {name:<15} {column:<12} {job.num_records:<10} "
+                        f"{color}{job.status:<10}{Colors.RESET}")
+            lines.append(line)
+        
+        # Move the cursor back over the previous table and overwrite it
+        if self.rendered_lines:
+            print(f"\033[{self.rendered_lines}F", end='')
+        for line in lines:
+            print(f"\033[2K{line}")
+        sys.stdout.flush()
+        self.rendered_lines = len(lines)
+
 # ============================================================================
 # MAIN APPLICATION
 # ============================================================================
@@ -610,19 +1292,17 @@ class BenchmarkResult:
 class BenchmarkApp:
     """Main application class for running benchmarks"""
     
-    def __init__(self, csv_path: str, log_path: str):
+    def __init__(self, csv_path: str, log_path: str, index_dir: str = INDEX_DIR_PATH,
+                 checkpoint_dir: str = CHECKPOINT_DIR_PATH):
         self.loader = DatasetLoader(csv_path)
         self.LOG_FILE_PATH = log_path
+        self.index_dir = index_dir
+        self.checkpoint_dir = checkpoint_dir
         self.history = []
     
     def get_algorithm_name(self, algo: SortAlgorithm) -> str:
         """Get display name for algorithm"""
-        names = {
-            SortAlgorithm.BUBBLE: "Bubble Sort",
-            SortAlgorithm.INSERTION: "Insertion Sort",
-            SortAlgorithm.MERGE: "Merge Sort"
-        }
-        return names.get(algo, "Unknown")
+        return algo.info.label
     
     def get_column_name(self, col: SortColumn) -> str:
         """Get display name for column"""
@@ -633,6 +1313,15 @@ class BenchmarkApp:
         }
         return names.get(col, "Unknown")
     
+    def get_collation_name(self, collation: Collation) -> str:
+        """Get display name for collation"""
+        names = {
+            Collation.RAW: "Raw",
+            Collation.CASEFOLD: "Case-insensitive",
+            Collation.LOCALE: "Locale"
+        }
+        return names.get(collation, "Unknown")
+    
     def print_header(self, title: str):
         """Print formatted header"""
         Console.cyan(f"\n  {'=' * 70}")
@@ -714,10 +1403,14 @@ class BenchmarkApp:
             print("  2. Run Comparison Benchmark (All Algorithms)")
             print("  3. View Benchmark History")
             print("  4. Algorithm Information")
-            print("  5. Exit")
+            print("  5. Query Sorted Index")
+            print("  6. Incremental Re-sort (Appended Rows)")
+            print("  7. Concurrent Benchmark Scheduler")
+            print(f"  8. Name Collation Settings (current: {self.get_collation_name(self.loader.collation)})")
+            print("  9. Exit")
             print()
             
-            choice = self.validate_input("  Select option (1-5): ", 1, 5)
+            choice = self.validate_input("  Select option (1-9): ", 1, 9)
             
             if choice == 1:
                 self.run_single_benchmark()
@@ -728,6 +1421,14 @@ class BenchmarkApp:
             elif choice == 4:
                 self.show_algorithm_info()
             elif choice == 5:
+                self.run_index_query()
+            elif choice == 6:
+                self.run_incremental_resort()
+            elif choice == 7:
+                self.run_concurrent_benchmark()
+            elif choice == 8:
+                self.configure_collation()
+            elif choice == 9:
                 return
     
     def run_single_benchmark(self):
@@ -797,7 +1498,7 @@ class BenchmarkApp:
             )
         
         # ENHANCED WARNING FOR LARGE DATASETS WITH O(n²) ALGORITHMS
-        if num_records == 100000 and algo in [SortAlgorithm.BUBBLE, SortAlgorithm.INSERTION]:
+        if num_records == 100000 and algo in QUADRATIC_ALGORITHMS:
             print()
             Console.red("╔══════════════════════════════════════════════════════════════════╗")
             Console.red("║                    ⚠  CRITICAL WARNING  ⚠                        ║")
@@ -831,7 +1532,7 @@ class BenchmarkApp:
             # If choice 1, continue with the selected algorithm
         
         # Standard warning for other large datasets
-        elif num_records > 10000 and algo in [SortAlgorithm.BUBBLE, SortAlgorithm.INSERTION]:
+        elif num_records > 10000 and algo in QUADRATIC_ALGORITHMS:
             print()
             print(f"  ⚠ WARNING: Sorting {num_records} records with {self.get_algorithm_name(algo)} may take a long time!")
             print("  Estimated time: ", end="")
@@ -861,31 +1562,57 @@ class BenchmarkApp:
         Console.green(f"  Data loaded: {len(data)} records in {load_time:.3f}s")
         print()
         
+        # Long sorts are checkpointed so an interrupted run can be resumed
+        checkpointer = CheckpointManager(
+            self.checkpoint_dir, algo, column, data,
+            self.loader.filepath, self.loader.offset_after(len(data)),
+            collation=self.loader.collation
+        )
+        resume = checkpointer.load()
+        if resume is not None:
+            Console.cyan(f"  Found a checkpoint for this benchmark "
+                         f"({resume.elapsed:.1f}s of sorting already done).")
+            print("  1. Resume from checkpoint")
+            print("  2. Start over")
+            print()
+            if self.validate_input("  Select option (1-2): ", 1, 2) == 1:
+                data = checkpointer.restore(resume)
+                Console.green("  Resuming from checkpoint")
+            else:
+                checkpointer.clear()
+                resume = None
+            print()
+        
         sort_progress = ProgressTracker()
-        sorter = Sorter(column, sort_progress)
+        sorter = Sorter(column, sort_progress, checkpointer, resume, self.loader.collation)
         
         start_sort = time.time()
         
         try:
-            if algo == SortAlgorithm.BUBBLE:
-                sorter.bubble_sort(data)
-            elif algo == SortAlgorithm.INSERTION:
-                sorter.insertion_sort(data)
-            elif algo == SortAlgorithm.MERGE:
-                sorter.merge_sort(data)
+            with sorter.handle_interrupts():
+                sorter.sort(algo, data)
         except KeyboardInterrupt:
-            Console.red("\n  Operation cancelled by user!")
-            sorter.cancelled = True
+            sorter.interrupted(data)
         
         end_sort = time.time()
         sort_time = end_sort - start_sort
+        if resume is not None:
+            sort_time += resume.elapsed
         
         # Display results
         print()
-        if not sorter.cancelled:
+        if (not sorter.cancelled and resume is not None and
+                not checkpointer.matches_fresh_sort(data, sorter.sort_key())):
+            Console.red("  ✗ Resumed result differs from an uninterrupted sort - checkpoint discarded")
+            checkpointer.clear()
+            sorter.cancelled = True
+        elif not sorter.cancelled:
             Console.green("  ✓ Sorting completed successfully!")
+            checkpointer.clear()
         else:
             Console.yellow("  ⚠ Sorting interrupted")
+            if os.path.exists(checkpointer.path):
+                Console.cyan("  Progress saved - run the same benchmark again to resume.")
         
         print()
         self.print_separator()
@@ -904,6 +1631,7 @@ class BenchmarkApp:
         # Display sample results
         if not sorter.cancelled:
             self.display_results(data, self.get_column_name(column))
+            self.save_index(column, data, self.get_algorithm_name(algo), sort_time)
         
         # Save to history
         result = BenchmarkResult(
@@ -1029,7 +1757,7 @@ class BenchmarkApp:
         print()
         
         results = []
-        algorithms = [SortAlgorithm.BUBBLE, SortAlgorithm.INSERTION, SortAlgorithm.MERGE]
+        algorithms = list(SortAlgorithm)
         
         for algo in algorithms:
             # Load fresh data for each algorithm
@@ -1040,20 +1768,15 @@ class BenchmarkApp:
             
             # Sort
             sort_progress = ProgressTracker()
-            sorter = Sorter(column, sort_progress)
+            sorter = Sorter(column, sort_progress, collation=self.loader.collation)
             
             start_sort = time.time()
             
             try:
-                if algo == SortAlgorithm.BUBBLE:
-                    sorter.bubble_sort(data)
-                elif algo == SortAlgorithm.INSERTION:
-                    sorter.insertion_sort(data)
-                elif algo == SortAlgorithm.MERGE:
-                    sorter.merge_sort(data)
+                with sorter.handle_interrupts():
+                    sorter.sort(algo, data)
             except KeyboardInterrupt:
-                Console.red("\n  Operation cancelled!")
-                sorter.cancelled = True
+                sorter.interrupted(data)
             
             end_sort = time.time()
             sort_time = end_sort - start_sort
@@ -1110,6 +1833,84 @@ class BenchmarkApp:
         
         self.wait_for_enter()
     
+    def run_concurrent_benchmark(self):
+        """Queue (algorithm, column, size) jobs and run them concurrently"""
+        Console.clear()
+        self.print_header("CONCURRENT BENCHMARK SCHEDULER")
+        
+        # Load dataset
+        print()
+        load_progress = ProgressTracker()
+        if not self.loader.load(load_progress):
+            self.wait_for_enter()
+            return
+        
+        print()
+        print("  Select Column(s) to Sort:")
+        print("  1. ID (Integer)")
+        print("  2. First Name (String)")
+        print("  3. Last Name (String)")
+        print("  4. All Columns")
+        print()
+        
+        col_choice = self.validate_input("  Select column (1-4): ", 1, 4)
+        columns = list(SortColumn) if col_choice == 4 else [SortColumn(col_choice)]
+        
+        print()
+        sizes_input = input("  Dataset sizes, comma separated (default: 1000,5000,10000): ").strip()
+        try:
+            sizes = [int(size) for size in sizes_input.split(',')] if sizes_input else [1000, 5000, 10000]
+            if any(size < 1 or size > self.loader.get_size() for size in sizes):
+                raise ValueError(f"sizes must be between 1 and {self.loader.get_size()}")
+        except ValueError as e:
+            Console.red(f"  Error: {e}")
+            self.wait_for_enter()
+            return
+        
+        cpu_count = os.cpu_count() or 1
+        print()
+        max_workers = self.validate_input(
+            f"  Max parallel workers (1-{cpu_count}): ", 1, cpu_count)
+        max_quadratic = self.validate_input(
+            f"  Max concurrent O(n²) jobs (1-{max_workers}): ", 1, max_workers)
+        
+        if max(sizes) > 10000:
+            print()
+            print(f"  ⚠ Note: O(n²) jobs with {max(sizes)} records may take a long time.")
+            print("  Continue anyway? (y/n): ", end="")
+            if input().strip().lower() not in ['y', 'yes']:
+                return
+        
+        names = {algo: self.get_algorithm_name(algo) for algo in SortAlgorithm}
+        scheduler = BenchmarkScheduler(self.loader, max_workers, max_quadratic, names)
+        for column in columns:
+            for size in sizes:
+                for algo in SortAlgorithm:
+                    scheduler.add_job(algo, column, size)
+        
+        print()
+        Console.cyan(f"  Running {len(scheduler.jobs)} jobs on up to {max_workers} workers "
+                     f"(Ctrl+C to cancel)...")
+        print()
+        
+        start_all = time.time()
+        results = scheduler.run()
+        wall_time = time.time() - start_all
+        
+        for result in results:
+            self.history.append(result)
+            self.log_result(result)
+        
+        total_sort_time = sum(result.sort_time for result in results)
+        print()
+        self.print_separator()
+        print(f"  Completed Jobs:   {len(results)} of {len(scheduler.jobs)}")
+        print(f"  Wall Time:        {wall_time:.3f}s")
+        print(f"  Summed Sort Time: {total_sort_time:.3f}s")
+        self.print_separator()
+        
+        self.wait_for_enter()
+    
     def run_single_benchmark_for_comparison(self, column: SortColumn, num_records: int, algorithms: List[SortAlgorithm]):
         """Helper method to run specific algorithms for comparison"""
         results = []
@@ -1123,20 +1924,15 @@ class BenchmarkApp:
             
             # Sort
             sort_progress = ProgressTracker()
-            sorter = Sorter(column, sort_progress)
+            sorter = Sorter(column, sort_progress, collation=self.loader.collation)
             
             start_sort = time.time()
             
             try:
-                if algo == SortAlgorithm.BUBBLE:
-                    sorter.bubble_sort(data)
-                elif algo == SortAlgorithm.INSERTION:
-                    sorter.insertion_sort(data)
-                elif algo == SortAlgorithm.MERGE:
-                    sorter.merge_sort(data)
+                with sorter.handle_interrupts():
+                    sorter.sort(algo, data)
             except KeyboardInterrupt:
-                Console.red("\n  Operation cancelled!")
-                sorter.cancelled = True
+                sorter.interrupted(data)
             
             end_sort = time.time()
             sort_time = end_sort - start_sort
@@ -1177,6 +1973,331 @@ class BenchmarkApp:
         
         self.wait_for_enter()
     
+    def get_index_store(self) -> IndexStore:
+        """Get index store for the currently loaded CSV file"""
+        return IndexStore(self.index_dir, self.loader.filepath)
+
+    def save_index(self, column: SortColumn, data: List[Record], algorithm_name: str, sort_time: float):
+        """Persist the sorted result as a reusable index (full loaded dataset only)"""
+        # A subset would replace the full index and make queries miss the other rows
+        if len(data) < self.loader.get_size():
+            Console.yellow(f"  Sorted index not saved: only {len(data)} of "
+                           f"{self.loader.get_size()} loaded records were sorted")
+            return
+        try:
+            index = SortedIndex.build(column, self.loader.dataset, data, algorithm_name,
+                                      sort_time, self.loader.filepath,
+                                      self.loader.offset_after(len(data)),
+                                      self.loader.collation)
+            self.get_index_store().save(index)
+            Console.green(f"  ✓ Sorted index saved ({index.size()} records by {self.get_column_name(column)})")
+        except OSError as e:
+            Console.yellow(f"  Warning: Could not save sorted index: {e}")
+
+    def get_or_build_index(self, column: SortColumn) -> Optional[SortedIndex]:
+        """Load the persisted index for a column, offering to build it if missing"""
+        index = self.get_index_store().load(column, self.loader)
+        if index is not None:
+            Console.green(f"  ✓ Using saved index ({index.size()} records, "
+                          f"sorted with {index.algorithm_name or 'unknown'})")
+            return index
+
+        Console.yellow(f"  No up-to-date index for {self.get_column_name(column)}.")
+        print("  Build it now with Merge Sort over the full dataset? (y/n): ", end="")
+        if input().strip().lower() not in ['y', 'yes']:
+            return None
+
+        data = self.loader.get_data(self.loader.get_size())
+        sort_progress = ProgressTracker()
+        sorter = Sorter(column, sort_progress, collation=self.loader.collation)
+
+        start_sort = time.time()
+        try:
+            with sorter.handle_interrupts():
+                sorter.sort(SortAlgorithm.MERGE, data)
+        except KeyboardInterrupt:
+            sorter.interrupted(data)
+        sort_time = time.time() - start_sort
+        
+        if sorter.cancelled:
+            Console.red("  Operation cancelled by user!")
+            return None
+
+        self.save_index(column, data, self.get_algorithm_name(SortAlgorithm.MERGE), sort_time)
+        return self.get_index_store().load(column, self.loader)
+
+    def display_query_results(self, records: List[Record], query_time: float):
+        """Display records returned by an index query"""
+        print()
+        Console.green(f"  {len(records)} match(es) in {query_time * 1000:.3f} ms")
+        self.print_separator()
+
+        Console.yellow(f"  {'ID':<8} {'First Name':<25} {'Last Name':<25}")
+        self.print_separator()
+
+        for record in records[:DISPLAY_RECORDS]:
+            print(f"  {record.ID:<8} {record.FirstName:<25} {record.LastName:<25}")
+
+        if len(records) > DISPLAY_RECORDS:
+            print(f"  ... and {len(records) - DISPLAY_RECORDS} more")
+
+        self.print_separator()
+
+    def run_index_query(self):
+        """Answer lookups from persisted sorted indexes without re-sorting"""
+        Console.clear()
+        self.print_header("QUERY SORTED INDEX")
+
+        # Load dataset (the index stores positions, the records come from here)
+        print()
+        load_progress = ProgressTracker()
+        if not self.loader.load(load_progress):
+            self.wait_for_enter()
+            return
+
+        print()
+        print("  Select Query:")
+        print("  1. Point Lookup by ID")
+        print("  2. Prefix Search (First/Last Name)")
+        print("  3. Range Query")
+        print("  4. Top-K Records")
+        print("  5. Back to Main Menu")
+        print()
+
+        query_choice = self.validate_input("  Select query (1-5): ", 1, 5)
+        if query_choice == 5:
+            return
+
+        if query_choice == 1:
+            column = SortColumn.ID
+        else:
+            print()
+            print("  Select Column:")
+            if query_choice == 2:
+                print("  1. First Name")
+                print("  2. Last Name")
+                print()
+                col_choice = self.validate_input("  Select column (1-2): ", 1, 2) + 1
+            else:
+                print("  1. ID (Integer)")
+                print("  2. First Name (String)")
+                print("  3. Last Name (String)")
+                print()
+                col_choice = self.validate_input("  Select column (1-3): ", 1, 3)
+            column = SortColumn(col_choice)
+
+        print()
+        index = self.get_or_build_index(column)
+        if index is None:
+            self.wait_for_enter()
+            return
+
+        print()
+        try:
+            if query_choice == 1:
+                record_id = int(input("  Enter ID: ").strip())
+                start_query = time.perf_counter()
+                records = index.find(record_id)
+            elif query_choice == 2:
+                prefix = input("  Enter name prefix: ").strip()
+                start_query = time.perf_counter()
+                records = index.prefix(prefix)
+            elif query_choice == 3:
+                parse = int if column == SortColumn.ID else str
+                low = parse(input("  Enter lower bound: ").strip())
+                high = parse(input("  Enter upper bound: ").strip())
+                start_query = time.perf_counter()
+                records = index.range(low, high)
+            else:
+                k = self.validate_input(f"  Enter K (1-{index.size()}): ", 1, index.size())
+                print("  Order: 1. Smallest first  2. Largest first")
+                largest = self.validate_input("  Select order (1-2): ", 1, 2) == 2
+                start_query = time.perf_counter()
+                records = index.top_k(k, largest)
+            query_time = time.perf_counter() - start_query
+        except ValueError as e:
+            Console.red(f"  Error: Invalid query value ({e})")
+            self.wait_for_enter()
+            return
+
+        self.display_query_results(records, query_time)
+        self.wait_for_enter()
+
+    def estimate_full_sort_time(self, algo: SortAlgorithm, delta_time: float,
+                                delta_size: int, total_size: int) -> float:
+        """Extrapolate the delta sort time to a full re-sort of total_size records"""
+        if delta_size <= 1:
+            return delta_time
+
+        if algo == SortAlgorithm.MERGE:
+            scale = (total_size * math.log2(total_size)) / (delta_size * math.log2(delta_size))
+        else:
+            scale = (total_size / delta_size) ** 2
+        return delta_time * scale
+
+    def run_incremental_resort(self):
+        """Sort only the rows appended since the last saved sort and merge them in"""
+        Console.clear()
+        self.print_header("INCREMENTAL RE-SORT (APPENDED ROWS)")
+
+        # Load dataset
+        print()
+        load_progress = ProgressTracker()
+        if not self.loader.load(load_progress):
+            self.wait_for_enter()
+            return
+
+        print()
+        print("  Select Algorithm for the Appended Rows:")
+        print("  1. Bubble Sort    (O(n²))")
+        print("  2. Insertion Sort (O(n²))")
+        print("  3. Merge Sort     (O(n log n))")
+        print()
+
+        algo = SortAlgorithm(self.validate_input("  Select algorithm (1-3): ", 1, 3))
+
+        print()
+        print("  Select Column to Sort:")
+        print("  1. ID (Integer)")
+        print("  2. First Name (String)")
+        print("  3. Last Name (String)")
+        print()
+
+        column = SortColumn(self.validate_input("  Select column (1-3): ", 1, 3))
+
+        print()
+        store = self.get_index_store()
+        index = store.load(column, self.loader, allow_missing_rows=True)
+        if index is None:
+            Console.yellow(f"  No up-to-date sorted result for {self.get_column_name(column)}.")
+            Console.yellow("  Run a single benchmark first to create the cached sort.")
+            self.wait_for_enter()
+            return
+
+        if os.path.getsize(self.loader.filepath) > self.loader.end_offset:
+            self.loader.extend_to_eof()
+
+        # The delta is every row read past the indexed part of the file. Only
+        # rows past the file's size when the index was saved were appended;
+        # any others (e.g. beyond MAX_RECORDS) were there but never indexed.
+        base_size = index.size()
+        first_new = bisect.bisect_right(self.loader.record_offsets, index.source_offset)
+        delta = self.loader.dataset[first_new:]
+        appended = len(self.loader.record_offsets) - bisect.bisect_right(self.loader.record_offsets,
+                                                                         index.source_size)
+        unindexed = len(delta) - appended
+        if not delta:
+            Console.green(f"  ✓ No appended rows - the cached sort of {base_size} records is up to date.")
+            self.wait_for_enter()
+            return
+
+        Console.cyan(f"  Cached sort: {base_size} records   Appended: {appended} records"
+                     + (f"   Not yet indexed: {unindexed} records" if unindexed else ""))
+        print()
+
+        # Sort only the delta with the chosen algorithm
+        sort_progress = ProgressTracker()
+        sorter = Sorter(column, sort_progress, collation=self.loader.collation)
+
+        start_sort = time.time()
+        try:
+            with sorter.handle_interrupts():
+                sorter.sort(algo, delta)
+        except KeyboardInterrupt:
+            sorter.interrupted(delta)
+        delta_time = time.time() - start_sort
+
+        if sorter.cancelled:
+            Console.yellow("  ⚠ Incremental re-sort interrupted - cached sort left unchanged")
+            self.wait_for_enter()
+            return
+
+        # Linear merge of the sorted delta into the cached sorted result
+        start_merge = time.time()
+        index.merge(delta, first_new)
+        merge_time = time.time() - start_merge
+
+        index.update_source(self.loader.filepath, self.loader.offset_after(index.size()))
+        try:
+            store.save(index)
+        except OSError as e:
+            Console.yellow(f"  Warning: Could not save sorted index: {e}")
+
+        incremental_time = delta_time + merge_time
+        total_size = index.size()
+        full_estimate = self.estimate_full_sort_time(algo, delta_time, len(delta), total_size)
+        saved = full_estimate - incremental_time
+
+        print()
+        Console.green("  ✓ Incremental re-sort completed successfully!")
+        print()
+        self.print_separator()
+        Console.cyan("  INCREMENTAL PERFORMANCE:")
+        self.print_separator()
+        print(f"  Algorithm:           {self.get_algorithm_name(algo)}")
+        print(f"  Column:              {self.get_column_name(column)}")
+        if unindexed:
+            print(f"  Records:             {base_size} cached + {unindexed} not yet indexed + "
+                  f"{appended} appended = {total_size}")
+        else:
+            print(f"  Records:             {base_size} cached + {appended} appended = {total_size}")
+        print(f"  Delta Sort Time:     {delta_time:.3f}s")
+        print(f"  Merge Time:          {merge_time:.3f}s")
+        print(f"  Incremental Total:   {incremental_time:.3f}s")
+        print(f"  Full Re-sort (est.): {full_estimate:.3f}s")
+        if saved > 0:
+            Console.green(f"  Time Saved (est.):   {saved:.3f}s "
+                          f"({full_estimate / incremental_time if incremental_time > 0 else 0:.1f}x faster)")
+        else:
+            Console.yellow(f"  Time Saved (est.):   none ({-saved:.3f}s slower)")
+        print(f"  Comparisons:         {sort_progress.comparisons}")
+        print(f"  Swaps:               {sort_progress.swaps}")
+        self.print_separator()
+
+        self.display_results(index.top_k(DISPLAY_RECORDS), self.get_column_name(column))
+
+        result = BenchmarkResult(
+            algorithm_name=f"{self.get_algorithm_name(algo)} (Incr.)",
+            algorithm=algo,
+            column=column,
+            num_records=total_size,
+            load_time=0.0,
+            sort_time=incremental_time,
+            comparisons=sort_progress.comparisons,
+            swaps=sort_progress.swaps,
+            completed=True
+        )
+
+        self.history.append(result)
+        self.log_result(result)
+
+        self.wait_for_enter()
+
+    def configure_collation(self):
+        """Choose how First/Last Name columns are ordered"""
+        Console.clear()
+        self.print_header("NAME COLLATION SETTINGS")
+        
+        print()
+        Console.cyan(f"  Current collation: {self.get_collation_name(self.loader.collation)}")
+        print()
+        print("  1. Raw             - code point order ('Zoe' < 'adam', 'Émile' after 'Zoe')")
+        print("  2. Case-insensitive - casefolded, accents stripped, Unicode normalized")
+        print("  3. Locale          - system locale collation rules")
+        print()
+        
+        collation = Collation(self.validate_input("  Select collation (1-3): ", 1, 3))
+        key_time = self.loader.set_collation(collation)
+        
+        print()
+        Console.green(f"  ✓ Name collation set to {self.get_collation_name(self.loader.collation)}")
+        if self.loader.get_size() > 0 and self.loader.collation != Collation.RAW:
+            print(f"  Precomputed keys for {self.loader.get_size()} loaded records in {key_time:.3f}s")
+        print("  Keys are computed once per record at load time, so name")
+        print("  comparisons during sorting stay a single string comparison.")
+        
+        self.wait_for_enter()
+    
     def view_history(self):
         """View benchmark history"""
         Console.clear()
@@ -1310,12 +2431,14 @@ def main():
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
         log_path = os.path.join(log_dir, "benchmark.log")
+        index_dir = os.path.join(project_root, "index")
+        checkpoint_dir = os.path.join(project_root, "checkpoints")
         
         Console.green(f"  ✓ Log file will be saved to: {log_path}")
         print()
         
         # Run the application
-        app = BenchmarkApp(csv_path, log_path)
+        app = BenchmarkApp(csv_path, log_path, index_dir, checkpoint_dir)
         app.run()
         
         Console.clear()
@@ -1,8 +1,34 @@
 import time
 import os
 import sys
+import csv
+import glob
+import math
+import heapq
+import random
+import re
+import struct
+import operator
 import argparse
-from typing import List, Tuple, Optional
+import tempfile
+import contextlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain, compress, groupby, islice
+from typing import BinaryIO, Iterable, List, Tuple, Optional, Iterator
+
+try:
+    import resource  # POSIX only; used to cap batch worker memory
+except ImportError:
+    resource = None
+
+# The shared sortlib package lives at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from sortlib import SortObserver, algorithm_names, get_algorithm, load_plugins
+from sortlib.linear import (counting_range_fits, counting_range_limit, counting_sorted,
+                            radix_digits, radix_sorted)
+
+load_plugins()
 
 # ============================================
 # CONFIGURATION OPTIONS
@@ -11,6 +37,29 @@ DEFAULT_INPUT_FILE = 'dataset.txt'
 DEFAULT_OUTPUT_FILE = 'sorted_output.txt'
 PROGRESS_THRESHOLD = 1000  # Show progress bar for lists larger than this
 SAMPLE_SIZE = 20  # Number of items to show in sample preview
+READ_BLOCK_SIZE = 4 * 1024 * 1024  # Bytes read per block when parsing input
+BINARY_CACHE_SUFFIX = '.i64'  # Sidecar file holding parsed numbers as raw int64
+BINARY_CACHE_MAGIC = b'I64CACHE'
+BINARY_CACHE_HEADER = struct.Struct('<8sqq')  # magic, source size, source mtime (ns)
+FEW_RUNS_THRESHOLD = 8  # Merge natural runs directly when there are at most this many
+INVERSION_SAMPLE_PAIRS = 2000  # Random pairs sampled to estimate inversions
+ESTIMATE_SAMPLE_SIZE = 512  # Sample size used to extrapolate the skipped sort's time
+LINEAR_ALGORITHMS = ('auto', 'counting', 'radix')  # Integer-only sorts (unique and known min/max supported)
+DISTINCT_EXACT_LIMIT = 1_000_000  # Distinct values tracked exactly before switching to HyperLogLog
+HLL_PRECISION = 14  # HyperLogLog uses 2**14 registers (~0.8% standard error)
+MASK64 = (1 << 64) - 1
+WRITE_CHUNK_SIZE = 65536  # Numbers formatted per joined write
+WRITE_BUFFER_SIZE = 1024 * 1024  # Output file buffer size in bytes
+CONSOLE_PRINT_LIMIT = 1000  # Larger results print a sample unless --print-all is given
+OUTPUT_SUFFIXES = {'text': '.txt', 'int64': '.i64', 'varint': '.varint'}
+SPACE_BEFORE_VALUE = re.compile(rb'[^\S\n]\S')  # Matches any line holding two values
+DEFAULT_MEMORY_BUDGET_MB = 256  # In-memory run size for --stream
+LIST_BYTES_PER_NUMBER = 40  # Approximate cost of one int in a Python list (pointer + int object)
+BATCH_OUTPUT_TAG = '.sorted'  # data.txt -> data.sorted.txt in batch mode
+BATCH_REPORT_FILE = 'batch_summary.csv'
+BATCH_REPORT_FIELDS = ['file', 'status', 'numbers', 'bytes', 'algorithm', 'read_seconds',
+                       'sort_seconds', 'write_seconds', 'total_seconds', 'numbers_per_second',
+                       'min', 'max', 'mean', 'duplicates', 'output', 'error']
 
 
 def bubble_sort_descending(arr: List[int], show_stats: bool = False) -> Tuple[List[int], dict]:
@@ -24,104 +73,936 @@ def bubble_sort_descending(arr: List[int], show_stats: bool = False) -> Tuple[Li
     Returns:
         Tuple of (sorted list, statistics dictionary)
     """
-    n = len(arr)
-    stats = {
+    arr, stats = registry_sort(arr, 'bubble', ascending=False)
+    return arr, _finish_stats(stats, len(arr))
+
+
+def bubble_sort_ascending(arr: List[int], show_stats: bool = False) -> Tuple[List[int], dict]:
+    """
+    Sorts a list in ascending order using Bubble Sort.
+    
+    Args:
+        arr: List of integers to sort
+        show_stats: If True, track comparison and swap statistics
+        
+    Returns:
+        Tuple of (sorted list, statistics dictionary)
+    """
+    arr, stats = registry_sort(arr, 'bubble', ascending=True)
+    return arr, _finish_stats(stats, len(arr))
+
+
+class ConsoleProgress(SortObserver):
+    """Prints a sort's progress in 5% steps (the registry sorts report a work fraction)."""
+    
+    def __init__(self):
+        self.shown = 0
+    
+    def step(self, data: List[int], position: int, fraction: float) -> bool:
+        percent = int(fraction * 20) * 5
+        if percent > self.shown:
+            self.shown = percent
+            print(f"\rProgress: {percent:.1f}% complete...", end='', flush=True)
+        return True
+
+
+def registry_sort(arr: List[int], algorithm: str, ascending: bool = True) -> Tuple[List[int], dict]:
+    """
+    Sort arr in place with the instrumented variant of a sortlib registry algorithm.
+    
+    Args:
+        arr: List of integers to sort
+        algorithm: Registry name, e.g. 'bubble', 'insertion' or 'merge'
+        ascending: Sort order
+        
+    Returns:
+        Tuple of (sorted list, statistics dictionary)
+    """
+    observer = ConsoleProgress() if len(arr) > PROGRESS_THRESHOLD else None
+    sort_stats = get_algorithm(algorithm).instrumented(arr, reverse=not ascending, observer=observer)
+    if observer is not None:
+        print()  # New line after progress bar
+    
+    stats = _new_stats()
+    stats.update(sort_stats.as_dict())
+    return arr, stats
+
+
+def comparison_sort(arr: List[int], algorithm: str, variant: str,
+                    ascending: bool) -> Tuple[List[int], dict]:
+    """
+    Sort with a registry algorithm; bubble sort uses the selected variant.
+    
+    Returns:
+        Tuple of (sorted list, statistics dictionary; non-bubble sorts add 'algorithm')
+    """
+    if algorithm == 'bubble':
+        return exchange_sort(arr, variant, ascending)
+    arr, stats = registry_sort(arr, algorithm, ascending)
+    stats['algorithm'] = algorithm
+    return arr, stats
+
+
+def _new_stats() -> dict:
+    """Create an empty statistics dictionary shared by all exchange sorts."""
+    return {
         'comparisons': 0,
         'swaps': 0,
         'passes': 0,
-        'early_termination': False
+        'early_termination': False,
+        'passes_saved': 0
     }
+
+
+def _finish_stats(stats: dict, n: int) -> dict:
+    """Fill in passes saved relative to the n passes of an unoptimized bubble sort."""
+    stats['passes_saved'] = max(0, n - stats['passes'])
+    stats['early_termination'] = stats['passes_saved'] > 0
+    return stats
+
+
+def _variant_sort(arr: List[int], algorithm: str, ascending: bool) -> Tuple[List[int], dict]:
+    """Run a registry bubble sort variant and report passes saved against classic bubble sort."""
+    arr, stats = registry_sort(arr, algorithm, ascending)
+    return arr, _finish_stats(stats, len(arr))
+
+
+def bubble_sort_last_swap(arr: List[int], ascending: bool = True) -> Tuple[List[int], dict]:
+    """
+    Bubble Sort that bounds each pass by the position of the last swap
+    (sortlib 'last-swap').
     
-    # Traverse through all array elements
-    for i in range(n):
-        swapped = False
-        stats['passes'] += 1
+    Args:
+        arr: List of integers to sort
+        ascending: Sort order
         
-        # Last i elements are already in place
-        for j in range(0, n - i - 1):
-            stats['comparisons'] += 1
-            
-            # Change '>' to '<' for Descending Order
-            if arr[j] < arr[j + 1]: 
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-                stats['swaps'] += 1
-        
-        # Show progress for large datasets
-        if n > PROGRESS_THRESHOLD and (i + 1) % max(1, n // 20) == 0:
-            progress = ((i + 1) / n) * 100
-            print(f"\rProgress: {progress:.1f}% complete...", end='', flush=True)
-                
-        # If no swaps occurred, the array is already sorted
-        if not swapped:
-            stats['early_termination'] = True
-            stats['passes_saved'] = n - i - 1
-            break
+    Returns:
+        Tuple of (sorted list, statistics dictionary)
+    """
+    return _variant_sort(arr, 'last-swap', ascending)
+
+
+def cocktail_shaker_sort(arr: List[int], ascending: bool = True) -> Tuple[List[int], dict]:
+    """
+    Bidirectional bubble sort with last-swap bounds on both ends
+    (sortlib 'cocktail'). Each direction counts as one pass.
     
-    if n > PROGRESS_THRESHOLD:
-        print()  # New line after progress bar
+    Args:
+        arr: List of integers to sort
+        ascending: Sort order
         
-    return arr, stats
+    Returns:
+        Tuple of (sorted list, statistics dictionary)
+    """
+    return _variant_sort(arr, 'cocktail', ascending)
 
 
-def bubble_sort_ascending(arr: List[int], show_stats: bool = False) -> Tuple[List[int], dict]:
+def comb_sort(arr: List[int], ascending: bool = True) -> Tuple[List[int], dict]:
     """
-    Sorts a list in ascending order using Bubble Sort.
+    Bubble sort over a gap sequence shrinking by 1.3 per pass (sortlib 'comb').
     
     Args:
         arr: List of integers to sort
-        show_stats: If True, track comparison and swap statistics
+        ascending: Sort order
+        
+    Returns:
+        Tuple of (sorted list, statistics dictionary)
+    """
+    return _variant_sort(arr, 'comb', ascending)
+
+
+def odd_even_sort(arr: List[int], ascending: bool = True) -> Tuple[List[int], dict]:
+    """
+    Odd-even transposition sort (sortlib 'odd-even'). Each phase counts as one pass.
+    
+    Args:
+        arr: List of integers to sort
+        ascending: Sort order
         
     Returns:
         Tuple of (sorted list, statistics dictionary)
     """
+    return _variant_sort(arr, 'odd-even', ascending)
+
+
+def exchange_sort(arr: List[int], variant: str, ascending: bool) -> Tuple[List[int], dict]:
+    """
+    Sort with the selected bubble sort variant.
+    
+    Args:
+        arr: List of integers to sort (sorted in place)
+        variant: One of BUBBLE_VARIANTS
+        ascending: Sort order
+        
+    Returns:
+        Tuple of (sorted list, statistics dictionary)
+    """
+    if variant == 'classic':
+        if ascending:
+            return bubble_sort_ascending(arr)
+        return bubble_sort_descending(arr)
+    return BUBBLE_VARIANTS[variant](arr, ascending=ascending)
+
+
+BUBBLE_VARIANTS = {
+    'classic': None,
+    'last-swap': bubble_sort_last_swap,
+    'cocktail': cocktail_shaker_sort,
+    'comb': comb_sort,
+    'odd-even': odd_even_sort,
+}
+
+
+def compare_variants(numbers: List[int], ascending: bool) -> None:
+    """Run every variant on a copy of the input and print a comparison table."""
+    print("\n--- Variant Comparison ---")
+    print(f"{'Variant':<10} {'Comparisons':>15} {'Swaps':>15} {'Passes':>10} {'Passes Saved':>13} {'Time (s)':>10}")
+    for variant in BUBBLE_VARIANTS:
+        # Silence per-variant progress bars so the table stays readable
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start_time = time.time()
+            _, stats = exchange_sort(list(numbers), variant, ascending)
+            elapsed = time.time() - start_time
+        print(f"{variant:<10} {format_number(stats['comparisons']):>15} {format_number(stats['swaps']):>15} "
+              f"{format_number(stats['passes']):>10} {format_number(stats.get('passes_saved', 0)):>13} "
+              f"{elapsed:>10.4f}")
+
+
+def analyze_presortedness(arr: List[int], ascending: bool = True) -> dict:
+    """
+    Measure how sorted the input already is, relative to the target order.
+    
+    Runs and descents are counted in one C-level pairwise pass; the number
+    of inversions is estimated from a fixed-seed random sample of pairs.
+    
+    Args:
+        arr: List of integers
+        ascending: Target sort order
+        
+    Returns:
+        Dictionary with runs, descents, ascents, inversions_estimate,
+        sorted and reversed flags
+    """
     n = len(arr)
-    stats = {
-        'comparisons': 0,
-        'swaps': 0,
-        'passes': 0,
-        'early_termination': False
+    if n < 2:
+        return {'runs': n, 'descents': 0, 'ascents': 0, 'inversions_estimate': 0,
+                'sorted': True, 'reversed': False, 'sampled_pairs': 0}
+    
+    out_of_order = operator.gt if ascending else operator.lt
+    strictly_in_order = operator.lt if ascending else operator.gt
+    descents = sum(map(out_of_order, arr, islice(arr, 1, None)))
+    ascents = sum(map(strictly_in_order, arr, islice(arr, 1, None)))
+    
+    rng = random.Random(n)
+    total_pairs = n * (n - 1) // 2
+    sampled_pairs = min(INVERSION_SAMPLE_PAIRS, total_pairs)
+    inverted = 0
+    for _ in range(sampled_pairs):
+        i, j = sorted(rng.sample(range(n), 2))
+        if out_of_order(arr[i], arr[j]):
+            inverted += 1
+    
+    return {
+        'runs': descents + 1,
+        'descents': descents,
+        'ascents': ascents,
+        'inversions_estimate': round(inverted / sampled_pairs * total_pairs),
+        'sorted': descents == 0,
+        'reversed': ascents == 0 and descents > 0,
+        'sampled_pairs': sampled_pairs
     }
+
+
+def _merge_runs(arr: List[int], boundaries: List[int], reverse_runs: bool,
+                ascending: bool) -> List[int]:
+    """Split arr at the boundaries into runs and k-way merge them."""
+    edges = [0] + boundaries + [len(arr)]
+    runs = [arr[start:end] for start, end in zip(edges, edges[1:])]
+    if reverse_runs:
+        for run in runs:
+            run.reverse()
+    return list(heapq.merge(*runs, reverse=not ascending))
+
+
+def presorted_fast_path(arr: List[int], ascending: bool = True) -> Tuple[Optional[List[int]], dict]:
+    """
+    Sort in linear (or near-linear) time if the input is already largely ordered.
+    
+    Shortcuts:
+        sorted   - nothing to do
+        reversed - a single O(n) reverse
+        few runs - natural runs in either direction are merged in O(n log r)
     
-    for i in range(n):
-        swapped = False
-        stats['passes'] += 1
+    Args:
+        arr: List of integers (sorted in place when a shortcut applies)
+        ascending: Target sort order
         
-        for j in range(0, n - i - 1):
-            stats['comparisons'] += 1
-            
-            if arr[j] > arr[j + 1]: 
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-                stats['swaps'] += 1
-        
-        # Show progress for large datasets
-        if n > PROGRESS_THRESHOLD and (i + 1) % max(1, n // 20) == 0:
-            progress = ((i + 1) / n) * 100
-            print(f"\rProgress: {progress:.1f}% complete...", end='', flush=True)
-                
-        if not swapped:
-            stats['early_termination'] = True
-            stats['passes_saved'] = n - i - 1
+    Returns:
+        Tuple of (sorted list or None if no shortcut applies, presort info dict)
+    """
+    n = len(arr)
+    info = analyze_presortedness(arr, ascending)
+    info['decision'] = 'fallback'
+    
+    if info['sorted']:
+        info['decision'] = 'already sorted'
+        return arr, info
+    
+    if info['reversed']:
+        arr.reverse()
+        info['decision'] = 'reversed (O(n) reverse)'
+        return arr, info
+    
+    # Few runs in the target direction, or few runs that are each reversed
+    out_of_order = operator.gt if ascending else operator.lt
+    strictly_in_order = operator.lt if ascending else operator.gt
+    if info['descents'] + 1 <= FEW_RUNS_THRESHOLD:
+        boundaries = list(compress(range(1, n), map(out_of_order, arr, islice(arr, 1, None))))
+        arr[:] = _merge_runs(arr, boundaries, False, ascending)
+        info['decision'] = f"{info['descents'] + 1} ascending runs merged"
+        return arr, info
+    
+    if info['ascents'] + 1 <= FEW_RUNS_THRESHOLD:
+        boundaries = list(compress(range(1, n), map(strictly_in_order, arr, islice(arr, 1, None))))
+        arr[:] = _merge_runs(arr, boundaries, True, ascending)
+        info['decision'] = f"{info['ascents'] + 1} reversed runs flipped and merged"
+        return arr, info
+    
+    return None, info
+
+
+def _timed_silent_sort(numbers: List[int], variant: str, ascending: bool,
+                       algorithm: str) -> float:
+    """Time a sort of a copy of numbers with progress output suppressed."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start_time = time.perf_counter()
+        comparison_sort(list(numbers), algorithm, variant, ascending)
+        return time.perf_counter() - start_time
+
+
+def estimate_sort_time(numbers: List[int], variant: str, ascending: bool,
+                       algorithm: str = 'bubble') -> float:
+    """
+    Estimate how long the selected algorithm (and bubble sort variant)
+    would take on the full input.
+    
+    Small inputs are simply timed. Larger ones are sampled at an even stride
+    (which keeps global structure such as reversed order). Two sample sizes
+    are timed, and the growth exponent between them is used to extrapolate
+    to n.
+    """
+    n = len(numbers)
+    if n <= 2 * ESTIMATE_SAMPLE_SIZE:
+        return _timed_silent_sort(numbers, variant, ascending, algorithm)
+    
+    step = n // (2 * ESTIMATE_SAMPLE_SIZE)
+    large = list(numbers[::step])[:2 * ESTIMATE_SAMPLE_SIZE]
+    small = large[::2]
+    small_time = _timed_silent_sort(small, variant, ascending, algorithm)
+    large_time = _timed_silent_sort(large, variant, ascending, algorithm)
+    
+    exponent = 2.0
+    if small_time > 0 and large_time > 0:
+        exponent = min(2.0, max(1.0, math.log2(large_time / small_time)))
+    return large_time * (n / len(large)) ** exponent
+
+
+def _linear_stats(passes: int) -> dict:
+    """Statistics for the non-comparison sorts, in the bubble sort's format."""
+    stats = _new_stats()
+    stats['passes'] = passes
+    return stats
+
+
+def counting_sort(arr: List[int], ascending: bool = True, unique: bool = False,
+                  lo: Optional[int] = None, hi: Optional[int] = None) -> Tuple[List[int], dict]:
+    """
+    Counting sort for integers in a small range (O(n + range), sortlib 'counting').
+    
+    Args:
+        arr: List of integers
+        ascending: Sort order
+        unique: Emit each value once (duplicate removal in the same pass)
+        lo, hi: Known minimum and maximum, to skip recomputing them
+        
+    Returns:
+        Tuple of (sorted list, statistics dictionary)
+    """
+    result = counting_sorted(arr, not ascending, unique, lo, hi)
+    return result, _linear_stats(2 if arr else 0)
+
+
+def radix_sort(arr: List[int], ascending: bool = True, unique: bool = False,
+               lo: Optional[int] = None, hi: Optional[int] = None) -> Tuple[List[int], dict]:
+    """
+    LSD radix sort on 16-bit digits (O(n * digits), sortlib 'radix').
+    
+    Args:
+        arr: List of integers
+        ascending: Sort order
+        unique: Drop duplicates while scattering the final pass
+        lo, hi: Known minimum and maximum, to skip recomputing them
+        
+    Returns:
+        Tuple of (sorted list, statistics dictionary)
+    """
+    if not arr:
+        return [], _linear_stats(0)
+    if lo is None or hi is None:
+        lo, hi = min(arr), max(arr)
+    result = radix_sorted(arr, not ascending, unique, lo, hi)
+    return result, _linear_stats(radix_digits(lo, hi))
+
+
+def integer_sort(arr: List[int], algorithm: str, ascending: bool = True, unique: bool = False,
+                 lo: Optional[int] = None, hi: Optional[int] = None) -> Tuple[List[int], dict]:
+    """
+    Sort with counting or radix sort; 'auto' picks counting sort when the
+    value range fits a count list (sortlib counting_range_fits: at most
+    4 * n values, or 65,536 for small inputs). An explicit 'counting' on a
+    wider range falls back to radix sort with a note on stderr.
+    
+    Returns:
+        Tuple of (sorted list, statistics dictionary with the chosen 'algorithm')
+    """
+    if arr and (lo is None or hi is None):
+        lo, hi = min(arr), max(arr)
+    fits = bool(arr) and counting_range_fits(len(arr), lo, hi)
+    if algorithm == 'auto':
+        algorithm = 'counting' if fits else 'radix'
+    elif algorithm == 'counting' and arr and not fits:
+        print(f"Note: value range {lo}..{hi} is too wide for counting sort of "
+              f"{format_number(len(arr))} numbers (limit {format_number(counting_range_limit(len(arr)))} "
+              f"values); using radix sort", file=sys.stderr)
+        algorithm = 'radix'
+    sort_func = counting_sort if algorithm == 'counting' else radix_sort
+    result, stats = sort_func(arr, ascending, unique, lo, hi)
+    stats['algorithm'] = algorithm
+    return result, stats
+
+
+def sort_numbers(numbers: List[int], ascending: bool, algorithm: str = 'bubble',
+                 variant: str = 'classic', presort_check: bool = True, unique: bool = False,
+                 lo: Optional[int] = None, hi: Optional[int] = None
+                 ) -> Tuple[List[int], dict, Optional[dict]]:
+    """
+    Sort a copy of numbers with the selected algorithm.
+    
+    This is the shared sort path for single-file and batch runs.
+    
+    Args:
+        numbers: Numbers to sort (left unchanged)
+        ascending: Sort order
+        algorithm: A sortlib registry name ('bubble', 'insertion', 'merge', ...)
+            or one of LINEAR_ALGORITHMS
+        variant: Bubble sort variant used when algorithm is 'bubble'
+        presort_check: Try the presortedness shortcuts before a comparison sort
+        unique: Remove duplicates
+        lo, hi: Known minimum and maximum (used by the linear sorts)
+        
+    Returns:
+        Tuple of (sorted list, algorithm statistics, presort info or None)
+    """
+    if algorithm in LINEAR_ALGORITHMS:
+        sorted_numbers, algo_stats = integer_sort(list(numbers), algorithm, ascending,
+                                                  unique=unique, lo=lo, hi=hi)
+        return sorted_numbers, algo_stats, None
+    
+    numbers_to_sort = list(set(numbers)) if unique else list(numbers)
+    presort = None
+    sorted_numbers = None
+    if presort_check:
+        sorted_numbers, presort = presorted_fast_path(numbers_to_sort, ascending)
+    
+    if sorted_numbers is None:
+        sorted_numbers, algo_stats = comparison_sort(numbers_to_sort, algorithm, variant, ascending)
+    else:
+        # The pre-pass made two pairwise passes plus the inversion sample
+        algo_stats = {
+            'comparisons': 2 * max(0, len(sorted_numbers) - 1) + presort['sampled_pairs'],
+            'swaps': 0,
+            'passes': 1,
+            'early_termination': False,
+            'passes_saved': 0
+        }
+    return sorted_numbers, algo_stats, presort
+
+
+def _parse_block_by_line(block: bytes, first_line: int) -> array:
+    """
+    Parse a block line by line, reporting the line number of bad input.
+    
+    Args:
+        block: Raw bytes containing complete lines
+        first_line: Line number of the first line in the block
+        
+    Returns:
+        array('q') of the integers in the block
+        
+    Raises:
+        ValueError: If a non-empty line is not a valid 64-bit integer
+    """
+    numbers = array('q')
+    for line_number, line in enumerate(block.split(b'\n'), first_line):
+        text = line.strip()
+        if not text:
+            continue
+        try:
+            numbers.append(int(text))
+        except ValueError:
+            raise ValueError(f"line {line_number}: invalid integer {text.decode(errors='replace')!r}")
+        except OverflowError:
+            raise ValueError(f"line {line_number}: {text.decode(errors='replace')} is outside the 64-bit range")
+    return numbers
+
+
+def _parse_block(block: bytes, first_line: int) -> array:
+    """
+    Parse a block of complete lines into integers in one batch.
+    
+    The fast path splits the whole block at once and converts with map(int),
+    which runs in C. It is only taken when no line can hold more than one
+    value: either the tokens plus the \n and \r\n line endings add up to
+    the whole block, or no whitespace within a line is followed by a value.
+    Otherwise, or on a conversion error, the block is re-parsed line by
+    line so the error report keeps its line number. Blank lines are
+    skipped either way.
+    """
+    tokens = block.split()
+    if (sum(map(len, tokens)) + block.count(b'\n') + block.count(b'\r\n') == len(block)
+            or not SPACE_BEFORE_VALUE.search(block)):
+        try:
+            return array('q', map(int, tokens))
+        except (ValueError, OverflowError):
+            pass
+    return _parse_block_by_line(block, first_line)
+
+
+def iter_number_blocks(path: str, block_size: int = READ_BLOCK_SIZE) -> Iterator[array]:
+    """
+    Read integers (one per line) from a text file in large blocks.
+    
+    Files ending in the varint output suffix are decoded instead, so a
+    --output-format varint result can be read back as input.
+    
+    Args:
+        path: Input file path
+        block_size: Number of bytes read per block
+        
+    Yields:
+        array('q') batches of parsed integers, in file order
+    """
+    with open(path, 'rb') as f:
+        if is_varint_file(path):
+            yield from iter_varint_blocks(f, block_size)
+        else:
+            yield from iter_stream_blocks(f, block_size)
+
+
+def is_varint_file(path: str) -> bool:
+    """True for files named like --output-format varint results."""
+    return path.endswith(OUTPUT_SUFFIXES['varint'])
+
+
+def iter_stream_blocks(f: BinaryIO, block_size: int = READ_BLOCK_SIZE) -> Iterator[array]:
+    """Like iter_number_blocks, but for an open binary stream such as stdin."""
+    first_line = 1
+    carry = b''
+    
+    while True:
+        chunk = f.read(block_size)
+        if not chunk:
             break
+        
+        # Only parse complete lines; keep the partial last line for later
+        chunk = carry + chunk
+        cut = chunk.rfind(b'\n') + 1
+        if cut == 0:
+            carry = chunk
+            continue
+        
+        carry = chunk[cut:]
+        yield _parse_block(chunk[:cut], first_line)
+        first_line += chunk.count(b'\n', 0, cut)
     
-    if n > PROGRESS_THRESHOLD:
-        print()
+    if carry:
+        yield _parse_block(carry, first_line)
+
+
+def _cache_path(path: str) -> str:
+    """Path of the binary sidecar for an input file."""
+    return path + BINARY_CACHE_SUFFIX
+
+
+def _read_binary_cache(path: str) -> Optional[array]:
+    """Load numbers from the binary sidecar if it matches the current input file."""
+    cache_path = _cache_path(path)
+    if not os.path.exists(cache_path):
+        return None
+    
+    source = os.stat(path)
+    with open(cache_path, 'rb') as f:
+        header = f.read(BINARY_CACHE_HEADER.size)
+        if len(header) != BINARY_CACHE_HEADER.size:
+            return None
+        magic, size, mtime_ns = BINARY_CACHE_HEADER.unpack(header)
+        if magic != BINARY_CACHE_MAGIC or size != source.st_size or mtime_ns != source.st_mtime_ns:
+            return None
         
-    return arr, stats
+        numbers = array('q')
+        payload = f.read()
+        if len(payload) % numbers.itemsize:
+            return None
+        numbers.frombytes(payload)
+    
+    if sys.byteorder != 'little':
+        numbers.byteswap()
+    return numbers
+
+
+def _write_binary_cache(path: str, numbers: array) -> None:
+    """Write numbers to the binary sidecar (little-endian int64)."""
+    source = os.stat(path)
+    payload = numbers
+    if sys.byteorder != 'little':
+        payload = array('q', numbers)
+        payload.byteswap()
+    
+    with open(_cache_path(path), 'wb') as f:
+        f.write(BINARY_CACHE_HEADER.pack(BINARY_CACHE_MAGIC, source.st_size, source.st_mtime_ns))
+        payload.tofile(f)
+
+
+def stream_extremes(path: str, k: int, largest: bool = True) -> Tuple[List[int], dict]:
+    """
+    Find the K largest (or smallest) numbers in a file without loading it.
+    
+    Each parsed block is merged with the current K candidates using
+    heapq.nlargest/nsmallest. Memory is one block plus K values, and time
+    is O(n log K).
+    
+    Args:
+        path: Input file path
+        k: Number of extreme values to keep
+        largest: True for the top K, False for the bottom K
+        
+    Returns:
+        Tuple of (K values, largest first for top / smallest first for bottom,
+        and a statistics dictionary with seconds, bytes, count)
+    """
+    select = heapq.nlargest if largest else heapq.nsmallest
+    start_time = time.perf_counter()
+    candidates = []
+    count = 0
+    for block in iter_number_blocks(path):
+        count += len(block)
+        candidates = select(k, chain(candidates, block))
+    return candidates, {
+        'seconds': time.perf_counter() - start_time,
+        'bytes': os.path.getsize(path),
+        'count': count
+    }
+
+
+def _mix64(value: int) -> int:
+    """SplitMix64 finalizer; spreads integer keys uniformly over 64 bits."""
+    z = (value + 0x9E3779B97F4A7C15) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+class StreamingStats:
+    """
+    Single-pass statistics accumulator fed one block of numbers at a time.
+    
+    Count, sum and sum of squares are kept as Python ints, so the mean and
+    variance are exact. Distinct values are tracked in a set until
+    DISTINCT_EXACT_LIMIT is exceeded. After that the set is folded into a
+    HyperLogLog sketch, so memory stays bounded.
+    """
+    
+    def __init__(self, distinct_limit: int = DISTINCT_EXACT_LIMIT):
+        self.count = 0
+        self.total = 0
+        self.total_squares = 0
+        self.min = None
+        self.max = None
+        self.seconds = 0.0
+        self.distinct_limit = distinct_limit
+        self._distinct = set()
+        self._registers = None
+    
+    def update(self, block) -> None:
+        """Add a block (array or list) of integers."""
+        if not block:
+            return
+        start_time = time.perf_counter()
+        self.count += len(block)
+        self.total += sum(block)
+        self.total_squares += sum(map(operator.mul, block, block))
+        low, high = min(block), max(block)
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        
+        if self._registers is None:
+            self._distinct.update(block)
+            if len(self._distinct) > self.distinct_limit:
+                self._registers = bytearray(1 << HLL_PRECISION)
+                self._add_to_sketch(self._distinct)
+                self._distinct = set()
+        else:
+            self._add_to_sketch(block)
+        self.seconds += time.perf_counter() - start_time
+    
+    def _add_to_sketch(self, values) -> None:
+        registers = self._registers
+        index_shift = 64 - HLL_PRECISION
+        rest_mask = (1 << index_shift) - 1
+        for value in values:
+            h = _mix64(value)
+            rank = index_shift - (h & rest_mask).bit_length() + 1
+            index = h >> index_shift
+            if rank > registers[index]:
+                registers[index] = rank
+    
+    @property
+    def distinct_exact(self) -> bool:
+        return self._registers is None
+    
+    @property
+    def distinct_count(self) -> int:
+        """Exact distinct count, or the HyperLogLog estimate (capped at count)."""
+        if self._registers is None:
+            return len(self._distinct)
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return min(self.count, round(estimate))
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    @property
+    def variance(self) -> float:
+        """Population variance, from exact integer sums."""
+        if not self.count:
+            return 0.0
+        return (self.count * self.total_squares - self.total * self.total) / (self.count * self.count)
+    
+    def as_dict(self) -> dict:
+        """Statistics in the format returned by calculate_statistics."""
+        if not self.count:
+            return {}
+        unique_count = self.distinct_count
+        return {
+            'min': self.min,
+            'max': self.max,
+            'range': self.max - self.min,
+            'count': self.count,
+            'mean': self.mean,
+            'variance': self.variance,
+            'std_dev': math.sqrt(self.variance),
+            'unique_count': unique_count,
+            'duplicate_count': self.count - unique_count,
+            'distinct_exact': self.distinct_exact
+        }
+
+
+def read_numbers(path: str, use_cache: bool = False,
+                 stats: Optional[StreamingStats] = None) -> Tuple[array, dict]:
+    """
+    Read all integers from a file using the bulk block reader.
+    
+    Args:
+        path: Input file path
+        use_cache: If True, read from / write to a binary .i64 sidecar so
+                   repeat runs skip text parsing entirely
+        stats: Optional accumulator fed with each block as it is parsed
+        
+    Returns:
+        Tuple of (array('q') of numbers, read statistics dictionary)
+        
+    Raises:
+        ValueError: If a line is not a valid integer (message has the line number)
+    """
+    start_time = time.perf_counter()
+    # A varint file is already binary, so it gets no sidecar
+    use_cache = use_cache and not is_varint_file(path)
+    numbers = _read_binary_cache(path) if use_cache else None
+    if numbers is not None:
+        source = 'binary cache'
+    else:
+        source = 'varint' if is_varint_file(path) else 'text'
+    
+    if numbers is not None and stats is not None:
+        stats.update(numbers)
+    
+    if numbers is None:
+        numbers = array('q')
+        for block in iter_number_blocks(path):
+            numbers.extend(block)
+            if stats is not None:
+                stats.update(block)
+        if use_cache:
+            _write_binary_cache(path, numbers)
+    
+    seconds = time.perf_counter() - start_time
+    return numbers, {
+        'seconds': seconds,
+        'bytes': os.path.getsize(path),
+        'count': len(numbers),
+        'source': source
+    }
 
 
 def calculate_statistics(numbers: List[int]) -> dict:
-    """Calculate basic statistics about the dataset."""
-    if not numbers:
-        return {}
+    """Calculate basic statistics about the dataset in a single pass."""
+    stats = StreamingStats()
+    stats.update(numbers)
+    return stats.as_dict()
+
+
+def _iter_chunks(numbers: Iterable[int]) -> Iterator[List[int]]:
+    """Split any iterable of numbers into lists of WRITE_CHUNK_SIZE."""
+    iterator = iter(numbers)
+    while True:
+        chunk = list(islice(iterator, WRITE_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _encode_varint_chunk(chunk: List[int], previous: int) -> Tuple[bytes, int]:
+    """
+    Varint-delta encode one chunk; returns (bytes, last value) to continue from.
+    
+    Each value is stored as the difference from the previous one (the first
+    from 0), zigzag-encoded as an LEB128 varint. Sorted data therefore has
+    small deltas, usually 1-2 bytes each.
+    """
+    out = bytearray()
+    for value in chunk:
+        delta = value - previous
+        previous = value
+        zigzag = (delta << 1) if delta >= 0 else ((-delta << 1) - 1)
+        while zigzag > 0x7F:
+            out.append((zigzag & 0x7F) | 0x80)
+            zigzag >>= 7
+        out.append(zigzag)
+    return bytes(out), previous
+
+
+def _decode_varint_chunk(data: bytes, previous: int) -> Tuple[array, int, int]:
+    """
+    Decode the complete varints in data, continuing from the previous value.
+    
+    Returns:
+        Tuple of (array('q') of values, last value, bytes consumed); bytes
+        after the last complete varint belong to the next chunk
+    """
+    numbers = array('q')
+    append = numbers.append
+    zigzag = shift = consumed = 0
+    for index, byte in enumerate(data):
+        zigzag |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        delta = (zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1)
+        previous += delta
+        append(previous)
+        zigzag = shift = 0
+        consumed = index + 1
+    return numbers, previous, consumed
+
+
+def decode_varint_deltas(data: bytes) -> array:
+    """
+    Decode a complete varint-format output (see write_stream) into array('q').
+    
+    Raises:
+        ValueError: If data ends inside a varint
+    """
+    numbers, _, consumed = _decode_varint_chunk(data, 0)
+    if consumed != len(data):
+        raise ValueError(f"Truncated varint data: {len(data) - consumed} trailing bytes")
+    return numbers
+
+
+def iter_varint_blocks(f: BinaryIO, block_size: int = READ_BLOCK_SIZE) -> Iterator[array]:
+    """Decode a varint-format stream block by block, like iter_stream_blocks for text."""
+    previous = 0
+    carry = b''
+    while True:
+        chunk = f.read(block_size)
+        if not chunk:
+            break
+        chunk = carry + chunk
+        numbers, previous, consumed = _decode_varint_chunk(chunk, previous)
+        carry = chunk[consumed:]
+        yield numbers
+    if carry:
+        raise ValueError(f"Truncated varint data: {len(carry)} trailing bytes")
+
+
+def write_stream(out_f: BinaryIO, numbers: Iterable[int], output_format: str = 'text') -> Tuple[int, int]:
+    """
+    Write numbers to an open binary stream in WRITE_CHUNK_SIZE chunks.
+    
+    Args:
+        out_f: Binary file object (a file or sys.stdout.buffer)
+        numbers: Any iterable of integers, e.g. a list or a k-way merge
+        output_format: 'text' (one per line), 'int64' (raw little-endian
+                       int64) or 'varint' (zigzag delta varints)
+        
+    Returns:
+        Tuple of (numbers written, bytes written)
+    """
+    if output_format not in OUTPUT_SUFFIXES:
+        raise ValueError(f"Unknown output format: {output_format}")
+    
+    count = written = previous = 0
+    for chunk in _iter_chunks(numbers):
+        count += len(chunk)
+        if output_format == 'text':
+            written += out_f.write(('\n'.join(map(str, chunk)) + '\n').encode('ascii'))
+        elif output_format == 'varint':
+            data, previous = _encode_varint_chunk(chunk, previous)
+            written += out_f.write(data)
+        else:
+            packed = array('q', chunk)
+            if sys.byteorder == 'big':
+                packed.byteswap()
+            written += out_f.write(packed.tobytes())
+    return count, written
+
+
+def write_numbers(path: str, numbers: List[int], output_format: str = 'text') -> dict:
+    """
+    Write sorted numbers in bulk.
+    
+    Args:
+        path: Output file path
+        numbers: Numbers to write
+        output_format: 'text' (one per line), 'int64' (raw little-endian
+                       int64) or 'varint' (zigzag delta varints)
+        
+    Returns:
+        Write statistics dictionary (seconds, bytes, count)
+    """
+    start_time = time.perf_counter()
+    with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as out_f:
+        count, written = write_stream(out_f, numbers, output_format)
     
     return {
-        'min': min(numbers),
-        'max': max(numbers),
-        'range': max(numbers) - min(numbers),
-        'unique_count': len(set(numbers)),
-        'duplicate_count': len(numbers) - len(set(numbers))
+        'seconds': time.perf_counter() - start_time,
+        'bytes': written,
+        'count': count
     }
 
 
@@ -153,6 +1034,13 @@ Examples:
   python bubblesort_improved.py -a                 # Sort in ascending order
   python bubblesort_improved.py --stats            # Show algorithm statistics
   python bubblesort_improved.py --sample           # Show sample instead of full output
+  python bubblesort_improved.py --variant cocktail # Bidirectional bubble sort
+  python bubblesort_improved.py --compare-variants # Compare all variants' statistics
+  python bubblesort_improved.py --algorithm auto   # Linear-time counting/radix sort
+  python bubblesort_improved.py --output-format varint  # Compact binary output
+  python bubblesort_improved.py --top 100          # 100 largest numbers, streamed
+  python bubblesort_improved.py --batch 'data/*.txt' --algorithm auto --workers 8
+  cat data.txt | python bubblesort_improved.py --stream --algorithm auto > sorted.txt
         """
     )
     
@@ -180,13 +1068,398 @@ Examples:
                         action='store_true',
                         help='Do not save results to output file')
     
+    parser.add_argument('--output-format',
+                        choices=list(OUTPUT_SUFFIXES),
+                        default='text',
+                        help='Output file format: text lines, raw int64, or zigzag delta '
+                             'varints (default: text)')
+    
+    parser.add_argument('--print-all',
+                        action='store_true',
+                        help=f'Print the full sorted list even above {CONSOLE_PRINT_LIMIT:,} numbers')
+    
+    extremes = parser.add_mutually_exclusive_group()
+    extremes.add_argument('--top',
+                          type=int,
+                          metavar='K',
+                          help='Stream the file and output only the K largest numbers')
+    extremes.add_argument('--bottom',
+                          type=int,
+                          metavar='K',
+                          help='Stream the file and output only the K smallest numbers')
+    
     parser.add_argument('--remove-duplicates',
                         action='store_true',
                         help='Remove duplicate numbers before sorting')
     
+    parser.add_argument('--variant',
+                        choices=list(BUBBLE_VARIANTS),
+                        default='classic',
+                        help='Bubble sort variant (default: classic)')
+    
+    parser.add_argument('--algorithm',
+                        choices=list(dict.fromkeys(algorithm_names() + list(LINEAR_ALGORITHMS))),
+                        default='bubble',
+                        help='Sorting algorithm: a shared sortlib algorithm or a linear '
+                             'integer sort; auto picks counting sort for small value '
+                             'ranges and radix sort otherwise (default: bubble)')
+    
+    parser.add_argument('--compare-variants',
+                        action='store_true',
+                        help='Run every variant on the input and print a statistics comparison')
+    
+    parser.add_argument('--no-presort-check',
+                        dest='presort_check',
+                        action='store_false',
+                        help='Skip the presortedness check and its O(n) shortcuts')
+    
+    parser.add_argument('--stream',
+                        action='store_true',
+                        help='Read integers from stdin and write sorted output to stdout')
+    
+    parser.add_argument('--memory-budget',
+                        type=int,
+                        default=DEFAULT_MEMORY_BUDGET_MB,
+                        metavar='MB',
+                        help='In-memory run size for --stream; larger inputs are merged '
+                             f'from temporary run files (default: {DEFAULT_MEMORY_BUDGET_MB})')
+    
+    parser.add_argument('--batch',
+                        metavar='DIR|GLOB',
+                        help='Sort every *.txt file in DIR (or matching GLOB) in parallel; '
+                             'outputs are written next to each input as NAME.sorted.EXT')
+    
+    parser.add_argument('--workers',
+                        type=int,
+                        help='Worker processes for --batch (default: CPU count)')
+    
+    parser.add_argument('--memory-limit',
+                        type=int,
+                        metavar='MB',
+                        help='Address-space limit per --batch worker in MB (POSIX only)')
+    
+    parser.add_argument('--binary-cache',
+                        action='store_true',
+                        help=f'Cache parsed numbers in a binary {BINARY_CACHE_SUFFIX} sidecar for faster repeat runs')
+    
     return parser.parse_args()
 
 
+def _spill_run(directory: str, index: int, numbers: List[int]) -> str:
+    """Write one sorted run to a temporary int64 file and return its path."""
+    path = os.path.join(directory, f"run_{index:05d}{BINARY_CACHE_SUFFIX}")
+    write_numbers(path, numbers, 'int64')
+    return path
+
+
+def _iter_run(path: str) -> Iterator[int]:
+    """Read a spilled int64 run back in blocks."""
+    per_block = READ_BLOCK_SIZE // 8
+    with open(path, 'rb') as f:
+        while True:
+            block = array('q')
+            try:
+                block.fromfile(f, per_block)
+            except EOFError:
+                pass  # fromfile keeps the items read before hitting EOF
+            if not block:
+                return
+            if sys.byteorder == 'big':
+                block.byteswap()
+            yield from block
+
+
+def sort_stream(in_f: BinaryIO, out_f: BinaryIO, options: dict,
+                memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB) -> dict:
+    """
+    External sort from one binary stream to another.
+    
+    Input is parsed in blocks. Whenever the buffered numbers reach the
+    memory budget, they are sorted into a run and spilled to an int64
+    file in the system temp directory. If everything fits in one run, it is
+    sorted and written directly. Otherwise the runs are combined with a
+    k-way heapq.merge.
+    
+    A run can hold millions of numbers, so quadratic algorithms (bubble,
+    insertion, ...) are replaced by the linear 'auto' integer sort.
+    
+    Args:
+        in_f: Binary input stream with one integer per line
+        out_f: Binary output stream
+        options: ascending, algorithm, variant, presort_check, unique and
+                 output_format settings
+        memory_budget_mb: Approximate memory allowed for one in-memory run
+        
+    Returns:
+        Statistics dictionary (count, written, runs, seconds)
+    """
+    start_time = time.perf_counter()
+    capacity = max(1, memory_budget_mb * 1024 * 1024 // LIST_BYTES_PER_NUMBER)
+    algorithm = options['algorithm']
+    if algorithm not in LINEAR_ALGORITHMS and get_algorithm(algorithm).quadratic:
+        print(f"Stream mode: sorting runs with --algorithm auto instead of "
+              f"{get_algorithm(algorithm).label} (O(n²) on runs of up to "
+              f"{format_number(capacity)} numbers)", file=sys.stderr)
+        algorithm = 'auto'
+    
+    def sort_run(numbers):
+        sorted_numbers, _, _ = sort_numbers(
+            numbers, options['ascending'], algorithm, options['variant'],
+            presort_check=options['presort_check'], unique=options['unique'])
+        return sorted_numbers
+    
+    count = 0
+    runs = []
+    pending = array('q')
+    with tempfile.TemporaryDirectory(prefix='bubblesort_runs_') as run_dir:
+        for block in iter_stream_blocks(in_f):
+            pending.extend(block)
+            count += len(block)
+            while len(pending) >= capacity:
+                runs.append(_spill_run(run_dir, len(runs), sort_run(pending[:capacity])))
+                del pending[:capacity]
+                print(f"Spilled run {len(runs)} ({format_number(count)} numbers read)", file=sys.stderr)
+        
+        if not runs:
+            written = write_stream(out_f, sort_run(pending), options['output_format'])[0]
+        else:
+            if pending:
+                runs.append(_spill_run(run_dir, len(runs), sort_run(pending)))
+            del pending
+            print(f"Merging {len(runs)} runs...", file=sys.stderr)
+            merged = heapq.merge(*(_iter_run(path) for path in runs),
+                                 reverse=not options['ascending'])
+            if options['unique']:
+                merged = (value for value, _ in groupby(merged))
+            written = write_stream(out_f, merged, options['output_format'])[0]
+        out_f.flush()
+    
+    return {
+        'count': count,
+        'written': written,
+        'runs': max(1, len(runs)),
+        'seconds': time.perf_counter() - start_time
+    }
+
+
+def run_stream(args: argparse.Namespace) -> int:
+    """Handle --stream: sort stdin to stdout, with status messages on stderr."""
+    options = {
+        'ascending': args.ascending,
+        'algorithm': args.algorithm,
+        'variant': args.variant,
+        'presort_check': args.presort_check,
+        'unique': args.remove_duplicates,
+        'output_format': args.output_format
+    }
+    out_f = sys.stdout.buffer
+    try:
+        # Sort progress bars go to stderr so stdout carries only the data
+        with contextlib.redirect_stdout(sys.stderr):
+            stats = sort_stream(sys.stdin.buffer, out_f, options, args.memory_budget)
+    except ValueError as e:
+        print(f"Error: invalid input on stdin: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); silence the final flush
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    
+    seconds = max(stats['seconds'], 1e-9)
+    print(f"Sorted {format_number(stats['count'])} numbers "
+          f"({format_number(stats['written'])} written, {stats['runs']} run(s)) "
+          f"in {stats['seconds']:.3f}s, {format_number(int(stats['count'] / seconds))} numbers/s",
+          file=sys.stderr)
+    return 0
+
+
+def resolve_batch_inputs(pattern: str) -> List[str]:
+    """
+    Expand a --batch argument into input files.
+    
+    A directory selects every *.txt file in it. Anything else is treated as
+    a glob pattern. Outputs from an earlier batch run are skipped.
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.txt')
+    paths = sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+    return [path for path in paths
+            if BATCH_OUTPUT_TAG not in os.path.basename(path)
+            and not path.endswith(BINARY_CACHE_SUFFIX)]
+
+
+def batch_output_path(input_path: str, output_format: str) -> str:
+    """Output path next to the input, e.g. data.txt -> data.sorted.txt."""
+    stem = os.path.splitext(input_path)[0]
+    return stem + BATCH_OUTPUT_TAG + OUTPUT_SUFFIXES[output_format]
+
+
+def _limit_worker_memory(memory_mb: Optional[int]) -> None:
+    """Process pool initializer: cap the worker's address space (POSIX only)."""
+    if memory_mb and resource is not None:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def sort_file(input_path: str, options: dict) -> dict:
+    """
+    Read, sort and write a single file. Runs inside a batch worker.
+    
+    Args:
+        input_path: Input file path
+        options: ascending, algorithm, variant, presort_check, unique,
+                 output_format and binary_cache settings
+        
+    Returns:
+        A summary row (see BATCH_REPORT_FIELDS). Errors are reported in the
+        row instead of being raised, so one bad file doesn't stop the batch.
+    """
+    row = dict.fromkeys(BATCH_REPORT_FIELDS, '')
+    row['file'] = input_path
+    start_time = time.perf_counter()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            stream_stats = StreamingStats()
+            numbers, read_stats = read_numbers(input_path, use_cache=options['binary_cache'],
+                                               stats=stream_stats)
+            pre_stats = stream_stats.as_dict()
+            
+            sort_start = time.perf_counter()
+            sorted_numbers, algo_stats, _ = sort_numbers(
+                numbers, options['ascending'], options['algorithm'], options['variant'],
+                presort_check=options['presort_check'], unique=options['unique'],
+                lo=pre_stats.get('min'), hi=pre_stats.get('max'))
+            sort_seconds = time.perf_counter() - sort_start
+            
+            output_path = batch_output_path(input_path, options['output_format'])
+            write_stats = write_numbers(output_path, sorted_numbers, options['output_format'])
+        
+        total_seconds = time.perf_counter() - start_time
+        row.update({
+            'status': 'ok',
+            'numbers': len(numbers),
+            'bytes': read_stats['bytes'],
+            'algorithm': algo_stats.get('algorithm', f"bubble/{options['variant']}"),
+            'read_seconds': round(read_stats['seconds'], 6),
+            'sort_seconds': round(sort_seconds, 6),
+            'write_seconds': round(write_stats['seconds'], 6),
+            'total_seconds': round(total_seconds, 6),
+            'numbers_per_second': int(len(numbers) / max(total_seconds, 1e-9)),
+            'min': pre_stats.get('min', ''),
+            'max': pre_stats.get('max', ''),
+            'mean': round(pre_stats['mean'], 3) if pre_stats else '',
+            'duplicates': pre_stats.get('duplicate_count', ''),
+            'output': output_path
+        })
+    except MemoryError:
+        row.update(status='error', error='worker memory limit exceeded')
+    except (ValueError, OSError) as e:
+        row.update(status='error', error=str(e))
+    row['total_seconds'] = row['total_seconds'] or round(time.perf_counter() - start_time, 6)
+    return row
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Handle --batch: sort many files concurrently and write a summary report."""
+    inputs = resolve_batch_inputs(args.batch)
+    if not inputs:
+        print(f"Error: no input files match '{args.batch}'.")
+        return 1
+    if args.memory_limit and resource is None:
+        print("Warning: --memory-limit is not supported on this platform; ignoring it.")
+    
+    options = {
+        'ascending': args.ascending,
+        'algorithm': args.algorithm,
+        'variant': args.variant,
+        'presort_check': args.presort_check,
+        'unique': args.remove_duplicates,
+        'output_format': args.output_format,
+        'binary_cache': args.binary_cache
+    }
+    workers = args.workers or os.cpu_count() or 1
+    print(f"Batch: {format_number(len(inputs))} files, {workers} workers"
+          + (f", {args.memory_limit} MB per worker" if args.memory_limit and resource else ""))
+    
+    rows = []
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_limit_worker_memory,
+                             initargs=(args.memory_limit,)) as pool:
+        futures = [pool.submit(sort_file, path, options) for path in inputs]
+        for done, future in enumerate(as_completed(futures), 1):
+            row = future.result()
+            rows.append(row)
+            outcome = f"{row['total_seconds']:.3f}s" if row['status'] == 'ok' else f"ERROR: {row['error']}"
+            print(f"[{done}/{len(inputs)}] {os.path.basename(row['file'])}: {outcome}")
+    elapsed = time.perf_counter() - start_time
+    rows.sort(key=lambda r: r['file'])
+    
+    report_dir = args.batch if os.path.isdir(args.batch) else os.path.dirname(inputs[0])
+    report_path = os.path.join(report_dir, BATCH_REPORT_FILE)
+    with open(report_path, 'w', newline='') as report_f:
+        writer = csv.DictWriter(report_f, fieldnames=BATCH_REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    
+    print("\n" + "=" * 78)
+    print(f"{'File':<28} {'Numbers':>12} {'Bytes':>12} {'Time (s)':>10} {'Numbers/s':>12}")
+    print("-" * 78)
+    for row in rows:
+        name = os.path.basename(row['file'])[:28]
+        if row['status'] == 'ok':
+            print(f"{name:<28} {format_number(row['numbers']):>12} {format_number(row['bytes']):>12} "
+                  f"{row['total_seconds']:>10.3f} {format_number(row['numbers_per_second']):>12}")
+        else:
+            print(f"{name:<28} {'ERROR: ' + row['error']}")
+    print("-" * 78)
+    ok_rows = [row for row in rows if row['status'] == 'ok']
+    total_numbers = sum(row['numbers'] for row in ok_rows)
+    print(f"{len(ok_rows)}/{len(rows)} files sorted, {format_number(total_numbers)} numbers "
+          f"in {elapsed:.3f}s wall time")
+    print(f"Summary report saved to: '{report_path}'")
+    print("=" * 78)
+    return 0 if len(ok_rows) == len(rows) else 1
+
+
+def run_extremes(args: argparse.Namespace, input_path: str, output_path: str,
+                 output_name: str) -> int:
+    """Handle --top/--bottom: stream the input and report only the K extremes."""
+    largest = args.top is not None
+    k = args.top if largest else args.bottom
+    label = "Top" if largest else "Bottom"
+    if k <= 0:
+        print(f"Error: --{label.lower()} must be a positive integer.")
+        return 1
+    
+    print(f"Streaming {args.input} for the {label.lower()} {format_number(k)} numbers...")
+    try:
+        extremes, read_stats = stream_extremes(input_path, k, largest)
+    except ValueError as e:
+        print(f"Error: The file contains non-numeric data. Please check {args.input}.")
+        print(f"Details: {e}")
+        return 1
+    
+    if not extremes:
+        print("Error: The file is empty or contains no valid numbers.")
+        return 1
+    
+    seconds = max(read_stats['seconds'], 1e-9)
+    print(f"Scanned {format_number(read_stats['count'])} numbers in {read_stats['seconds']:.4f}s "
+          f"({format_number(int(read_stats['count'] / seconds))} numbers/s, "
+          f"{read_stats['bytes'] / seconds / 1e6:.1f} MB/s)")
+    
+    print(f"\n{label} {format_number(len(extremes))}:")
+    if len(extremes) <= CONSOLE_PRINT_LIMIT or args.print_all:
+        print(extremes)
+    else:
+        display_sample(extremes, SAMPLE_SIZE)
+    
+    if not args.no_save:
+        write_numbers(output_path, extremes, args.output_format)
+        print(f"\n{label} {format_number(len(extremes))} saved to: '{output_name}' ({args.output_format})")
+    return 0
+
+
 def main():
     """
     Main function that orchestrates the file reading, sorting, and output display.
@@ -194,12 +1467,20 @@ def main():
     # Parse command-line arguments
     args = parse_arguments()
     
+    if args.stream:
+        return run_stream(args)
+    if args.batch:
+        return run_batch(args)
+    
     # Get the directory where this script is currently located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
     # Build full file paths
     input_path = os.path.join(script_dir, args.input)
-    output_path = os.path.join(script_dir, args.output)
+    output_name = args.output
+    if args.output == DEFAULT_OUTPUT_FILE and args.output_format != 'text':
+        output_name = os.path.splitext(args.output)[0] + OUTPUT_SUFFIXES[args.output_format]
+    output_path = os.path.join(script_dir, output_name)
     
     # Check if file exists
     if not os.path.exists(input_path):
@@ -208,51 +1489,56 @@ def main():
         print(f"Current directory: {script_dir}")
         return 1
 
+    if args.top is not None or args.bottom is not None:
+        return run_extremes(args, input_path, output_path, output_name)
+    
     print(f"Reading {args.input}...")
     
     try:
-        # Read all lines from the file
-        with open(input_path, 'r') as f:
-            # Convert each non-empty line to an integer
-            numbers = [int(line.strip()) for line in f if line.strip()]
+        # Read the file in large blocks and convert in batches
+        stream_stats = StreamingStats()
+        numbers, read_stats = read_numbers(input_path, use_cache=args.binary_cache, stats=stream_stats)
         
         if not numbers:
             print("Error: The file is empty or contains no valid numbers.")
             return 1
             
         print(f"Successfully loaded {format_number(len(numbers))} numbers.")
+        seconds = max(read_stats['seconds'], 1e-9)
+        print(f"Parse throughput: {format_number(int(read_stats['count'] / seconds))} numbers/s, "
+              f"{read_stats['bytes'] / seconds / 1e6:.1f} MB/s "
+              f"({read_stats['seconds']:.4f}s from {read_stats['source']})")
         
-        # Calculate pre-sort statistics
-        pre_stats = calculate_statistics(numbers)
+        # Pre-sort statistics were accumulated while the blocks were parsed
+        pre_stats = stream_stats.as_dict()
         
         if pre_stats:
             print(f"Range: {format_number(pre_stats['min'])} to {format_number(pre_stats['max'])}")
+            print(f"Mean: {pre_stats['mean']:,.3f}, Std dev: {pre_stats['std_dev']:,.3f} "
+                  f"(statistics cost {stream_stats.seconds:.4f}s during read)")
             if pre_stats['duplicate_count'] > 0:
-                print(f"Duplicates found: {format_number(pre_stats['duplicate_count'])}")
-        
-        # Remove duplicates if requested
-        if args.remove_duplicates and pre_stats['duplicate_count'] > 0:
-            original_count = len(numbers)
-            numbers = list(set(numbers))
-            print(f"Removed {format_number(original_count - len(numbers))} duplicates.")
+                approx = "" if pre_stats['distinct_exact'] else "~"
+                print(f"Duplicates found: {approx}{format_number(pre_stats['duplicate_count'])}")
         
-        # Create a copy to preserve original
-        numbers_to_sort = numbers.copy()
+        linear = args.algorithm in LINEAR_ALGORITHMS
         
         sort_order = "ascending" if args.ascending else "descending"
         print(f"Sorting in {sort_order} order... (This may take a moment for large datasets)")
         
         # Measure time and sort
         start_time = time.time()
-        
-        if args.ascending:
-            sorted_numbers, algo_stats = bubble_sort_ascending(numbers_to_sort, show_stats=args.stats)
-        else:
-            sorted_numbers, algo_stats = bubble_sort_descending(numbers_to_sort, show_stats=args.stats)
-        
+        sorted_numbers, algo_stats, presort = sort_numbers(
+            numbers, args.ascending, args.algorithm, args.variant,
+            presort_check=args.presort_check, unique=args.remove_duplicates,
+            lo=pre_stats['min'], hi=pre_stats['max'])
         end_time = time.time()
         time_taken = end_time - start_time
         
+        if presort is not None:
+            print(f"Presort check: {presort['decision']}")
+        if len(sorted_numbers) < len(numbers):
+            print(f"Removed {format_number(len(numbers) - len(sorted_numbers))} duplicates.")
+        
         # Display Results
         print("\n" + "=" * 50)
         print("RESULTS")
@@ -263,6 +1549,13 @@ def main():
         # Show algorithm statistics if requested
         if args.stats:
             print("\n--- Algorithm Statistics ---")
+            if args.algorithm == 'bubble':
+                sort_label = f"Variant: {args.variant}"
+            else:
+                sort_label = f"Algorithm: {algo_stats.get('algorithm', args.algorithm)} sort"
+            if presort is not None and presort['decision'] != 'fallback':
+                sort_label += " (skipped by presort shortcut)"
+            print(sort_label)
             print(f"Comparisons: {format_number(algo_stats['comparisons'])}")
             print(f"Swaps: {format_number(algo_stats['swaps'])}")
             print(f"Passes: {format_number(algo_stats['passes'])}")
@@ -270,29 +1563,53 @@ def main():
                 print(f"Early termination: Yes (saved {algo_stats['passes_saved']} passes)")
             else:
                 print("Early termination: No")
+            
+            if presort is not None:
+                print("\n--- Presortedness ---")
+                print(f"Runs: {format_number(presort['runs'])}")
+                print(f"Descents: {format_number(presort['descents'])}")
+                print(f"Inversions (estimated): {format_number(presort['inversions_estimate'])}")
+                print(f"Reversed: {'Yes' if presort['reversed'] else 'No'}")
+                print(f"Decision: {presort['decision']}")
+                if presort['decision'] != 'fallback':
+                    estimate = estimate_sort_time(numbers, args.variant, args.ascending,
+                                                  args.algorithm)
+                    name = args.variant if args.algorithm == 'bubble' else args.algorithm
+                    print(f"Estimated {name} time: {estimate:.6f} seconds")
+                    print(f"Time saved (estimated): {max(0.0, estimate - time_taken):.6f} seconds")
+        
+        if args.compare_variants:
+            compare_variants(numbers, args.ascending)
         
         # Display sorted data
         print(f"\nSorted Data ({sort_order.capitalize()}):")
         if args.sample and len(sorted_numbers) > SAMPLE_SIZE * 2:
             display_sample(sorted_numbers, SAMPLE_SIZE)
-        else:
+        elif len(sorted_numbers) <= CONSOLE_PRINT_LIMIT or args.print_all:
             print(sorted_numbers)
+        else:
+            display_sample(sorted_numbers, SAMPLE_SIZE)
+            print(f"(Showing a sample of {format_number(len(sorted_numbers))} numbers; "
+                  f"use --print-all to print everything)")
         
         # Display time at the end for easy visibility
         print(f"\nTime Taken: {time_taken:.6f} seconds")
         
         # Show performance note for large datasets
-        if len(sorted_numbers) > 10000:
+        if len(sorted_numbers) > 10000 and not linear and get_algorithm(args.algorithm).quadratic:
             theoretical_time = (len(sorted_numbers) ** 2) / 1000000
-            print(f"Note: Bubble Sort has O(n²) complexity. For {format_number(len(sorted_numbers))} items,")
+            label = get_algorithm(args.algorithm).label
+            print(f"Note: {label} has O(n²) complexity. For {format_number(len(sorted_numbers))} items,")
             print(f"      consider using Python's built-in sort() for better performance.")
         
         # Save to file unless --no-save flag is used
         if not args.no_save:
-            with open(output_path, 'w') as out_f:
-                for num in sorted_numbers:
-                    out_f.write(f"{num}\n")
-            print(f"\nSorted results saved to: '{args.output}'")
+            write_stats = write_numbers(output_path, sorted_numbers, args.output_format)
+            print(f"\nSorted results saved to: '{output_name}' ({args.output_format})")
+            seconds = max(write_stats['seconds'], 1e-9)
+            print(f"Write throughput: {format_number(int(write_stats['count'] / seconds))} numbers/s, "
+                  f"{write_stats['bytes'] / seconds / 1e6:.1f} MB/s "
+                  f"({format_number(write_stats['bytes'])} bytes in {write_stats['seconds']:.4f}s)")
         
         print("=" * 50)
         return 0
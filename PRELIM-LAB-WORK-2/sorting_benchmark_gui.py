@@ -1,81 +1,291 @@
+import os
+import sys
+import math
 import random
 import time
+import queue
+import multiprocessing
 import tkinter as tk
+from array import array
+from collections import OrderedDict
+from multiprocessing import shared_memory
 from tkinter import ttk, messagebox
 
+# The shared sortlib package lives at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from sortlib import available_algorithms, load_plugins, multiset_fingerprint, verify_sort
+from sortlib.recording import (
+    INDEX_MASK, OP_COMPARE, OP_SWAP, OP_WRITE, EventLogFull, decode_event,
+)
+
 
 # -------------------------------
 # Sorting Algorithms
 # -------------------------------
 
-def bubble_sort(arr):
-    n = len(arr)
-    for i in range(n):
-        swapped = False
-        for j in range(0, n - i - 1):
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-        if not swapped:
-            break
+# The sorts come from the shared sortlib registry, keyed by display label.
+# The plain variants take an optional progress callback that receives the
+# completed fraction (0.0-1.0) at most once per outer pass / 256 items.
+# Recorders append packed operations to an event log for the Visualize tab.
+
+load_plugins()
+ALGORITHMS = {info.label: info.sort for info in available_algorithms()}
+RECORDERS = {info.label: info.recorder for info in available_algorithms(recordable=True)}
+RECORD_COMPARES_LIMIT = 2000  # Larger inputs record only data movement
+
+
+# -------------------------------
+# Utility Functions
+# -------------------------------
 
+DISTRIBUTIONS = ["Random", "Sorted", "Reversed", "Nearly Sorted"]
+NEARLY_SORTED_SWAP_FRACTION = 0.01
+DATASET_CACHE_ITEMS = 10_000_000  # Total elements kept in the dataset cache
+
+# Generated datasets keyed by (size, seed, distribution), least recently used first
+dataset_cache = OrderedDict()
+
+
+def generate_dataset(size, seed=None, distribution="Random"):
+    # One getrandbits call yields all the randomness as a single integer;
+    # its bytes are reinterpreted as 64-bit words and reduced into [0, 10n].
+    rng = random.Random(seed)
+    words = array("Q")
+    if size > 0:
+        words.frombytes(rng.getrandbits(64 * size).to_bytes(8 * size, "little"))
+        if sys.byteorder == "big":
+            words.byteswap()
+    data = array("q", map((size * 10 + 1).__rmod__, words))
+
+    if distribution == "Sorted":
+        data = array("q", sorted(data))
+    elif distribution == "Reversed":
+        data = array("q", sorted(data, reverse=True))
+    elif distribution == "Nearly Sorted":
+        data = array("q", sorted(data))
+        for _ in range(max(1, int(size * NEARLY_SORTED_SWAP_FRACTION)) if size > 1 else 0):
+            i, j = rng.randrange(size), rng.randrange(size)
+            data[i], data[j] = data[j], data[i]
+    return data
+
+
+def get_dataset(size, seed, distribution):
+    # Unseeded requests always get fresh data, so only seeded ones are cached
+    if seed is None:
+        return generate_dataset(size, None, distribution)
+
+    key = (size, seed, distribution)
+    if key in dataset_cache:
+        dataset_cache.move_to_end(key)
+        return dataset_cache[key]
+
+    data = generate_dataset(size, seed, distribution)
+    dataset_cache[key] = data
+    while sum(len(d) for d in dataset_cache.values()) > DATASET_CACHE_ITEMS and len(dataset_cache) > 1:
+        dataset_cache.popitem(last=False)
+    return data
+
+
+def parse_sizes(text):
+    sizes = sorted({int(part) for part in text.replace(",", " ").split()})
+    if not sizes or sizes[0] <= 0:
+        raise ValueError
+    return sizes
 
-def insertion_sort(arr):
-    for i in range(1, len(arr)):
-        key = arr[i]
-        j = i - 1
-        while j >= 0 and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
 
+# -------------------------------
+# Worker Process
+# -------------------------------
 
-def merge_sort(arr):
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        left = arr[:mid]
-        right = arr[mid:]
+# Sorts run in a separate process so the Tk event loop never blocks
+# and Tk event handling never shows up in the measured time.
 
-        merge_sort(left)
-        merge_sort(right)
+POLL_INTERVAL_MS = 100
+PROGRESS_QUEUE_STEP = 0.01  # Single runs report progress in 1% steps
 
-        i = j = k = 0
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                arr[k] = left[i]
-                i += 1
-            else:
-                arr[k] = right[j]
-                j += 1
-            k += 1
 
-        while i < len(left):
-            arr[k] = left[i]
-            i += 1
-            k += 1
+def time_sort(algorithm, data, progress=None):
+    # The input fingerprint must be taken before the in-place sort; its
+    # time counts towards verification, never towards the sort.
+    data_copy = list(data)
+    fingerprint_start = time.perf_counter()
+    fingerprint = multiset_fingerprint(data_copy)
+    fingerprint_time = time.perf_counter() - fingerprint_start
 
-        while j < len(right):
-            arr[k] = right[j]
-            j += 1
-            k += 1
+    start_time = time.perf_counter()
+    if progress is None:
+        ALGORITHMS[algorithm](data_copy)
+    else:
+        ALGORITHMS[algorithm](data_copy, progress=progress)
+    end_time = time.perf_counter()
+
+    verification = verify_sort(data_copy, input_fingerprint=fingerprint)
+    return end_time - start_time, str(verification), fingerprint_time + verification.seconds
+
+
+def sort_worker(algorithm, data, dataset_label, result_queue):
+    # data arrives as array('q'), which pickles as one raw byte buffer
+    result_queue.put(("progress", "Sorting..."))
+    sent = 0.0
+
+    def progress(fraction):
+        # At most ~100 queue puts, so reporting barely shows in the timing
+        nonlocal sent
+        if fraction - sent >= PROGRESS_QUEUE_STEP:
+            sent = fraction
+            result_queue.put(("fraction", fraction))
+
+    elapsed, verification, verify_time = time_sort(algorithm, data, progress)
+    result_queue.put(("result", {
+        "algorithm": algorithm,
+        "size": len(data),
+        "dataset": dataset_label,
+        "elapsed": elapsed,
+        "verification": verification,
+        "verify_time": verify_time,
+    }))
+
+
+def sweep_worker(jobs, seed, distribution, result_queue):
+    # jobs: (algorithm, size) pairs; each size's dataset is generated once
+    datasets = {}
+    for number, (algorithm, size) in enumerate(jobs, 1):
+        result_queue.put(("progress", f"Sweep {number}/{len(jobs)}: {algorithm}, n={size}"))
+        if size not in datasets:
+            datasets = {size: generate_dataset(size, seed, distribution)}
+        elapsed, verification, _ = time_sort(algorithm, datasets[size])
+        result_queue.put(("point", {
+            "algorithm": algorithm,
+            "size": size,
+            "seed": seed,
+            "distribution": distribution,
+            "elapsed": elapsed,
+            "verification": verification,
+        }))
+    result_queue.put(("done", f"Sweep finished ({len(jobs)} new points)"))
+
+
+def race_worker(index, algorithm, shm_name, size, progress_values, result_queue):
+    # The dataset is read from shared memory rather than pickled per process
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf.cast("q")
+    data = view[:size].tolist()
+    view.release()
+    shm.close()
+
+    def progress(fraction):
+        progress_values[index] = fraction
+
+    elapsed, verification, verify_time = time_sort(algorithm, data, progress)
+    progress_values[index] = 1.0
+    result_queue.put(("finished", {
+        "algorithm": algorithm,
+        "elapsed": elapsed,
+        "verification": verification,
+        "verify_time": verify_time,
+    }))
+
+
+def record_worker(algorithm, data, result_queue):
+    result_queue.put(("progress", "Recording operations..."))
+    arr = list(data)
+    log = array("q")
+    truncated = False
+    start_time = time.perf_counter()
+    try:
+        RECORDERS[algorithm](arr, log, len(arr) <= RECORD_COMPARES_LIMIT)
+    except EventLogFull:
+        # Finish unrecorded; playback jumps to the final state at the end
+        truncated = True
+        ALGORITHMS[algorithm](arr)
+    end_time = time.perf_counter()
+
+    result_queue.put(("progress", "Sending event log..."))
+    result_queue.put(("recording", {
+        "algorithm": algorithm,
+        "initial": data,
+        "events": log,
+        "final": array("q", arr),
+        "truncated": truncated,
+        "elapsed": end_time - start_time,
+    }))
 
 
 # -------------------------------
-# Utility Functions
+# Complexity Fitting
 # -------------------------------
 
-def generate_dataset(size):
-    return [random.randint(0, size * 10) for _ in range(size)]
+COMPLEXITY_MODELS = {
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(max(n, 2)),
+    "O(n²)": lambda n: n * n,
+}
+
 
+def fit_complexity(points):
+    # points: [(n, seconds)]; returns (model, constant, log-log slope)
+    best = None
+    for model, f in COMPLEXITY_MODELS.items():
+        ratios = [math.log(t) - math.log(f(n)) for n, t in points]
+        mean = sum(ratios) / len(ratios)
+        error = sum((r - mean) ** 2 for r in ratios)
+        if best is None or error < best[2]:
+            best = (model, math.exp(mean), error)
 
-def is_sorted(arr):
-    return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    spread = sum((x - x_mean) ** 2 for x in xs)
+    slope = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / spread if spread else 0.0
+    return best[0], best[1], slope
 
 
 # -------------------------------
 # GUI Logic
 # -------------------------------
 
+workers = []
+result_queue = None
+run_started = 0.0
+current_stage = ""
+
+# Shared memory, progress values and finish order of the current race
+race = None
+
+# Finished sweep points, keyed by (algorithm, size, seed, distribution) -> seconds
+result_cache = {}
+
+
+def start_worker(target, args):
+    start_workers([(target, args)])
+
+
+def start_workers(jobs):
+    global workers, result_queue, run_started, current_stage
+
+    result_queue = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=target, args=args + (result_queue,), daemon=True)
+        for target, args in jobs
+    ]
+    for process in workers:
+        process.start()
+    run_started = time.perf_counter()
+    current_stage = "Starting worker..." if len(workers) == 1 else f"Starting {len(workers)} workers..."
+
+    for button in (run_button, sweep_button, race_button, record_button):
+        button.state(["disabled"])
+    cancel_button.state(["!disabled"])
+    status_text.set(current_stage)
+    root.after(POLL_INTERVAL_MS, poll_worker)
+
+
+def parse_seed(text):
+    text = text.strip()
+    return int(text) if text else None
+
+
 def run_sort():
     algorithm = algorithm_var.get()
     size_input = size_entry.get()
@@ -84,85 +294,708 @@ def run_sort():
         size = int(size_input)
         if size <= 0:
             raise ValueError
+        seed = parse_seed(single_seed_entry.get())
     except ValueError:
-        messagebox.showerror("Invalid Input", "Dataset size must be a positive integer.")
+        messagebox.showerror("Invalid Input", "Dataset size must be a positive integer and the seed an integer (or blank).")
         return
 
-    data = generate_dataset(size)
-    data_copy = data.copy()
-
-    if algorithm == "Bubble Sort":
-        sort_function = bubble_sort
-    elif algorithm == "Insertion Sort":
-        sort_function = insertion_sort
-    elif algorithm == "Merge Sort":
-        sort_function = merge_sort
-    else:
+    if algorithm not in ALGORITHMS:
         messagebox.showerror("Error", "Please select an algorithm.")
         return
 
+    distribution = distribution_var.get()
     start_time = time.perf_counter()
-    sort_function(data_copy)
-    end_time = time.perf_counter()
+    data = get_dataset(size, seed, distribution)
+    generation_time = time.perf_counter() - start_time
+
+    label = (f"{distribution}, seed {seed if seed is not None else 'random'} "
+             f"(ready in {generation_time:.3f}s)")
+    result_text.set("")
+    single_progress["value"] = 0
+    start_worker(sort_worker, (algorithm, data, label))
+
+
+def selected_sweep():
+    algorithms = [name for name, var in sweep_vars.items() if var.get()]
+    sizes = parse_sizes(sizes_entry.get())
+    seed = int(seed_entry.get())
+    return algorithms, sizes, seed
+
+
+def run_sweep():
+    try:
+        algorithms, sizes, seed = selected_sweep()
+    except ValueError:
+        messagebox.showerror("Invalid Input", "Sizes must be positive integers and the seed an integer.")
+        return
+
+    if not algorithms:
+        messagebox.showerror("Error", "Please select at least one algorithm.")
+        return
+
+    distribution = distribution_var.get()
+    jobs = [(algorithm, size) for size in sizes for algorithm in algorithms
+            if (algorithm, size, seed, distribution) not in result_cache]
+    draw_chart()
+    if not jobs:
+        status_text.set("All points cached")
+        return
+    start_worker(sweep_worker, (jobs, seed, distribution))
+
+
+def run_race():
+    global race, current_stage
+    try:
+        size = int(race_size_entry.get())
+        seed = int(race_seed_entry.get())
+        if size <= 0:
+            raise ValueError
+    except ValueError:
+        messagebox.showerror("Invalid Input", "Dataset size must be a positive integer and the seed an integer.")
+        return
+
+    distribution = distribution_var.get()
+    data = get_dataset(size, seed, distribution)
+    shm = shared_memory.SharedMemory(create=True, size=size * data.itemsize)
+    view = shm.buf.cast("q")
+    view[:size] = data
+    view.release()
+
+    progress_values = multiprocessing.Array("d", len(ALGORITHMS), lock=False)
+    race = {"shm": shm, "progress": progress_values, "finished": 0}
+    for name in ALGORITHMS:
+        race_bars[name]["value"] = 0
+        race_labels[name].set("")
+
+    start_workers([
+        (race_worker, (index, name, shm.name, size, progress_values))
+        for index, name in enumerate(ALGORITHMS)
+    ])
+    current_stage = f"Racing on {size:,} items ({distribution}, seed {seed})"
+    status_text.set(current_stage)
+
+
+def update_race():
+    waited = time.perf_counter() - run_started
+    for index, name in enumerate(ALGORITHMS):
+        race_bars[name]["value"] = race["progress"][index] * 100
+        if not race_labels[name].get().startswith("#"):
+            race_labels[name].set(f"{waited:.1f}s")
+
+
+def finish_race_entry(result):
+    race["finished"] += 1
+    name = result["algorithm"]
+    race_bars[name]["value"] = 100
+    race_labels[name].set(
+        f"#{race['finished']}  {result['elapsed']:.4f}s  {result['verification']}"
+    )
+    return race["finished"] == len(ALGORITHMS)
+
+
+def close_race():
+    global race
+    if race is not None:
+        race["shm"].close()
+        race["shm"].unlink()
+        race = None
+
+
+def drain_queue():
+    global current_stage
+    try:
+        while True:
+            kind, payload = result_queue.get_nowait()
+            if kind == "progress":
+                current_stage = payload
+            elif kind == "fraction":
+                single_progress["value"] = payload * 100
+                current_stage = f"Sorting... {payload:.0%}"
+            elif kind == "point":
+                key = (payload["algorithm"], payload["size"], payload["seed"], payload["distribution"])
+                if payload["verification"] == "SUCCESS":
+                    result_cache[key] = payload["elapsed"]
+                draw_chart()
+            elif kind == "result":
+                single_progress["value"] = 100
+                show_result(payload)
+                finish_run("Done")
+                return True
+            elif kind == "done":
+                finish_run(payload)
+                return True
+            elif kind == "finished":
+                if finish_race_entry(payload):
+                    finish_run("Race finished")
+                    return True
+            elif kind == "recording":
+                finish_run(
+                    f"Recorded {len(payload['events']):,} events in {payload['elapsed']:.3f}s"
+                    + (" (log full, truncated)" if payload["truncated"] else "")
+                )
+                start_playback(payload)
+                return True
+    except queue.Empty:
+        return False
+
+
+def poll_worker():
+    if not workers:
+        return
+
+    failed = [process.exitcode for process in workers if process.exitcode not in (None, 0)]
+    running = any(process.is_alive() for process in workers)
+    if drain_queue():
+        return
+
+    if race is not None:
+        update_race()
 
-    elapsed_time = end_time - start_time
-    verification = "SUCCESS" if is_sorted(data_copy) else "FAILED"
+    if failed or not running:
+        finish_run(f"Worker exited unexpectedly (exit codes {failed or [0]})")
+        return
+
+    waited = time.perf_counter() - run_started
+    status_text.set(f"{current_stage} ({waited:.1f}s)")
+    root.after(POLL_INTERVAL_MS, poll_worker)
 
+
+def show_result(result):
     result_text.set(
-        f"Algorithm: {algorithm}\n"
-        f"Dataset Size: {size}\n"
-        f"Execution Time: {elapsed_time:.6f} seconds\n"
-        f"Verification: {verification}"
+        f"Algorithm: {result['algorithm']}\n"
+        f"Dataset Size: {result['size']}\n"
+        f"Dataset: {result['dataset']}\n"
+        f"Execution Time: {result['elapsed']:.6f} seconds\n"
+        f"Verification: {result['verification']} "
+        f"(order + permutation, {result['verify_time']:.6f} seconds)"
     )
 
 
+def cancel_sort():
+    if any(process.is_alive() for process in workers):
+        finish_run("Cancelled")
+
+
+def finish_run(status):
+    global workers
+    for process in workers:
+        if process.is_alive():
+            process.terminate()
+    for process in workers:
+        process.join(timeout=1)
+    workers = []
+    close_race()
+    for button in (run_button, sweep_button, race_button, record_button):
+        button.state(["!disabled"])
+    cancel_button.state(["disabled"])
+    status_text.set(status)
+
+
+def on_close():
+    cancel_sort()
+    stop_playback()
+    root.destroy()
+
+
+# -------------------------------
+# Playback Visualizer
+# -------------------------------
+
+# Playback runs at a fixed frame rate. Each frame applies a batch of
+# events (decimation) to a shadow copy of the list and then moves only
+# the bars whose columns changed. Inputs wider than the canvas share one
+# bar per pixel column, drawn from the column's first element.
+
+VIS_WIDTH = 600
+VIS_HEIGHT = 300
+PLAYBACK_FPS = 30
+MAX_VISUALIZE_SIZE = 100_000
+BAR_COLOR = "#7a9cc6"
+HIGHLIGHT_COLOR = "#d62728"
+SORTED_COLOR = "#2ca02c"
+
+playback = None
+last_recording = None
+
+
+def run_visualize():
+    algorithm = vis_algorithm_var.get()
+    try:
+        size = int(vis_size_entry.get())
+        seed = parse_seed(vis_seed_entry.get())
+        if not 0 < size <= MAX_VISUALIZE_SIZE:
+            raise ValueError
+    except ValueError:
+        messagebox.showerror(
+            "Invalid Input",
+            f"Dataset size must be between 1 and {MAX_VISUALIZE_SIZE:,} and the seed an integer (or blank)."
+        )
+        return
+
+    stop_playback()
+    data = get_dataset(size, seed, distribution_var.get())
+    start_worker(record_worker, (algorithm, data))
+
+
+def start_playback(recording):
+    global playback, last_recording
+    stop_playback()
+    last_recording = recording
+
+    state = list(recording["initial"])
+    n = len(state)
+    columns = min(n, VIS_WIDTH)
+    width = VIS_WIDTH / columns
+    scale = (VIS_HEIGHT - 10) / (max(max(state), 1))
+    vis_canvas.delete("all")
+    bars = [
+        vis_canvas.create_rectangle(
+            c * width, VIS_HEIGHT - state[c * n // columns] * scale,
+            (c + 1) * width, VIS_HEIGHT, fill=BAR_COLOR, width=0
+        )
+        for c in range(columns)
+    ]
+
+    total = len(recording["events"])
+    per_frame = max(1, math.ceil(total / (playback_seconds_var.get() * PLAYBACK_FPS)))
+    playback = {
+        "state": state,
+        "events": recording["events"],
+        "total": total,
+        "position": 0,
+        "per_frame": per_frame,
+        "bars": bars,
+        "columns": columns,
+        "width": width,
+        "scale": scale,
+        "highlighted": set(),
+        "paused": False,
+        "next_frame": time.perf_counter(),
+        "recording": recording,
+    }
+    pause_button.state(["!disabled"])
+    replay_button.state(["!disabled"])
+    root.after(0, playback_frame)
+
+
+def redraw_column(column, color=None):
+    pb = playback
+    state = pb["state"]
+    value = state[column * len(state) // pb["columns"]]
+    x0 = column * pb["width"]
+    vis_canvas.coords(pb["bars"][column], x0, VIS_HEIGHT - value * pb["scale"],
+                      x0 + pb["width"], VIS_HEIGHT)
+    if color is not None:
+        vis_canvas.itemconfigure(pb["bars"][column], fill=color)
+
+
+def playback_frame():
+    pb = playback
+    if pb is None or pb["paused"]:
+        return
+
+    state = pb["state"]
+    events = pb["events"]
+    n = len(state)
+    columns = pb["columns"]
+    start = pb["position"]
+    end = min(pb["total"], start + pb["per_frame"])
+
+    dirty = set()
+    for k in range(start, end):
+        event = events[k]
+        op = event & 3
+        if op == OP_COMPARE:
+            continue
+        a = (event >> 2) & INDEX_MASK
+        b = event >> 32
+        if op == OP_SWAP:
+            state[a], state[b] = state[b], state[a]
+            dirty.add(a * columns // n)
+            dirty.add(b * columns // n)
+        elif op == OP_WRITE:
+            state[a] = b
+            dirty.add(a * columns // n)
+        else:
+            state.insert(b, state.pop(a))
+            dirty.update(range(b * columns // n, a * columns // n + 1))
+    pb["position"] = end
+
+    # Highlight the indices touched by the last event of the frame
+    highlight = set()
+    if end > start:
+        op, a, b = decode_event(events[end - 1])
+        highlight.add(a * columns // n)
+        if op != OP_WRITE:
+            highlight.add(b * columns // n)
+
+    for column in pb["highlighted"] - highlight:
+        redraw_column(column, BAR_COLOR)
+    for column in dirty - highlight - pb["highlighted"]:
+        redraw_column(column)
+    for column in highlight:
+        redraw_column(column, HIGHLIGHT_COLOR)
+    pb["highlighted"] = highlight
+
+    if end >= pb["total"]:
+        finish_playback()
+        return
+
+    vis_status_text.set(f"Event {end:,} / {pb['total']:,} ({pb['per_frame']:,} per frame)")
+    pb["next_frame"] += 1 / PLAYBACK_FPS
+    delay = max(1, int((pb["next_frame"] - time.perf_counter()) * 1000))
+    root.after(delay, playback_frame)
+
+
+def finish_playback():
+    pb = playback
+    recording = pb["recording"]
+    if recording["truncated"]:
+        pb["state"][:] = recording["final"]
+    for column in range(pb["columns"]):
+        redraw_column(column, SORTED_COLOR)
+    pause_button.state(["disabled"])
+    note = " (log was truncated; jumped to the final state)" if recording["truncated"] else ""
+    vis_status_text.set(f"{recording['algorithm']}: played {pb['total']:,} events{note}")
+
+
+def toggle_pause():
+    if playback is None:
+        return
+    playback["paused"] = not playback["paused"]
+    pause_button.configure(text="Resume" if playback["paused"] else "Pause")
+    if not playback["paused"]:
+        playback["next_frame"] = time.perf_counter()
+        root.after(0, playback_frame)
+
+
+def replay():
+    if last_recording is not None:
+        start_playback(last_recording)
+
+
+def stop_playback():
+    global playback
+    playback = None
+    pause_button.configure(text="Pause")
+    pause_button.state(["disabled"])
+
+
+# -------------------------------
+# Scaling Chart
+# -------------------------------
+
+CHART_WIDTH = 600
+CHART_HEIGHT = 320
+CHART_MARGIN = 50
+CHART_COLORS = {
+    "Bubble Sort": "#d62728",
+    "Insertion Sort": "#1f77b4",
+    "Merge Sort": "#2ca02c",
+    "Bubble Sort (Last Swap)": "#ff7f0e",
+    "Cocktail Shaker Sort": "#9467bd",
+    "Comb Sort": "#8c564b",
+    "Odd-Even Sort": "#e377c2",
+    "Counting Sort": "#7f7f7f",
+    "Radix Sort": "#17becf",
+}
+SWEEP_CHECKBOXES_PER_ROW = 5
+
+
+def draw_chart():
+    chart.delete("all")
+    fit_text.set("")
+    try:
+        algorithms, sizes, seed = selected_sweep()
+    except ValueError:
+        return
+
+    distribution = distribution_var.get()
+    series = {}
+    for algorithm in algorithms:
+        points = [(n, result_cache[(algorithm, n, seed, distribution)]) for n in sizes
+                  if (algorithm, n, seed, distribution) in result_cache]
+        if points:
+            series[algorithm] = [(n, max(t, 1e-9)) for n, t in points]
+    if not series:
+        chart.create_text(CHART_WIDTH / 2, CHART_HEIGHT / 2, text="No results yet", fill="gray")
+        return
+
+    all_points = [p for points in series.values() for p in points]
+    x_lo = math.floor(math.log10(min(n for n, _ in all_points)))
+    x_hi = math.ceil(math.log10(max(n for n, _ in all_points)))
+    y_lo = math.floor(math.log10(min(t for _, t in all_points)))
+    y_hi = math.ceil(math.log10(max(t for _, t in all_points)))
+    x_hi = max(x_hi, x_lo + 1)
+    y_hi = max(y_hi, y_lo + 1)
+
+    left, top = CHART_MARGIN, 15
+    right, bottom = CHART_WIDTH - 15, CHART_HEIGHT - 35
+
+    def to_canvas(n, t):
+        x = left + (math.log10(n) - x_lo) / (x_hi - x_lo) * (right - left)
+        y = bottom - (math.log10(t) - y_lo) / (y_hi - y_lo) * (bottom - top)
+        return x, y
+
+    # Axes with one tick per decade
+    chart.create_rectangle(left, top, right, bottom, outline="black")
+    for k in range(x_lo, x_hi + 1):
+        x, _ = to_canvas(10 ** k, 10 ** y_lo)
+        chart.create_line(x, top, x, bottom, fill="#e5e5e5")
+        chart.create_text(x, bottom + 10, text=f"1e{k}", font=("Segoe UI", 7))
+    for k in range(y_lo, y_hi + 1):
+        _, y = to_canvas(10 ** x_lo, 10 ** k)
+        chart.create_line(left, y, right, y, fill="#e5e5e5")
+        chart.create_text(left - 20, y, text=f"1e{k}", font=("Segoe UI", 7))
+    chart.create_text((left + right) / 2, CHART_HEIGHT - 10, text="Dataset size n (log)")
+    chart.create_text(12, (top + bottom) / 2, text="Time s (log)", angle=90)
+
+    summaries = []
+    for row, (algorithm, points) in enumerate(series.items()):
+        color = CHART_COLORS.get(algorithm, "black")
+        for n, t in points:
+            x, y = to_canvas(n, t)
+            chart.create_oval(x - 3, y - 3, x + 3, y + 3, fill=color, outline=color)
+
+        if len(points) >= 2:
+            model, constant, slope = fit_complexity(points)
+            f = COMPLEXITY_MODELS[model]
+            n_lo, n_hi = points[0][0], points[-1][0]
+            curve = []
+            for step in range(41):
+                n = n_lo * (n_hi / n_lo) ** (step / 40)
+                curve.extend(to_canvas(n, max(constant * f(n), 1e-9)))
+            chart.create_line(*curve, fill=color, dash=(4, 2))
+            summaries.append(f"{algorithm}: best fit {model}, log-log slope {slope:.2f}")
+
+        chart.create_text(left + 8, top + 10 + row * 14, text=algorithm, fill=color,
+                          anchor="w", font=("Segoe UI", 8, "bold"))
+
+    fit_text.set("\n".join(summaries))
+
+
+def clear_cache():
+    result_cache.clear()
+    draw_chart()
+    status_text.set("Result cache cleared")
+
+
 # -------------------------------
 # GUI Setup
 # -------------------------------
 
-root = tk.Tk()
-root.title("Sorting Algorithm Benchmark")
-root.geometry("420x320")
-root.resizable(False, False)
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Sorting Algorithm Benchmark")
+    root.geometry("660x680")
+    root.resizable(False, False)
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
+    # Dataset distribution shared by all modes
+    dataset_frame = ttk.Frame(root, padding=(10, 10, 10, 0))
+    dataset_frame.pack(fill="x")
+
+    ttk.Label(dataset_frame, text="Distribution:").pack(side="left")
+    distribution_var = tk.StringVar(value=DISTRIBUTIONS[0])
+    distribution_dropdown = ttk.Combobox(
+        dataset_frame,
+        textvariable=distribution_var,
+        state="readonly",
+        values=DISTRIBUTIONS,
+        width=16
+    )
+    distribution_dropdown.pack(side="left", padx=5)
+    distribution_dropdown.bind("<<ComboboxSelected>>", lambda event: draw_chart())
 
-main_frame = ttk.Frame(root, padding=20)
-main_frame.pack(fill="both", expand=True)
+    notebook = ttk.Notebook(root)
+    notebook.pack(fill="both", expand=True, padx=10, pady=(10, 0))
 
-title_label = ttk.Label(
-    main_frame,
-    text="Comparative Analysis of Sorting Algorithms",
-    font=("Segoe UI", 11, "bold"),
-    anchor="center"
-)
-title_label.pack(pady=(0, 15))
-
-algorithm_var = tk.StringVar()
-algorithm_dropdown = ttk.Combobox(
-    main_frame,
-    textvariable=algorithm_var,
-    state="readonly",
-    values=["Bubble Sort", "Insertion Sort", "Merge Sort"]
-)
-algorithm_dropdown.pack(fill="x")
-algorithm_dropdown.set("Bubble Sort")
+    # Single run tab
+    main_frame = ttk.Frame(notebook, padding=20)
+    notebook.add(main_frame, text="Single Run")
 
-size_label = ttk.Label(main_frame, text="Dataset Size:")
-size_label.pack(pady=(15, 5))
+    title_label = ttk.Label(
+        main_frame,
+        text="Comparative Analysis of Sorting Algorithms",
+        font=("Segoe UI", 11, "bold"),
+        anchor="center"
+    )
+    title_label.pack(pady=(0, 15))
+
+    algorithm_var = tk.StringVar()
+    algorithm_dropdown = ttk.Combobox(
+        main_frame,
+        textvariable=algorithm_var,
+        state="readonly",
+        values=list(ALGORITHMS)
+    )
+    algorithm_dropdown.pack(fill="x")
+    algorithm_dropdown.set("Bubble Sort")
 
-size_entry = ttk.Entry(main_frame)
-size_entry.pack(fill="x")
-size_entry.insert(0, "10000")
+    size_label = ttk.Label(main_frame, text="Dataset Size:")
+    size_label.pack(pady=(15, 5))
 
-run_button = ttk.Button(main_frame, text="Run Benchmark", command=run_sort)
-run_button.pack(pady=15)
+    size_entry = ttk.Entry(main_frame)
+    size_entry.pack(fill="x")
+    size_entry.insert(0, "10000")
 
-result_text = tk.StringVar()
-result_label = ttk.Label(
-    main_frame,
-    textvariable=result_text,
-    justify="left",
-    wraplength=380
-)
-result_label.pack(pady=10)
+    single_seed_label = ttk.Label(main_frame, text="Seed (blank for a new random dataset):")
+    single_seed_label.pack(pady=(15, 5))
+
+    single_seed_entry = ttk.Entry(main_frame)
+    single_seed_entry.pack(fill="x")
 
-root.mainloop()
+    run_button = ttk.Button(main_frame, text="Run Benchmark", command=run_sort)
+    run_button.pack(pady=(15, 5))
+
+    single_progress = ttk.Progressbar(main_frame, maximum=100)
+    single_progress.pack(fill="x", pady=(0, 10))
+
+    result_text = tk.StringVar()
+    result_label = ttk.Label(
+        main_frame,
+        textvariable=result_text,
+        justify="left",
+        wraplength=560
+    )
+    result_label.pack(pady=10)
+
+    # Size sweep tab
+    sweep_frame = ttk.Frame(notebook, padding=10)
+    notebook.add(sweep_frame, text="Size Sweep")
+
+    controls = ttk.Frame(sweep_frame)
+    controls.pack(fill="x")
+
+    sweep_vars = {}
+    for index, name in enumerate(ALGORITHMS):
+        sweep_vars[name] = tk.BooleanVar(value=True)
+        row, column = divmod(index, SWEEP_CHECKBOXES_PER_ROW)
+        ttk.Checkbutton(controls, text=name, variable=sweep_vars[name],
+                        command=draw_chart).grid(row=row, column=column, sticky="w", padx=(0, 10))
+
+    options = ttk.Frame(sweep_frame)
+    options.pack(fill="x", pady=8)
+
+    ttk.Label(options, text="Sizes:").pack(side="left")
+    sizes_entry = ttk.Entry(options, width=32)
+    sizes_entry.pack(side="left", padx=(5, 10))
+    sizes_entry.insert(0, "250, 500, 1000, 2000, 4000")
+
+    ttk.Label(options, text="Seed:").pack(side="left")
+    seed_entry = ttk.Entry(options, width=8)
+    seed_entry.pack(side="left", padx=(5, 10))
+    seed_entry.insert(0, "42")
+
+    sweep_button = ttk.Button(options, text="Run Sweep", command=run_sweep)
+    sweep_button.pack(side="left")
+    ttk.Button(options, text="Clear Cache", command=clear_cache).pack(side="left", padx=5)
+
+    chart = tk.Canvas(sweep_frame, width=CHART_WIDTH, height=CHART_HEIGHT, background="white")
+    chart.pack()
+
+    fit_text = tk.StringVar()
+    ttk.Label(sweep_frame, textvariable=fit_text, justify="left").pack(anchor="w", pady=5)
+
+    # Race tab
+    race_frame = ttk.Frame(notebook, padding=20)
+    notebook.add(race_frame, text="Race")
+
+    ttk.Label(
+        race_frame,
+        text="All algorithms sort identical copies of one seeded dataset at the same time.",
+        wraplength=560
+    ).pack(anchor="w")
+
+    race_options = ttk.Frame(race_frame)
+    race_options.pack(fill="x", pady=10)
+
+    ttk.Label(race_options, text="Dataset Size:").pack(side="left")
+    race_size_entry = ttk.Entry(race_options, width=10)
+    race_size_entry.pack(side="left", padx=(5, 10))
+    race_size_entry.insert(0, "5000")
+
+    ttk.Label(race_options, text="Seed:").pack(side="left")
+    race_seed_entry = ttk.Entry(race_options, width=8)
+    race_seed_entry.pack(side="left", padx=(5, 10))
+    race_seed_entry.insert(0, "42")
+
+    race_button = ttk.Button(race_options, text="Start Race", command=run_race)
+    race_button.pack(side="left")
+
+    race_bars = {}
+    race_labels = {}
+    for name in ALGORITHMS:
+        lane = ttk.Frame(race_frame)
+        lane.pack(fill="x", pady=6)
+        ttk.Label(lane, text=name, width=24).pack(side="left")
+        race_bars[name] = ttk.Progressbar(lane, length=300, maximum=100)
+        race_bars[name].pack(side="left", padx=5)
+        race_labels[name] = tk.StringVar()
+        ttk.Label(lane, textvariable=race_labels[name]).pack(side="left")
+
+    # Visualize tab
+    vis_frame = ttk.Frame(notebook, padding=10)
+    notebook.add(vis_frame, text="Visualize")
+
+    vis_options = ttk.Frame(vis_frame)
+    vis_options.pack(fill="x")
+
+    vis_algorithm_var = tk.StringVar(value="Bubble Sort")
+    ttk.Combobox(
+        vis_options,
+        textvariable=vis_algorithm_var,
+        state="readonly",
+        values=list(RECORDERS),
+        width=14
+    ).pack(side="left")
+
+    ttk.Label(vis_options, text="Size:").pack(side="left", padx=(10, 0))
+    vis_size_entry = ttk.Entry(vis_options, width=8)
+    vis_size_entry.pack(side="left", padx=5)
+    vis_size_entry.insert(0, "300")
+
+    ttk.Label(vis_options, text="Seed:").pack(side="left")
+    vis_seed_entry = ttk.Entry(vis_options, width=6)
+    vis_seed_entry.pack(side="left", padx=5)
+    vis_seed_entry.insert(0, "42")
+
+    record_button = ttk.Button(vis_options, text="Record & Play", command=run_visualize)
+    record_button.pack(side="left", padx=5)
+
+    playback_options = ttk.Frame(vis_frame)
+    playback_options.pack(fill="x", pady=8)
+
+    ttk.Label(playback_options, text="Playback length (s):").pack(side="left")
+    playback_seconds_var = tk.IntVar(value=15)
+    ttk.Spinbox(playback_options, from_=1, to=300, textvariable=playback_seconds_var,
+                width=5).pack(side="left", padx=5)
+
+    pause_button = ttk.Button(playback_options, text="Pause", command=toggle_pause)
+    pause_button.pack(side="left", padx=5)
+    pause_button.state(["disabled"])
+
+    replay_button = ttk.Button(playback_options, text="Replay", command=replay)
+    replay_button.pack(side="left")
+    replay_button.state(["disabled"])
+
+    vis_canvas = tk.Canvas(vis_frame, width=VIS_WIDTH, height=VIS_HEIGHT, background="white")
+    vis_canvas.pack()
+
+    vis_status_text = tk.StringVar()
+    ttk.Label(vis_frame, textvariable=vis_status_text).pack(anchor="w", pady=5)
+
+    # Shared status bar
+    status_frame = ttk.Frame(root, padding=(10, 5))
+    status_frame.pack(fill="x")
+
+    status_text = tk.StringVar(value="Ready")
+    status_label = ttk.Label(status_frame, textvariable=status_text, foreground="gray")
+    status_label.pack(side="left")
+
+    cancel_button = ttk.Button(status_frame, text="Cancel", command=cancel_sort)
+    cancel_button.pack(side="right")
+    cancel_button.state(["disabled"])
+
+    draw_chart()
+    root.mainloop()
@@ -0,0 +1,37 @@
+"""
+Shared sorting utilities for the benchmark tools in this repository.
+
+The front ends (PRELIM-EXAM-LAB, PRELIM-LAB-WORK-1, PRELIM-LAB-WORK-2) add
+the repository root to sys.path and import from here.
+"""
+
+from .algorithms import SortObserver, SortStats
+from .registry import (
+    SortAlgorithmInfo,
+    algorithm_names,
+    available_algorithms,
+    get_algorithm,
+    load_plugins,
+    register,
+)
+from .verification import (
+    VerificationResult,
+    is_ordered,
+    multiset_fingerprint,
+    verify_sort,
+)
+
+__all__ = [
+    "SortAlgorithmInfo",
+    "SortObserver",
+    "SortStats",
+    "VerificationResult",
+    "algorithm_names",
+    "available_algorithms",
+    "get_algorithm",
+    "is_ordered",
+    "load_plugins",
+    "multiset_fingerprint",
+    "register",
+    "verify_sort",
+]
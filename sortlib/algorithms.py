@@ -0,0 +1,299 @@
+"""
+Bubble, insertion and merge sort, each in two variants.
+
+- Plain variants sort in place at full speed: ascending, no key and no
+  counters. The only hook is an optional progress(fraction) callback,
+  called at most once per outer pass or PROGRESS_STEP items.
+- Instrumented variants support key and reverse and count comparisons and
+  swaps into a SortStats. An optional SortObserver is called before every
+  outer step (bubble pass, inserted item, merge width). It can report
+  progress, checkpoint the data, or stop the sort, and it can resume a sort
+  from a saved position.
+
+Plain variants given a key or reverse=True run the instrumented code
+without an observer. All three sorts are stable in both orders.
+
+Keys are computed once into a parallel list, and every move is applied to
+both lists. Without a key the two lists are the same object; the moves are
+written so that doing them twice is harmless.
+"""
+
+import math
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+PROGRESS_STEP = 256  # Insertion sort reports progress every this many items
+
+Progress = Optional[Callable[[float], None]]
+KeyFunc = Optional[Callable[[Any], Any]]
+
+
+@dataclass
+class SortStats:
+    """Counters filled in by the instrumented sorts."""
+    comparisons: int = 0
+    swaps: int = 0  # Element moves: swaps, insertion shifts or merge writes
+    passes: int = 0
+    completed: bool = True
+    # Position to resume from when an observer stopped the sort
+    stopped_at: Optional[int] = None
+
+    def as_dict(self) -> dict:
+        return {'comparisons': self.comparisons, 'swaps': self.swaps, 'passes': self.passes}
+
+
+class SortObserver:
+    """
+    Hooks called by the instrumented sorts; override the ones needed.
+
+    Positions are the bubble sort pass index, the insertion sort index of
+    the next item to insert, or the merge sort run width. All data before
+    a position is fully processed, so a sort can stop there and resume later.
+    """
+
+    def start_position(self, default: int) -> int:
+        """Position to start from; return a saved one to resume."""
+        return default
+
+    def step(self, data: List[Any], position: int, fraction: float) -> bool:
+        """
+        Called before each outer step with the estimated fraction of work
+        done. Return False to stop the sort at this position.
+        """
+        return True
+
+
+def _start(observer: Optional[SortObserver], default: int) -> int:
+    return default if observer is None else observer.start_position(default)
+
+
+# -------------------------------
+# Bubble Sort
+# -------------------------------
+
+def bubble_sort(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                progress: Progress = None) -> None:
+    """Bubble sort with early exit on a pass without swaps. O(n²)."""
+    if key is not None or reverse:
+        bubble_sort_instrumented(data, key, reverse)
+        return
+
+    n = len(data)
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            if data[j] > data[j + 1]:
+                data[j], data[j + 1] = data[j + 1], data[j]
+                swapped = True
+        if progress is not None:
+            # Passes get shorter, so the work done is 1 - (remaining / n)²
+            progress(1 - ((n - i - 1) / n) ** 2)
+        if not swapped:
+            break
+
+
+def bubble_sort_instrumented(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                             stats: Optional[SortStats] = None,
+                             observer: Optional[SortObserver] = None) -> SortStats:
+    """Bubble sort counting comparisons, swaps and passes."""
+    stats = SortStats() if stats is None else stats
+    keys = data if key is None else list(map(key, data))
+    before = operator.gt if reverse else operator.lt
+    n = len(data)
+    comparisons = swaps = 0
+
+    for i in range(_start(observer, 0), n):
+        if observer is not None and not observer.step(data, i, 1 - ((n - i) / n) ** 2):
+            stats.completed = False
+            stats.stopped_at = i
+            break
+        stats.passes += 1
+        swapped = False
+        for j in range(n - i - 1):
+            comparisons += 1
+            if before(keys[j + 1], keys[j]):
+                # Read both items before writing, so that when keys is data
+                # the second pair of writes repeats the first
+                a, b = data[j], data[j + 1]
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                data[j], data[j + 1] = b, a
+                swaps += 1
+                swapped = True
+        stats.comparisons += comparisons
+        stats.swaps += swaps
+        comparisons = swaps = 0
+        if not swapped:
+            break
+    return stats
+
+
+# -------------------------------
+# Insertion Sort
+# -------------------------------
+
+def insertion_sort(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                   progress: Progress = None) -> None:
+    """Insertion sort by shifting larger items right. O(n²), O(n) if sorted."""
+    if key is not None or reverse:
+        insertion_sort_instrumented(data, key, reverse)
+        return
+
+    n = len(data)
+    for i in range(1, n):
+        item = data[i]
+        j = i - 1
+        while j >= 0 and data[j] > item:
+            data[j + 1] = data[j]
+            j -= 1
+        data[j + 1] = item
+        if progress is not None and i % PROGRESS_STEP == 0:
+            # Work done grows with i², so report the quadratic fraction
+            progress((i / n) ** 2)
+
+
+def insertion_sort_instrumented(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                                stats: Optional[SortStats] = None,
+                                observer: Optional[SortObserver] = None) -> SortStats:
+    """Insertion sort counting comparisons and shifts (one pass per item)."""
+    stats = SortStats() if stats is None else stats
+    keys = data if key is None else list(map(key, data))
+    before = operator.gt if reverse else operator.lt
+    n = len(data)
+    comparisons = swaps = 0
+
+    for i in range(_start(observer, 1), n):
+        if observer is not None:
+            stats.comparisons += comparisons
+            stats.swaps += swaps
+            comparisons = swaps = 0
+            if not observer.step(data, i, (i / n) ** 2):
+                stats.completed = False
+                stats.stopped_at = i
+                break
+        stats.passes += 1
+        item_key, item = keys[i], data[i]
+        j = i - 1
+        while j >= 0:
+            comparisons += 1
+            if not before(item_key, keys[j]):
+                break
+            keys[j + 1] = keys[j]
+            data[j + 1] = data[j]
+            swaps += 1
+            j -= 1
+        keys[j + 1] = item_key
+        data[j + 1] = item
+
+    stats.comparisons += comparisons
+    stats.swaps += swaps
+    return stats
+
+
+# -------------------------------
+# Merge Sort
+# -------------------------------
+
+def merge_sort(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+               progress: Progress = None) -> None:
+    """
+    Bottom-up merge sort. O(n log n).
+
+    Runs of doubling width are merged back and forth between the list and
+    one buffer, so no slices are allocated per merge.
+    """
+    if key is not None or reverse:
+        merge_sort_instrumented(data, key, reverse)
+        return
+
+    n = len(data)
+    total_passes = max(1, math.ceil(math.log2(n))) if n > 1 else 1
+    source, target = data, list(data)
+    width = 1
+    passes = 0
+    while width < n:
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            i, j, k = left, mid, left
+            while i < mid and j < right:
+                if source[j] < source[i]:
+                    target[k] = source[j]
+                    j += 1
+                else:
+                    target[k] = source[i]
+                    i += 1
+                k += 1
+            # One side is exhausted; copy the rest of the other in one slice
+            if i < mid:
+                target[k:right] = source[i:mid]
+            else:
+                target[k:right] = source[j:right]
+        source, target = target, source
+        width *= 2
+        passes += 1
+        if progress is not None:
+            progress(passes / total_passes)
+
+    if source is not data:
+        data[:] = source
+
+
+def merge_sort_instrumented(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                            stats: Optional[SortStats] = None,
+                            observer: Optional[SortObserver] = None) -> SortStats:
+    """
+    Bottom-up merge sort counting comparisons and writes.
+
+    Each merge writes back into data, so data is a valid arrangement at
+    every observer step and can be checkpointed.
+    """
+    stats = SortStats() if stats is None else stats
+    keys = data if key is None else list(map(key, data))
+    before = operator.gt if reverse else operator.lt
+    n = len(data)
+    total_passes = max(1, math.ceil(math.log2(n))) if n > 1 else 1
+    comparisons = swaps = 0
+
+    width = _start(observer, 1)
+    while width < n:
+        if observer is not None and not observer.step(data, width, (width.bit_length() - 1) / total_passes):
+            stats.completed = False
+            stats.stopped_at = width
+            break
+        stats.passes += 1
+        for left in range(0, n - width, 2 * width):
+            mid = left + width
+            right = min(left + 2 * width, n)
+            left_keys, right_keys = keys[left:mid], keys[mid:right]
+            left_items, right_items = data[left:mid], data[mid:right]
+            n1, n2 = mid - left, right - mid
+            i = j = 0
+            k = left
+            while i < n1 and j < n2:
+                comparisons += 1
+                if before(right_keys[j], left_keys[i]):
+                    keys[k] = right_keys[j]
+                    data[k] = right_items[j]
+                    j += 1
+                else:
+                    keys[k] = left_keys[i]
+                    data[k] = left_items[i]
+                    i += 1
+                k += 1
+            while i < n1:
+                keys[k] = left_keys[i]
+                data[k] = left_items[i]
+                i += 1
+                k += 1
+            while j < n2:
+                keys[k] = right_keys[j]
+                data[k] = right_items[j]
+                j += 1
+                k += 1
+            swaps += right - left
+        stats.comparisons += comparisons
+        stats.swaps += swaps
+        comparisons = swaps = 0
+        width *= 2
+    return stats
@@ -0,0 +1,244 @@
+"""
+Bubble sort variants: last-swap bound, cocktail shaker, comb and odd-even.
+
+Each has an instrumented implementation with the same signature as the
+ones in algorithms.py (key, reverse, SortStats, SortObserver). The plain
+variants run it with an observer that forwards the fraction to progress;
+the variants exist to be compared, so there is no separate fast path.
+
+Observer positions are pass numbers. Exchange sorts make progress from
+any arrangement, so start_position is not consulted: a stopped sort is
+resumed by running it again on the data it left behind.
+
+The last-swap, cocktail and odd-even sorts only swap adjacent items that
+are strictly out of order and are stable; comb sort is not.
+"""
+
+import math
+import operator
+from typing import Any, List, Optional
+
+from .algorithms import KeyFunc, Progress, SortObserver, SortStats
+
+COMB_SHRINK_FACTOR = 1.3  # Gap shrink factor for comb sort
+
+
+class _ProgressObserver(SortObserver):
+    """Forwards each step's fraction to a plain progress(fraction) callback."""
+
+    def __init__(self, progress: Progress):
+        self.progress = progress
+
+    def step(self, data: List[Any], position: int, fraction: float) -> bool:
+        self.progress(fraction)
+        return True
+
+
+def _observer(progress: Progress) -> Optional[SortObserver]:
+    return None if progress is None else _ProgressObserver(progress)
+
+
+def _stop(stats: SortStats, position: int) -> SortStats:
+    stats.completed = False
+    stats.stopped_at = position
+    return stats
+
+
+# -------------------------------
+# Bubble Sort (last-swap bound)
+# -------------------------------
+
+def last_swap_bubble_sort(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                          progress: Progress = None) -> None:
+    """Bubble sort bounding each pass by the last swap. O(n²)."""
+    last_swap_bubble_sort_instrumented(data, key, reverse, observer=_observer(progress))
+
+
+def last_swap_bubble_sort_instrumented(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                                       stats: Optional[SortStats] = None,
+                                       observer: Optional[SortObserver] = None) -> SortStats:
+    """
+    Bubble sort whose next pass stops at the last swap of the previous one.
+
+    Everything after the last swap of a pass is already in its final place,
+    so the range can shrink by more than one item per pass.
+    """
+    stats = SortStats() if stats is None else stats
+    keys = data if key is None else list(map(key, data))
+    before = operator.gt if reverse else operator.lt
+    n = len(data)
+    bound = n - 1
+
+    while bound > 0:
+        if observer is not None and not observer.step(data, stats.passes, 1 - (bound / n) ** 2):
+            return _stop(stats, stats.passes)
+        stats.passes += 1
+        last_swap = 0
+        for j in range(bound):
+            stats.comparisons += 1
+            if before(keys[j + 1], keys[j]):
+                a, b = data[j], data[j + 1]
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                data[j], data[j + 1] = b, a
+                stats.swaps += 1
+                last_swap = j
+        bound = last_swap
+    return stats
+
+
+# -------------------------------
+# Cocktail Shaker Sort
+# -------------------------------
+
+def cocktail_shaker_sort(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                         progress: Progress = None) -> None:
+    """Bidirectional bubble sort with last-swap bounds on both ends. O(n²)."""
+    cocktail_shaker_sort_instrumented(data, key, reverse, observer=_observer(progress))
+
+
+def cocktail_shaker_sort_instrumented(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                                      stats: Optional[SortStats] = None,
+                                      observer: Optional[SortObserver] = None) -> SortStats:
+    """
+    Cocktail shaker sort counting comparisons, swaps and passes.
+
+    Alternating forward and backward passes moves small items ("turtles")
+    to the front quickly, which plain bubble sort only does one step per
+    pass. Each direction counts as one pass.
+    """
+    stats = SortStats() if stats is None else stats
+    keys = data if key is None else list(map(key, data))
+    before = operator.gt if reverse else operator.lt
+    n = len(data)
+    start, end = 0, n - 1
+
+    while start < end:
+        if observer is not None and not observer.step(data, stats.passes, 1 - ((end - start) / n) ** 2):
+            return _stop(stats, stats.passes)
+
+        # Forward pass carries the last remaining item to `end`
+        stats.passes += 1
+        last_swap = start
+        for j in range(start, end):
+            stats.comparisons += 1
+            if before(keys[j + 1], keys[j]):
+                a, b = data[j], data[j + 1]
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                data[j], data[j + 1] = b, a
+                stats.swaps += 1
+                last_swap = j
+        end = last_swap
+        if start >= end:
+            break
+
+        # Backward pass carries the first remaining item to `start`
+        stats.passes += 1
+        last_swap = end
+        for j in range(end, start, -1):
+            stats.comparisons += 1
+            if before(keys[j], keys[j - 1]):
+                a, b = data[j - 1], data[j]
+                keys[j - 1], keys[j] = keys[j], keys[j - 1]
+                data[j - 1], data[j] = b, a
+                stats.swaps += 1
+                last_swap = j
+        start = last_swap
+    return stats
+
+
+# -------------------------------
+# Comb Sort
+# -------------------------------
+
+def comb_sort(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+              progress: Progress = None) -> None:
+    """Bubble sort over a shrinking gap sequence. About O(n log n) in practice."""
+    comb_sort_instrumented(data, key, reverse, observer=_observer(progress))
+
+
+def comb_sort_instrumented(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                           stats: Optional[SortStats] = None,
+                           observer: Optional[SortObserver] = None,
+                           shrink: float = COMB_SHRINK_FACTOR) -> SortStats:
+    """
+    Comb sort counting comparisons, swaps and passes.
+
+    The gap starts at n and is divided by `shrink` every pass (with the
+    "rule of 11": gaps of 9 or 10 become 11). Once the gap reaches 1 it
+    behaves like bubble sort with early exit on a swap-free pass.
+    """
+    stats = SortStats() if stats is None else stats
+    keys = data if key is None else list(map(key, data))
+    before = operator.gt if reverse else operator.lt
+    n = len(data)
+    # Passes until the gap reaches 1, plus a couple of gap-1 passes
+    expected_passes = math.log(n) / math.log(shrink) + 2 if n > 1 else 1
+    gap = n
+    swapped = True
+
+    while gap > 1 or swapped:
+        if observer is not None and not observer.step(
+                data, stats.passes, min(0.99, stats.passes / expected_passes)):
+            return _stop(stats, stats.passes)
+        gap = max(1, int(gap / shrink))
+        if gap in (9, 10):
+            gap = 11
+
+        stats.passes += 1
+        swapped = False
+        for j in range(n - gap):
+            stats.comparisons += 1
+            if before(keys[j + gap], keys[j]):
+                a, b = data[j], data[j + gap]
+                keys[j], keys[j + gap] = keys[j + gap], keys[j]
+                data[j], data[j + gap] = b, a
+                stats.swaps += 1
+                swapped = True
+    return stats
+
+
+# -------------------------------
+# Odd-Even Transposition Sort
+# -------------------------------
+
+def odd_even_sort(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                  progress: Progress = None) -> None:
+    """Odd-even transposition sort. O(n²)."""
+    odd_even_sort_instrumented(data, key, reverse, observer=_observer(progress))
+
+
+def odd_even_sort_instrumented(data: List[Any], key: KeyFunc = None, reverse: bool = False,
+                               stats: Optional[SortStats] = None,
+                               observer: Optional[SortObserver] = None) -> SortStats:
+    """
+    Odd-even transposition sort counting comparisons, swaps and phases.
+
+    Alternates between comparing (odd, even) and (even, odd) index pairs.
+    The pairs within a phase are independent of each other (the parallel
+    formulation of bubble sort). Each phase counts as one pass; the sort
+    stops after an odd and an even phase in a row make no swaps.
+    """
+    stats = SortStats() if stats is None else stats
+    keys = data if key is None else list(map(key, data))
+    before = operator.gt if reverse else operator.lt
+    n = len(data)
+    quiet_phases = 0
+    phase = 1
+
+    while quiet_phases < 2 and n > 1:
+        # At most n phases are needed
+        if observer is not None and not observer.step(data, stats.passes, min(1.0, stats.passes / n)):
+            return _stop(stats, stats.passes)
+        stats.passes += 1
+        swapped = False
+        for j in range(phase, n - 1, 2):
+            stats.comparisons += 1
+            if before(keys[j + 1], keys[j]):
+                a, b = data[j], data[j + 1]
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                data[j], data[j + 1] = b, a
+                stats.swaps += 1
+                swapped = True
+        quiet_phases = 0 if swapped else quiet_phases + 1
+        phase = 1 - phase
+    return stats
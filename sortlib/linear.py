@@ -0,0 +1,228 @@
+"""
+Counting sort and LSD radix sort for integers.
+
+Neither sort compares items, so neither takes a key (supports_key is
+False in the registry) and the instrumented variants count passes and
+item writes only. counting_sorted() and radix_sorted() return a new list
+and accept a known minimum and maximum plus a unique flag, for callers
+that already scanned the data; the registry variants sort in place.
+
+An observer is called before each pass. The sorted result is only copied
+into data at the end, so a stopped sort leaves data unchanged and its
+position is always 0.
+
+A count list is only allocated when the value range fits
+counting_range_fits(). counting_sorted() refuses wider ranges; the
+registry counting sort hands them to radix sort.
+"""
+
+from collections import Counter
+from itertools import chain, compress, repeat
+from typing import List, Optional
+
+from .algorithms import KeyFunc, Progress, SortObserver, SortStats
+
+RADIX_BITS = 16  # Bits per LSD radix digit (65,536 buckets per pass)
+COUNTING_RANGE_FACTOR = 4  # Counting sort takes ranges up to factor * n values
+COUNTER_MIN_REPEATS = 128  # Tally with Counter when values repeat this often on average
+
+
+def _require_no_key(key: KeyFunc, label: str) -> None:
+    if key is not None:
+        raise ValueError(f"{label} sorts integers directly and does not take a key")
+
+
+def radix_digits(lo: int, hi: int) -> int:
+    """Number of RADIX_BITS-wide digits needed for values in [lo, hi]."""
+    return max(1, -(-(hi - lo).bit_length() // RADIX_BITS))
+
+
+def counting_range_limit(n: int) -> int:
+    """Widest value range counting sort accepts for n values (never below one radix digit)."""
+    return max(COUNTING_RANGE_FACTOR * n, 1 << RADIX_BITS)
+
+
+def counting_range_fits(n: int, lo: int, hi: int) -> bool:
+    """True if n values in [lo, hi] are cheap enough to sort with a count list."""
+    return hi - lo + 1 <= counting_range_limit(n)
+
+
+def counting_sorted(values: List[int], reverse: bool = False, unique: bool = False,
+                    lo: Optional[int] = None, hi: Optional[int] = None) -> List[int]:
+    """
+    Counting sort for integers in a small range (O(n + range)).
+
+    Args:
+        values: Integers to sort (left unchanged)
+        reverse: Sort in descending order
+        unique: Emit each value once (duplicate removal in the same pass)
+        lo, hi: Known minimum and maximum, to skip recomputing them
+
+    Returns:
+        New sorted list
+
+    Raises:
+        ValueError: If the range is wider than counting_range_limit(n)
+    """
+    if not values:
+        return []
+    if lo is None or hi is None:
+        lo, hi = min(values), max(values)
+    size = hi - lo + 1
+    if not counting_range_fits(len(values), lo, hi):
+        raise ValueError(
+            f"Value range {lo}..{hi} spans {size:,} values, too wide for counting sort "
+            f"of {len(values):,} numbers (limit {counting_range_limit(len(values)):,}); "
+            f"use radix sort")
+
+    counts = [0] * size
+    if size * COUNTER_MIN_REPEATS <= len(values):
+        # Counter tallies at C level; only the distinct values are then
+        # visited in Python. With few repeats per value the dict costs
+        # more than it saves, so the plain loop is used there.
+        for value, count in Counter(values).items():
+            counts[value - lo] = count
+    else:
+        for value in values:
+            counts[value - lo] += 1
+
+    # Emit from the counts at C level: each present value once, or repeated
+    ordered = range(lo, hi + 1)
+    if reverse:
+        ordered, counts = reversed(ordered), reversed(counts)
+    if unique:
+        return list(compress(ordered, counts))
+    return list(chain.from_iterable(map(repeat, ordered, counts)))
+
+
+def radix_sorted(values: List[int], reverse: bool = False, unique: bool = False,
+                 lo: Optional[int] = None, hi: Optional[int] = None,
+                 progress: Progress = None) -> List[int]:
+    """
+    LSD radix sort (O(n * digits)).
+
+    Values are offset by the minimum so negatives sort correctly, and only
+    as many RADIX_BITS-wide digits as the range needs are processed.
+
+    Args:
+        values: Integers to sort (left unchanged)
+        reverse: Sort in descending order
+        unique: Drop duplicates while scattering the final pass
+        lo, hi: Known minimum and maximum, to skip recomputing them
+        progress: Called with the fraction of digit passes done
+
+    Returns:
+        New sorted list
+    """
+    if not values:
+        return []
+    if lo is None or hi is None:
+        lo, hi = min(values), max(values)
+
+    mask = (1 << RADIX_BITS) - 1
+    digits = radix_digits(lo, hi)
+    result = list(values)
+    for digit in range(digits):
+        shift = digit * RADIX_BITS
+        buckets = [[] for _ in range(mask + 1)]
+        if unique and digit == digits - 1:
+            # Earlier passes ordered each bucket's values by their lower
+            # digits, so equal values arrive back to back and repeats can
+            # be skipped as they are scattered
+            for value in result:
+                bucket = buckets[(value - lo) >> shift & mask]
+                if not bucket or bucket[-1] != value:
+                    bucket.append(value)
+        else:
+            appends = [bucket.append for bucket in buckets]
+            for value in result:
+                appends[(value - lo) >> shift & mask](value)
+        result = list(chain.from_iterable(buckets))
+        if progress is not None:
+            progress((digit + 1) / digits)
+
+    if reverse:
+        result.reverse()
+    return result
+
+
+# -------------------------------
+# Counting Sort
+# -------------------------------
+
+def counting_sort(data: List[int], key: KeyFunc = None, reverse: bool = False,
+                  progress: Progress = None) -> None:
+    """Counting sort in place. O(n + range); ranges that do not fit use radix sort."""
+    _require_no_key(key, 'Counting sort')
+    if data and not counting_range_fits(len(data), min(data), max(data)):
+        radix_sort(data, reverse=reverse, progress=progress)
+        return
+    data[:] = counting_sorted(data, reverse)
+    if progress is not None:
+        progress(1.0)
+
+
+def counting_sort_instrumented(data: List[int], key: KeyFunc = None, reverse: bool = False,
+                               stats: Optional[SortStats] = None,
+                               observer: Optional[SortObserver] = None) -> SortStats:
+    """
+    Counting sort recording its two passes (count, emit) and n writes.
+    Ranges that do not fit are sorted by radix_sort_instrumented().
+    """
+    _require_no_key(key, 'Counting sort')
+    if data and not counting_range_fits(len(data), min(data), max(data)):
+        return radix_sort_instrumented(data, reverse=reverse, stats=stats, observer=observer)
+    stats = SortStats() if stats is None else stats
+    if observer is not None and not observer.step(data, 0, 0.0):
+        stats.completed = False
+        stats.stopped_at = 0
+        return stats
+    data[:] = counting_sorted(data, reverse)
+    stats.passes += 2 if data else 0
+    stats.swaps += len(data)
+    return stats
+
+
+# -------------------------------
+# Radix Sort
+# -------------------------------
+
+def radix_sort(data: List[int], key: KeyFunc = None, reverse: bool = False,
+               progress: Progress = None) -> None:
+    """LSD radix sort in place. O(n * digits)."""
+    _require_no_key(key, 'Radix sort')
+    data[:] = radix_sorted(data, reverse, progress=progress)
+
+
+class _StopRadix(Exception):
+    """Raised from the progress hook when the observer stops the sort."""
+
+
+def radix_sort_instrumented(data: List[int], key: KeyFunc = None, reverse: bool = False,
+                            stats: Optional[SortStats] = None,
+                            observer: Optional[SortObserver] = None) -> SortStats:
+    """LSD radix sort recording one pass and n writes per digit."""
+    _require_no_key(key, 'Radix sort')
+    stats = SortStats() if stats is None else stats
+    if not data:
+        return stats
+    lo, hi = min(data), max(data)
+    digits = radix_digits(lo, hi)
+
+    def step(fraction: float) -> None:
+        if fraction < 1.0 and not observer.step(data, 0, fraction):
+            raise _StopRadix
+
+    try:
+        if observer is not None:
+            step(0.0)
+        result = radix_sorted(data, reverse, lo=lo, hi=hi,
+                              progress=None if observer is None else step)
+    except _StopRadix:
+        stats.completed = False
+        stats.stopped_at = 0
+        return stats
+    data[:] = result
+    stats.passes += digits
+    stats.swaps += digits * len(data)
+    return stats
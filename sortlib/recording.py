@@ -0,0 +1,114 @@
+"""
+Recorded variants of the registry sorts, for replaying a sort visually.
+
+Each operation is appended to an array('q') event log as one packed
+integer, op | a << 2 | b << 32:
+
+- compare and swap carry two indices
+- write carries an index and the value written, so recorded data must be
+  integers that fit in 32 bits
+- move (insertion sort) takes the item at a and inserts it at b
+
+One append per event, and one move per insertion instead of one per shift,
+keep recording close to the plain sorts' speed. Compares are optional
+because they dominate the log without changing the data. The log size is
+only checked once per outer pass or merge, and EventLogFull is raised once
+it passes max_events; the list is then partially sorted.
+"""
+
+from array import array
+from typing import Any, List, Tuple
+
+OP_COMPARE = 0
+OP_SWAP = 1
+OP_WRITE = 2
+OP_MOVE = 3
+INDEX_MASK = (1 << 30) - 1
+MAX_EVENTS = 5_000_000  # 40 MB of log
+
+
+class EventLogFull(Exception):
+    """The event log reached its size limit before the sort finished."""
+
+
+def decode_event(event: int) -> Tuple[int, int, int]:
+    """Unpack an event into (op, a, b)."""
+    return event & 3, (event >> 2) & INDEX_MASK, event >> 32
+
+
+def record_bubble_sort(data: List[Any], log: array, compares: bool = True,
+                       max_events: int = MAX_EVENTS) -> None:
+    record = log.append
+    n = len(data)
+    for i in range(n):
+        if len(log) > max_events:
+            raise EventLogFull
+        swapped = False
+        for j in range(0, n - i - 1):
+            if compares:
+                record(OP_COMPARE | j << 2 | (j + 1) << 32)
+            if data[j] > data[j + 1]:
+                data[j], data[j + 1] = data[j + 1], data[j]
+                record(OP_SWAP | j << 2 | (j + 1) << 32)
+                swapped = True
+        if not swapped:
+            break
+
+
+def record_insertion_sort(data: List[Any], log: array, compares: bool = True,
+                          max_events: int = MAX_EVENTS) -> None:
+    record = log.append
+    for i in range(1, len(data)):
+        if len(log) > max_events:
+            raise EventLogFull
+        item = data[i]
+        j = i - 1
+        if compares:
+            while j >= 0:
+                record(OP_COMPARE | j << 2 | i << 32)
+                if data[j] <= item:
+                    break
+                data[j + 1] = data[j]
+                j -= 1
+        else:
+            while j >= 0 and data[j] > item:
+                data[j + 1] = data[j]
+                j -= 1
+        data[j + 1] = item
+        if j + 1 != i:
+            record(OP_MOVE | i << 2 | (j + 1) << 32)
+
+
+def record_merge_sort(data: List[Any], log: array, compares: bool = True,
+                      max_events: int = MAX_EVENTS) -> None:
+    """Bottom-up merge sort recording one write per element merged."""
+    record = log.append
+    n = len(data)
+    width = 1
+    while width < n:
+        for left in range(0, n - width, 2 * width):
+            if len(log) > max_events:
+                raise EventLogFull
+            mid = left + width
+            right = min(left + 2 * width, n)
+            left_run, right_run = data[left:mid], data[mid:right]
+            n1, n2 = mid - left, right - mid
+            i = j = 0
+            k = left
+            while i < n1 and j < n2:
+                if compares:
+                    record(OP_COMPARE | k << 2 | (mid + j) << 32)
+                if right_run[j] < left_run[i]:
+                    data[k] = right_run[j]
+                    j += 1
+                else:
+                    data[k] = left_run[i]
+                    i += 1
+                record(OP_WRITE | k << 2 | data[k] << 32)
+                k += 1
+            rest = left_run[i:] if i < n1 else right_run[j:]
+            for value in rest:
+                data[k] = value
+                record(OP_WRITE | k << 2 | value << 32)
+                k += 1
+        width *= 2
@@ -0,0 +1,227 @@
+"""
+Registry of the sorting algorithms shared by the benchmark tools.
+
+Each algorithm is described once by a SortAlgorithmInfo: its name and
+display label, complexity, stability, whether it accepts a key, and its
+plain, instrumented and (optionally) recorded implementations. Front ends
+look algorithms up by name and use available_algorithms() to build menus
+and benchmark matrices, so a newly registered algorithm shows up in every
+tool.
+
+Plugins are modules that call register() on import. Modules listed in the
+SORTLIB_PLUGINS environment variable (comma-separated) are imported by
+load_plugins(), which the front ends call at startup.
+"""
+
+import importlib
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+from . import algorithms, exchange, linear, recording
+
+PLUGINS_ENV_VAR = 'SORTLIB_PLUGINS'
+
+
+@dataclass(frozen=True)
+class SortAlgorithmInfo:
+    """Description and implementations of one registered algorithm."""
+    name: str                   # Registry key, e.g. 'bubble'
+    label: str                  # Display name, e.g. 'Bubble Sort'
+    best: str                   # Time complexity: best, average and worst case
+    average: str
+    worst: str
+    space: str                  # Auxiliary space
+    stable: bool
+    supports_key: bool
+    sort: Callable              # sort(data, key=None, reverse=False, progress=None)
+    instrumented: Callable      # sort(data, key=None, reverse=False, stats=None, observer=None)
+    recorder: Optional[Callable] = None  # record(data, log, compares=True)
+    description: str = ''
+
+    @property
+    def quadratic(self) -> bool:
+        """True for algorithms that are O(n²) on average."""
+        return self.average == 'O(n²)'
+
+
+_registry: Dict[str, SortAlgorithmInfo] = {}
+_loaded_plugins = set()
+
+
+def register(info: SortAlgorithmInfo, replace: bool = False) -> SortAlgorithmInfo:
+    """
+    Add an algorithm to the registry.
+
+    Raises:
+        ValueError: If the name is taken and replace is False
+    """
+    if info.name in _registry and not replace:
+        raise ValueError(f"Sorting algorithm '{info.name}' is already registered")
+    _registry[info.name] = info
+    return info
+
+
+def get_algorithm(name: str) -> SortAlgorithmInfo:
+    """
+    Look up an algorithm by name or display label.
+
+    Raises:
+        KeyError: If no such algorithm is registered
+    """
+    if name in _registry:
+        return _registry[name]
+    for info in _registry.values():
+        if info.label == name:
+            return info
+    raise KeyError(f"Unknown sorting algorithm '{name}' (available: {', '.join(_registry)})")
+
+
+def available_algorithms(stable: Optional[bool] = None, supports_key: Optional[bool] = None,
+                         quadratic: Optional[bool] = None,
+                         recordable: Optional[bool] = None) -> List[SortAlgorithmInfo]:
+    """Registered algorithms in registration order, optionally filtered."""
+    selected = []
+    for info in _registry.values():
+        if stable is not None and info.stable != stable:
+            continue
+        if supports_key is not None and info.supports_key != supports_key:
+            continue
+        if quadratic is not None and info.quadratic != quadratic:
+            continue
+        if recordable is not None and (info.recorder is not None) != recordable:
+            continue
+        selected.append(info)
+    return selected
+
+
+def algorithm_names() -> List[str]:
+    """Names of all registered algorithms."""
+    return list(_registry)
+
+
+def load_plugins(modules: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Import plugin modules so they can register their algorithms.
+
+    Args:
+        modules: Module names; defaults to the SORTLIB_PLUGINS variable
+
+    Returns:
+        Names of the modules imported by this call
+    """
+    if modules is None:
+        modules = os.environ.get(PLUGINS_ENV_VAR, '').split(',')
+    loaded = []
+    for module in (m.strip() for m in modules):
+        if module and module not in _loaded_plugins:
+            importlib.import_module(module)
+            _loaded_plugins.add(module)
+            loaded.append(module)
+    return loaded
+
+
+register(SortAlgorithmInfo(
+    name='bubble',
+    label='Bubble Sort',
+    best='O(n)', average='O(n²)', worst='O(n²)', space='O(1)',
+    stable=True,
+    supports_key=True,
+    sort=algorithms.bubble_sort,
+    instrumented=algorithms.bubble_sort_instrumented,
+    recorder=recording.record_bubble_sort,
+    description='Repeatedly swaps adjacent items that are out of order; '
+                'stops after a pass without swaps.',
+))
+
+register(SortAlgorithmInfo(
+    name='insertion',
+    label='Insertion Sort',
+    best='O(n)', average='O(n²)', worst='O(n²)', space='O(1)',
+    stable=True,
+    supports_key=True,
+    sort=algorithms.insertion_sort,
+    instrumented=algorithms.insertion_sort_instrumented,
+    recorder=recording.record_insertion_sort,
+    description='Inserts each item into the sorted prefix by shifting larger items right.',
+))
+
+register(SortAlgorithmInfo(
+    name='merge',
+    label='Merge Sort',
+    best='O(n log n)', average='O(n log n)', worst='O(n log n)', space='O(n)',
+    stable=True,
+    supports_key=True,
+    sort=algorithms.merge_sort,
+    instrumented=algorithms.merge_sort_instrumented,
+    recorder=recording.record_merge_sort,
+    description='Bottom-up: merges sorted runs of doubling width.',
+))
+
+register(SortAlgorithmInfo(
+    name='last-swap',
+    label='Bubble Sort (Last Swap)',
+    best='O(n)', average='O(n²)', worst='O(n²)', space='O(1)',
+    stable=True,
+    supports_key=True,
+    sort=exchange.last_swap_bubble_sort,
+    instrumented=exchange.last_swap_bubble_sort_instrumented,
+    description='Bubble sort whose next pass ends at the last swap of the previous one.',
+))
+
+register(SortAlgorithmInfo(
+    name='cocktail',
+    label='Cocktail Shaker Sort',
+    best='O(n)', average='O(n²)', worst='O(n²)', space='O(1)',
+    stable=True,
+    supports_key=True,
+    sort=exchange.cocktail_shaker_sort,
+    instrumented=exchange.cocktail_shaker_sort_instrumented,
+    description='Bubble sort alternating forward and backward passes, '
+                'bounded by the last swap on both ends.',
+))
+
+register(SortAlgorithmInfo(
+    name='comb',
+    label='Comb Sort',
+    best='O(n log n)', average='O(n²/2ᵖ)', worst='O(n²)', space='O(1)',
+    stable=False,
+    supports_key=True,
+    sort=exchange.comb_sort,
+    instrumented=exchange.comb_sort_instrumented,
+    description='Bubble sort over gaps shrinking by 1.3 per pass, ending with gap-1 passes.',
+))
+
+register(SortAlgorithmInfo(
+    name='odd-even',
+    label='Odd-Even Sort',
+    best='O(n)', average='O(n²)', worst='O(n²)', space='O(1)',
+    stable=True,
+    supports_key=True,
+    sort=exchange.odd_even_sort,
+    instrumented=exchange.odd_even_sort_instrumented,
+    description='Alternates compare-exchanges of (odd, even) and (even, odd) index pairs.',
+))
+
+register(SortAlgorithmInfo(
+    name='counting',
+    label='Counting Sort',
+    best='O(n + k)', average='O(n + k)', worst='O(n + k)', space='O(n + k)',
+    stable=True,
+    supports_key=False,
+    sort=linear.counting_sort,
+    instrumented=linear.counting_sort_instrumented,
+    description='Integers only: counts each value in [min, max] (k = max - min + 1) '
+                'and emits them in order; ranges wider than max(4n, 65,536) use radix sort.',
+))
+
+register(SortAlgorithmInfo(
+    name='radix',
+    label='Radix Sort',
+    best='O(n·d)', average='O(n·d)', worst='O(n·d)', space='O(n)',
+    stable=True,
+    supports_key=False,
+    sort=linear.radix_sort,
+    instrumented=linear.radix_sort_instrumented,
+    description='Integers only: LSD radix sort on 16-bit digits (d digits for the value range).',
+))
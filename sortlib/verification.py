@@ -0,0 +1,151 @@
+"""
+Verification of sort results.
+
+A result is correct when it is ordered and is a permutation of the input.
+Both checks run in O(n) using C-level iteration:
+
+- order: one pairwise pass, all(map(operator.le, seq, seq[1:]))
+- permutation: an order-independent multiset fingerprint, i.e. the element
+  count plus the sum of every element's digest, mod 2**64. Dropped,
+  duplicated or altered elements change the fingerprint (barring a chance
+  64-bit collision); reordering does not.
+
+Digests hash a byte encoding of each value rather than the value itself:
+hash(int) is the value mod 2**61 - 1 and hash(-1) == hash(-2), so summing
+plain hashes misses e.g. a -1 replaced by -2. 64-bit ints are packed with
+struct in one C-level pass; other values get a tagged encoding.
+"""
+
+import operator
+import struct
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional, Sequence, Tuple
+
+MASK64 = (1 << 64) - 1
+INT64 = struct.Struct('<q')
+FLOAT64 = struct.Struct('<d')
+
+
+def is_ordered(values: Sequence[Any], key: Optional[Callable[[Any], Any]] = None,
+               reverse: bool = False) -> bool:
+    """Check that values are non-decreasing (non-increasing if reverse)."""
+    keys = values if key is None else list(map(key, values))
+    in_order = operator.ge if reverse else operator.le
+    return all(map(in_order, keys, islice(keys, 1, None)))
+
+
+def multiset_fingerprint(values: Iterable[Any]) -> Tuple[int, int]:
+    """
+    Order-independent fingerprint of a multiset of values.
+
+    Returns (count, digest sum mod 2**64). Bytes hashes are randomized per
+    process, so only compare fingerprints computed in the same process.
+
+    >>> multiset_fingerprint([-1, 3]) == multiset_fingerprint([3, -1])
+    True
+    >>> multiset_fingerprint([-1, 3]) == multiset_fingerprint([-2, 3])
+    False
+    """
+    count = 0
+    total = 0
+    for chunk_total, chunk_count in _hash_chunks(values):
+        total += chunk_total
+        count += chunk_count
+    return count, total & MASK64
+
+
+def _hash_chunks(values: Iterable[Any], chunk_size: int = 1 << 16):
+    # Sequences are digested in one pass; other iterables in chunks
+    if isinstance(values, Sequence):
+        yield _digest_sum(values), len(values)
+        return
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield _digest_sum(chunk), len(chunk)
+
+
+def _digest_sum(values: Sequence[Any]) -> int:
+    try:
+        # All 64-bit ints: pack and hash at C level
+        return sum(map(hash, map(INT64.pack, values)))
+    except struct.error:
+        return sum(map(_digest, values))
+
+
+def _digest(value: Any) -> int:
+    # Must agree with the packed fast path for every value it accepts
+    try:
+        return hash(INT64.pack(value))
+    except struct.error:
+        return hash(_stable_key(value))
+
+
+def _stable_key(value: Any) -> Tuple[str, Any]:
+    # Tagged so that e.g. 1, 1.0, '1' and b'1' stay distinct
+    if isinstance(value, int):
+        return 'i', value.to_bytes(value.bit_length() // 8 + 1, 'little', signed=True)
+    if isinstance(value, float):
+        return 'f', FLOAT64.pack(value)
+    if isinstance(value, str):
+        return 's', value.encode('utf-8', 'surrogatepass')
+    if isinstance(value, (bytes, bytearray)):
+        return 'b', bytes(value)
+    if isinstance(value, tuple):
+        return 't', tuple(map(_stable_key, value))
+    return 'r', repr(value).encode('utf-8', 'surrogatepass')
+
+
+@dataclass
+class VerificationResult:
+    """Outcome of verify_sort; the time is kept apart from the sort time."""
+    ordered: bool
+    permutation: bool
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.ordered and self.permutation
+
+    def __str__(self) -> str:
+        if self.ok:
+            return "SUCCESS"
+        problems = []
+        if not self.ordered:
+            problems.append("not ordered")
+        if not self.permutation:
+            problems.append("elements lost or changed")
+        return f"FAILED ({', '.join(problems)})"
+
+
+def verify_sort(result: Sequence[Any], original: Optional[Iterable[Any]] = None,
+                key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+                input_fingerprint: Optional[Tuple[int, int]] = None) -> VerificationResult:
+    """
+    Verify a sort result's order and that it is a permutation of the input.
+
+    Args:
+        result: The sorted output
+        original: The unsorted input. Not needed if input_fingerprint is given.
+        key: Sort key the result should be ordered by
+        reverse: True if the result should be descending
+        input_fingerprint: multiset_fingerprint of the input, taken before
+            an in-place sort changed it
+
+    Returns:
+        VerificationResult with both checks and the time they took (only
+        the result side is timed when a precomputed fingerprint is passed)
+
+    >>> str(verify_sort([-2, -2, 3], [-1, -2, 3]))
+    'FAILED (elements lost or changed)'
+    """
+    start_time = time.perf_counter()
+    ordered = is_ordered(result, key, reverse)
+    if input_fingerprint is None and original is not None:
+        input_fingerprint = multiset_fingerprint(original)
+    permutation = input_fingerprint is None or multiset_fingerprint(result) == input_fingerprint
+    return VerificationResult(ordered, permutation, time.perf_counter() - start_time)